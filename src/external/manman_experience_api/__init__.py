@@ -0,0 +1,50 @@
+# coding: utf-8
+
+# flake8: noqa
+
+"""
+ManMan Experience API
+
+No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+
+The version of the OpenAPI document: 0.1.0
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+__version__ = "1.0.0"
+
+# import apis into sdk package
+from external.manman_experience_api.api.default_api import DefaultApi
+
+# import ApiClient
+from external.manman_experience_api.api_response import ApiResponse
+from external.manman_experience_api.api_client import ApiClient
+from external.manman_experience_api.configuration import Configuration
+from external.manman_experience_api.exceptions import OpenApiException
+from external.manman_experience_api.exceptions import ApiTypeError
+from external.manman_experience_api.exceptions import ApiValueError
+from external.manman_experience_api.exceptions import ApiKeyError
+from external.manman_experience_api.exceptions import ApiAttributeError
+from external.manman_experience_api.exceptions import ApiException
+
+# import models into sdk package
+from external.manman_experience_api.models.current_instance_response import (
+    CurrentInstanceResponse,
+)
+from external.manman_experience_api.models.game_server_config import GameServerConfig
+from external.manman_experience_api.models.game_server_instance import (
+    GameServerInstance,
+)
+from external.manman_experience_api.models.http_validation_error import (
+    HTTPValidationError,
+)
+from external.manman_experience_api.models.stdin_command_request import (
+    StdinCommandRequest,
+)
+from external.manman_experience_api.models.validation_error import ValidationError
+from external.manman_experience_api.models.validation_error_loc_inner import (
+    ValidationErrorLocInner,
+)
+from external.manman_experience_api.models.worker import Worker
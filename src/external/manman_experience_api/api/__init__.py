@@ -0,0 +1,4 @@
+# flake8: noqa
+
+# import apis into api package
+from external.manman_experience_api.api.default_api import DefaultApi
@@ -0,0 +1,127 @@
+# coding: utf-8
+
+"""
+ManMan Experience API
+
+No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+
+The version of the OpenAPI document: 0.1.0
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from __future__ import annotations
+import pprint
+import re  # noqa: F401
+import json
+
+from pydantic import BaseModel, ConfigDict
+from typing import Any, ClassVar, Dict, List
+from external.manman_experience_api.models.game_server_config import GameServerConfig
+from external.manman_experience_api.models.game_server_instance import (
+    GameServerInstance,
+)
+from external.manman_experience_api.models.worker import Worker
+from typing import Optional, Set
+from typing_extensions import Self
+
+
+class CurrentInstanceResponse(BaseModel):
+    """
+    Response to the worker to start a game server instance.
+    """  # noqa: E501
+
+    configs: List[GameServerConfig]
+    game_server_instances: List[GameServerInstance]
+    workers: List[Worker]
+    __properties: ClassVar[List[str]] = ["configs", "game_server_instances", "workers"]
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+    )
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Optional[Self]:
+        """Create an instance of CurrentInstanceResponse from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the dictionary representation of the model using alias.
+
+        This has the following differences from calling pydantic's
+        `self.model_dump(by_alias=True)`:
+
+        * `None` is only added to the output dict for nullable fields that
+          were set at model initialization. Other fields with value `None`
+          are ignored.
+        """
+        excluded_fields: Set[str] = set([])
+
+        _dict = self.model_dump(
+            by_alias=True,
+            exclude=excluded_fields,
+            exclude_none=True,
+        )
+        # override the default output from pydantic by calling `to_dict()` of each item in configs (list)
+        _items = []
+        if self.configs:
+            for _item_configs in self.configs:
+                if _item_configs:
+                    _items.append(_item_configs.to_dict())
+            _dict["configs"] = _items
+        # override the default output from pydantic by calling `to_dict()` of each item in game_server_instances (list)
+        _items = []
+        if self.game_server_instances:
+            for _item_game_server_instances in self.game_server_instances:
+                if _item_game_server_instances:
+                    _items.append(_item_game_server_instances.to_dict())
+            _dict["game_server_instances"] = _items
+        # override the default output from pydantic by calling `to_dict()` of each item in workers (list)
+        _items = []
+        if self.workers:
+            for _item_workers in self.workers:
+                if _item_workers:
+                    _items.append(_item_workers.to_dict())
+            _dict["workers"] = _items
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
+        """Create an instance of CurrentInstanceResponse from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return cls.model_validate(obj)
+
+        _obj = cls.model_validate(
+            {
+                "configs": [
+                    GameServerConfig.from_dict(_item) for _item in obj["configs"]
+                ]
+                if obj.get("configs") is not None
+                else None,
+                "game_server_instances": [
+                    GameServerInstance.from_dict(_item)
+                    for _item in obj["game_server_instances"]
+                ]
+                if obj.get("game_server_instances") is not None
+                else None,
+                "workers": [Worker.from_dict(_item) for _item in obj["workers"]]
+                if obj.get("workers") is not None
+                else None,
+            }
+        )
+        return _obj
@@ -0,0 +1,113 @@
+# coding: utf-8
+
+"""
+ManMan Experience API
+
+No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+
+The version of the OpenAPI document: 0.1.0
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from __future__ import annotations
+import pprint
+import re  # noqa: F401
+import json
+
+from pydantic import BaseModel, ConfigDict, StrictBool, StrictInt, StrictStr
+from typing import Any, ClassVar, Dict, List, Optional
+from typing import Optional, Set
+from typing_extensions import Self
+
+
+class GameServerConfig(BaseModel):
+    """
+    GameServerConfig
+    """  # noqa: E501
+
+    args: List[StrictStr]
+    env_var: List[StrictStr]
+    executable: StrictStr
+    game_server_config_id: StrictInt
+    game_server_id: StrictInt
+    is_default: Optional[StrictBool] = False
+    is_visible: Optional[StrictBool] = True
+    name: StrictStr
+    __properties: ClassVar[List[str]] = [
+        "args",
+        "env_var",
+        "executable",
+        "game_server_config_id",
+        "game_server_id",
+        "is_default",
+        "is_visible",
+        "name",
+    ]
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+    )
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Optional[Self]:
+        """Create an instance of GameServerConfig from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the dictionary representation of the model using alias.
+
+        This has the following differences from calling pydantic's
+        `self.model_dump(by_alias=True)`:
+
+        * `None` is only added to the output dict for nullable fields that
+          were set at model initialization. Other fields with value `None`
+          are ignored.
+        """
+        excluded_fields: Set[str] = set([])
+
+        _dict = self.model_dump(
+            by_alias=True,
+            exclude=excluded_fields,
+            exclude_none=True,
+        )
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
+        """Create an instance of GameServerConfig from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return cls.model_validate(obj)
+
+        _obj = cls.model_validate(
+            {
+                "args": obj.get("args"),
+                "env_var": obj.get("env_var"),
+                "executable": obj.get("executable"),
+                "game_server_config_id": obj.get("game_server_config_id"),
+                "game_server_id": obj.get("game_server_id"),
+                "is_default": obj.get("is_default")
+                if obj.get("is_default") is not None
+                else False,
+                "is_visible": obj.get("is_visible")
+                if obj.get("is_visible") is not None
+                else True,
+                "name": obj.get("name"),
+            }
+        )
+        return _obj
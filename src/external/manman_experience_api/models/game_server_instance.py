@@ -0,0 +1,111 @@
+# coding: utf-8
+
+"""
+ManMan Experience API
+
+No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+
+The version of the OpenAPI document: 0.1.0
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from __future__ import annotations
+import pprint
+import re  # noqa: F401
+import json
+
+from datetime import datetime
+from pydantic import BaseModel, ConfigDict, StrictInt
+from typing import Any, ClassVar, Dict, List, Optional
+from typing import Optional, Set
+from typing_extensions import Self
+
+
+class GameServerInstance(BaseModel):
+    """
+    GameServerInstance
+    """  # noqa: E501
+
+    end_date: Optional[datetime]
+    game_server_config_id: StrictInt
+    game_server_instance_id: StrictInt
+    last_heartbeat: Optional[datetime]
+    worker_id: StrictInt
+    __properties: ClassVar[List[str]] = [
+        "end_date",
+        "game_server_config_id",
+        "game_server_instance_id",
+        "last_heartbeat",
+        "worker_id",
+    ]
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+    )
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Optional[Self]:
+        """Create an instance of GameServerInstance from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the dictionary representation of the model using alias.
+
+        This has the following differences from calling pydantic's
+        `self.model_dump(by_alias=True)`:
+
+        * `None` is only added to the output dict for nullable fields that
+          were set at model initialization. Other fields with value `None`
+          are ignored.
+        """
+        excluded_fields: Set[str] = set([])
+
+        _dict = self.model_dump(
+            by_alias=True,
+            exclude=excluded_fields,
+            exclude_none=True,
+        )
+        # set to None if end_date (nullable) is None
+        # and model_fields_set contains the field
+        if self.end_date is None and "end_date" in self.model_fields_set:
+            _dict["end_date"] = None
+
+        # set to None if last_heartbeat (nullable) is None
+        # and model_fields_set contains the field
+        if self.last_heartbeat is None and "last_heartbeat" in self.model_fields_set:
+            _dict["last_heartbeat"] = None
+
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
+        """Create an instance of GameServerInstance from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return cls.model_validate(obj)
+
+        _obj = cls.model_validate(
+            {
+                "end_date": obj.get("end_date"),
+                "game_server_config_id": obj.get("game_server_config_id"),
+                "game_server_instance_id": obj.get("game_server_instance_id"),
+                "last_heartbeat": obj.get("last_heartbeat"),
+                "worker_id": obj.get("worker_id"),
+            }
+        )
+        return _obj
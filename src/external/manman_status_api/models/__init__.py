@@ -0,0 +1,22 @@
+# coding: utf-8
+
+# flake8: noqa
+"""
+ManMan Status API
+
+No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+
+The version of the OpenAPI document: 0.1.0
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+# import models into model package
+from external.manman_status_api.models.external_status_info import ExternalStatusInfo
+from external.manman_status_api.models.http_validation_error import HTTPValidationError
+from external.manman_status_api.models.status_type import StatusType
+from external.manman_status_api.models.validation_error import ValidationError
+from external.manman_status_api.models.validation_error_loc_inner import (
+    ValidationErrorLocInner,
+)
@@ -0,0 +1,118 @@
+# coding: utf-8
+
+"""
+ManMan Status API
+
+No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+
+The version of the OpenAPI document: 0.1.0
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from __future__ import annotations
+import pprint
+import re  # noqa: F401
+import json
+
+from datetime import datetime
+from pydantic import BaseModel, ConfigDict, StrictInt, StrictStr
+from typing import Any, ClassVar, Dict, List, Optional
+from external.manman_status_api.models.status_type import StatusType
+from typing import Optional, Set
+from typing_extensions import Self
+
+
+class ExternalStatusInfo(BaseModel):
+    """
+    ExternalStatusInfo
+    """  # noqa: E501
+
+    as_of: Optional[datetime] = None
+    class_name: StrictStr
+    game_server_instance_id: Optional[StrictInt] = None
+    status_info_id: StrictInt
+    status_type: StatusType
+    worker_id: Optional[StrictInt] = None
+    __properties: ClassVar[List[str]] = [
+        "as_of",
+        "class_name",
+        "game_server_instance_id",
+        "status_info_id",
+        "status_type",
+        "worker_id",
+    ]
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+    )
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Optional[Self]:
+        """Create an instance of ExternalStatusInfo from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the dictionary representation of the model using alias.
+
+        This has the following differences from calling pydantic's
+        `self.model_dump(by_alias=True)`:
+
+        * `None` is only added to the output dict for nullable fields that
+          were set at model initialization. Other fields with value `None`
+          are ignored.
+        """
+        excluded_fields: Set[str] = set([])
+
+        _dict = self.model_dump(
+            by_alias=True,
+            exclude=excluded_fields,
+            exclude_none=True,
+        )
+        # set to None if game_server_instance_id (nullable) is None
+        # and model_fields_set contains the field
+        if (
+            self.game_server_instance_id is None
+            and "game_server_instance_id" in self.model_fields_set
+        ):
+            _dict["game_server_instance_id"] = None
+
+        # set to None if worker_id (nullable) is None
+        # and model_fields_set contains the field
+        if self.worker_id is None and "worker_id" in self.model_fields_set:
+            _dict["worker_id"] = None
+
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
+        """Create an instance of ExternalStatusInfo from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return cls.model_validate(obj)
+
+        _obj = cls.model_validate(
+            {
+                "as_of": obj.get("as_of"),
+                "class_name": obj.get("class_name"),
+                "game_server_instance_id": obj.get("game_server_instance_id"),
+                "status_info_id": obj.get("status_info_id"),
+                "status_type": obj.get("status_type"),
+                "worker_id": obj.get("worker_id"),
+            }
+        )
+        return _obj
@@ -0,0 +1,34 @@
+# coding: utf-8
+
+# flake8: noqa
+"""
+FastAPI
+
+No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+
+The version of the OpenAPI document: 0.1.0
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+# import models into model package
+from external.old_manman_api.models.current_instance_response import (
+    CurrentInstanceResponse,
+)
+from external.old_manman_api.models.game_server import GameServer
+from external.old_manman_api.models.game_server_config import GameServerConfig
+from external.old_manman_api.models.game_server_instance_input import (
+    GameServerInstanceInput,
+)
+from external.old_manman_api.models.game_server_instance_output import (
+    GameServerInstanceOutput,
+)
+from external.old_manman_api.models.http_validation_error import HTTPValidationError
+from external.old_manman_api.models.server_type import ServerType
+from external.old_manman_api.models.stdin_command_request import StdinCommandRequest
+from external.old_manman_api.models.validation_error import ValidationError
+from external.old_manman_api.models.validation_error_loc_inner import (
+    ValidationErrorLocInner,
+)
+from external.old_manman_api.models.worker import Worker
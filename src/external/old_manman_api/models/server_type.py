@@ -0,0 +1,33 @@
+# coding: utf-8
+
+"""
+FastAPI
+
+No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+
+The version of the OpenAPI document: 0.1.0
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from __future__ import annotations
+import json
+from enum import Enum
+from typing_extensions import Self
+
+
+class ServerType(int, Enum):
+    """
+    ServerType
+    """
+
+    """
+    allowed enum values
+    """
+    NUMBER_1 = 1
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Self:
+        """Create an instance of ServerType from a JSON string"""
+        return cls(json.loads(json_str))
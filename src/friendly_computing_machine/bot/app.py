@@ -11,6 +11,7 @@ from friendly_computing_machine.db.dal import (
     get_music_polls,
     get_slack_channel,
 )
+from friendly_computing_machine.gemini.response_mode import GeminiResponseMode
 from friendly_computing_machine.models.music_poll import MusicPoll
 from friendly_computing_machine.models.slack import SlackChannel
 
@@ -30,6 +31,14 @@ def init_web_client(slack_bot_token: str):
     )
 
 
+def init_gemini_response_mode(response_mode: GeminiResponseMode):
+    __GLOBALS["gemini_response_mode"] = response_mode
+
+
+def get_gemini_response_mode() -> GeminiResponseMode:
+    return __GLOBALS.get("gemini_response_mode", GeminiResponseMode.MULTI_PASS)
+
+
 # Slack app instance (initialized lazily)
 _app_instance = None
 
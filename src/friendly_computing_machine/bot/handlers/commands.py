@@ -4,7 +4,7 @@ import logging
 from opentelemetry import trace
 from slack_bolt import Ack, Say
 
-from friendly_computing_machine.bot.app import app
+from friendly_computing_machine.bot.app import app, get_gemini_response_mode
 from friendly_computing_machine.bot.modal_builder import build_server_select_modal
 from friendly_computing_machine.bot.slack_client import SlackWebClientFCM
 from friendly_computing_machine.db.dal import (
@@ -12,6 +12,7 @@ from friendly_computing_machine.db.dal import (
     insert_slack_command,
     update_genai_text_response,
 )
+from friendly_computing_machine.gemini.response_mode import GeminiResponseMode
 from friendly_computing_machine.models.genai import GenAITextCreate
 from friendly_computing_machine.models.slack import SlackCommandCreate
 from friendly_computing_machine.temporal.slack.workflow import (
@@ -19,6 +20,7 @@ from friendly_computing_machine.temporal.slack.workflow import (
     SlackContextGeminiWorkflowParams,
 )
 from friendly_computing_machine.temporal.util import (
+    TaskQueue,
     execute_workflow,
     get_temporal_queue_name,
 )
@@ -81,12 +83,18 @@ def handle_whale_ai_command(ack: Ack, say: Say, command):
             # )
             workflow_id = f"test_id-command-wai-{channel_id}-{datetime.datetime.now()}"
             span.set_attribute("temporal.workflow.id", workflow_id)
+            response_mode = get_gemini_response_mode()
+            span.set_attribute("ai.response_mode", response_mode)
             ai_response = execute_workflow(
                 SlackContextGeminiWorkflow.run,
-                SlackContextGeminiWorkflowParams(channel_id, text),
+                SlackContextGeminiWorkflowParams(
+                    channel_id,
+                    text,
+                    genai_text.id,
+                    response_mode=response_mode,
+                ),
                 id=workflow_id,
-                # TODO - proper task queue differentation at some point
-                task_queue=get_temporal_queue_name("main"),
+                task_queue=get_temporal_queue_name(TaskQueue.MAIN),
             )
             span.set_attribute("temporal.workflow.executed", True)
 
@@ -110,7 +118,9 @@ def handle_whale_ai_command(ack: Ack, say: Say, command):
                     genai_text_id=genai_text.id, response=ai_response
                 )
                 span.set_attribute("db.genai_text.response_updated", True)
-                say(text=ai_response)
+                # a streamed response was already posted by the workflow
+                if response_mode != GeminiResponseMode.STREAMING:
+                    say(text=ai_response)
                 span.set_attribute("slack.response.sent", True)
                 span.set_attribute("ai.response.status", "success")
 
@@ -5,7 +5,7 @@ from slack_bolt import Ack
 from friendly_computing_machine.bot.app import SlackWebClientFCM, app
 from friendly_computing_machine.bot.modal_schemas import ServerActionModal
 from friendly_computing_machine.bot.slack_payloads import ViewSubmissionPayload
-from friendly_computing_machine.manman.api import OldManManAPI
+from friendly_computing_machine.manman.catalog import get_game_server_config
 
 logger = logging.getLogger(__name__)
 
@@ -22,17 +22,7 @@ def handle_server_select_submission(ack: Ack, body, client: SlackWebClientFCM, l
 
         server_config_id = int(payload.selected_server)
         logger.info(f"Server selected: {server_config_id}")
-        manman = OldManManAPI.get_api()
-        # TODO - add endpoint for just config info by id
-        configs = manman.get_game_servers_host_gameserver_get()
-        config = next(
-            (
-                config
-                for config in configs
-                if config.game_server_config_id == server_config_id
-            ),
-            None,
-        )
+        config = get_game_server_config(server_config_id)
         if config is None:
             logger.error(f"Server config not found for ID: {server_config_id}")
             return
@@ -1,11 +1,14 @@
 import functools
 
 from slack_sdk import WebClient
+from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
 
 
 class SlackWebClientFCM(WebClient):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # back off on 429 using retry-after instead of failing the call
+        self.retry_handlers.append(RateLimitErrorRetryHandler(max_retry_count=3))
 
     @functools.cached_property
     def team_id(self) -> str:
@@ -0,0 +1,113 @@
+import logging
+import threading
+import time
+from typing import Optional
+
+from friendly_computing_machine.db.dal import get_enabled_slack_special_channels
+from friendly_computing_machine.models.slack import (
+    SlackChannel,
+    SlackSpecialChannel,
+    SlackSpecialChannelType,
+)
+
+logger = logging.getLogger(__name__)
+
+__GLOBALS = {}
+
+T_special_channel_route = tuple[
+    SlackSpecialChannel, SlackChannel, SlackSpecialChannelType
+]
+
+
+class SpecialChannelRouting:
+    """
+    In memory index of the enabled special channels by channel type name.
+
+    A background thread reloads the whole table every refresh interval and swaps
+    the index in one assignment, so readers never see a half built index and
+    never hit the database. Routing changes show up within one interval.
+    """
+
+    def __init__(self, refresh_interval_seconds: float):
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self._index: Optional[dict[str, list[T_special_channel_route]]] = None
+        self._loaded_at = float("-inf")
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def refresh(self) -> dict[str, list[T_special_channel_route]]:
+        index: dict[str, list[T_special_channel_route]] = {}
+        for (
+            special_channel,
+            slack_channel,
+            channel_type,
+        ) in get_enabled_slack_special_channels():
+            index.setdefault(channel_type.type_name, []).append(
+                (special_channel, slack_channel, channel_type)
+            )
+        self._index = index
+        self._loaded_at = time.monotonic()
+        logger.debug(
+            "special channel routing refreshed: %s",
+            {type_name: len(routes) for type_name, routes in index.items()},
+        )
+        return index
+
+    def _get_index(self) -> dict[str, list[T_special_channel_route]]:
+        index = self._index
+        # without the refresh thread, reload on read once the interval has passed
+        if index is None or (
+            self._thread is None
+            and time.monotonic() - self._loaded_at >= self.refresh_interval_seconds
+        ):
+            with self._lock:
+                if self._index is index:
+                    return self.refresh()
+                return self._index
+        return index
+
+    def get_channels(self, type_name: str) -> list[T_special_channel_route]:
+        return list(self._get_index().get(type_name, []))
+
+    def _run(self):
+        while not self._stop.wait(self.refresh_interval_seconds):
+            try:
+                with self._lock:
+                    self.refresh()
+            except Exception:
+                # keep serving the last good index, try again next interval
+                logger.exception("special channel routing refresh failed")
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="special-channel-routing", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+def init_special_channel_routing(
+    refresh_interval_seconds: float,
+) -> SpecialChannelRouting:
+    if "routing" in __GLOBALS:
+        raise RuntimeError("double special channel routing init")
+    routing = SpecialChannelRouting(refresh_interval_seconds)
+    routing.start()
+    __GLOBALS["routing"] = routing
+    return routing
+
+
+def get_special_channel_routing() -> Optional[SpecialChannelRouting]:
+    """
+    :return: the process wide routing table, None if it was not set up
+    """
+    return __GLOBALS.get("routing")
@@ -0,0 +1,80 @@
+import datetime
+import json
+import re
+import time
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Optional, Union
+
+from external.manman_status_api.models.external_status_info import ExternalStatusInfo
+
+# status events older than this are not worth showing anymore
+STATUS_MAX_AGE = datetime.timedelta(minutes=5)
+# the events are flat json objects, so the first as_of key is the event's
+_AS_OF_PATTERN = re.compile(r'"as_of"\s*:\s*"([^"]*)"')
+
+
+class StatusDecodeOutcome(StrEnum):
+    DECODED = "decoded"
+    # older than the max age, dropped before validation
+    STALE = "stale"
+    # neither a worker nor a game server instance
+    UNKNOWN_SERVICE = "unknown_service"
+
+
+@dataclass
+class DecodedStatus:
+    outcome: StatusDecodeOutcome
+    status_info: Optional[ExternalStatusInfo] = None
+    # set for STALE, so it can be logged without building the model
+    as_of: Optional[datetime.datetime] = None
+
+
+def _peek_as_of(body: str) -> Optional[datetime.datetime]:
+    """
+    Find as_of in the raw message, None when only full decoding can tell.
+    """
+    match = _AS_OF_PATTERN.search(body)
+    if match is None:
+        return None
+    try:
+        as_of = datetime.datetime.fromisoformat(match.group(1))
+    except ValueError:
+        return None
+    # a naive timestamp cannot be compared, validation gets to complain about it
+    return as_of if as_of.tzinfo is not None else None
+
+
+def decode_status_message(
+    body: Union[str, bytes],
+    now: Optional[datetime.datetime] = None,
+    max_age: datetime.timedelta = STATUS_MAX_AGE,
+) -> DecodedStatus:
+    """
+    Decode a status event, dropping stale and unknown ones before paying for validation.
+    Stale events are spotted without parsing the json at all.
+
+    Raises json.JSONDecodeError for a body that is not JSON, and the model's
+    validation error for an event that does not fit ExternalStatusInfo.
+    """
+    if isinstance(body, bytes):
+        body = body.decode()
+    stale_before = (
+        now.timestamp() if now is not None else time.time()
+    ) - max_age.total_seconds()
+
+    as_of = _peek_as_of(body)
+    if as_of is not None and as_of.timestamp() < stale_before:
+        return DecodedStatus(StatusDecodeOutcome.STALE, as_of=as_of)
+
+    message_data = json.loads(body)
+    if not (
+        message_data.get("worker_id") or message_data.get("game_server_instance_id")
+    ):
+        return DecodedStatus(StatusDecodeOutcome.UNKNOWN_SERVICE)
+
+    status_info = ExternalStatusInfo.from_dict(message_data)
+    # as_of was not peekable, check what validation made of it
+    if as_of is None and status_info.as_of.timestamp() < stale_before:
+        return DecodedStatus(StatusDecodeOutcome.STALE, as_of=status_info.as_of)
+    return DecodedStatus(StatusDecodeOutcome.DECODED, status_info)
@@ -1,16 +1,45 @@
+import datetime
 import logging
+from typing import Optional
 
 from friendly_computing_machine.bot.app import get_slack_web_client
-from friendly_computing_machine.bot.subscribe.service import ManManSubscribeService
+from friendly_computing_machine.bot.subscribe.service import (
+    DEFAULT_COALESCE_WINDOW_SECONDS,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_PREFETCH_COUNT,
+    ManManSubscribeService,
+)
+from friendly_computing_machine.db.dal import get_manman_status_updates_since
+from friendly_computing_machine.health import register_health_route
 from friendly_computing_machine.manman.api import ManManStatusAPI
+from friendly_computing_machine.manman.status_board import (
+    ManManServiceStatus,
+    init_manman_status_board,
+    status_board_response,
+)
 from friendly_computing_machine.rabbitmq.util import (
-    get_rabbitmq_connection,
+    get_rabbitmq_connection_manager,
 )
 
 logger = logging.getLogger(__name__)
 
+# services quiet for longer than this are left off the status board until they report again
+STATUS_BOARD_SEED_MAX_AGE = datetime.timedelta(days=1)
+# served by the health server, ?since=<version> lists only what changed after it
+STATUS_BOARD_ROUTE = "/manman/status"
+
+
+def _parse_since(query: dict[str, list[str]]) -> Optional[int]:
+    since = query.get("since", [""])[0]
+    return int(since) if since.isdigit() else None
+
 
-def run_manman_subscribe(app_env: str):
+def run_manman_subscribe(
+    app_env: str,
+    prefetch_count: int = DEFAULT_PREFETCH_COUNT,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    coalesce_window_seconds: float = DEFAULT_COALESCE_WINDOW_SECONDS,
+):
     """
     Run the ManMan Subscribe Service.
 
@@ -19,15 +48,38 @@ def run_manman_subscribe(app_env: str):
 
     Args:
         app_env: Application environment string
+        prefetch_count: unacked messages the broker may send ahead
+        concurrency: messages forwarded at once
+        coalesce_window_seconds: how long a service's events are held so only the newest is forwarded
     """
     logger.info("Starting ManMan Subscribe Service")
 
-    rabbit_mq_connection = get_rabbitmq_connection()
+    rabbitmq_connection_manager = get_rabbitmq_connection_manager()
     slack_api = get_slack_web_client()
     manman_status_api = ManManStatusAPI.get_api()
 
+    status_board = init_manman_status_board()
+    seeded = status_board.update_many(
+        ManManServiceStatus.from_status_update(status_update)
+        for status_update in get_manman_status_updates_since(
+            datetime.datetime.now(datetime.timezone.utc) - STATUS_BOARD_SEED_MAX_AGE
+        )
+    )
+    logger.info("status board seeded with %s services", seeded)
+    register_health_route(
+        STATUS_BOARD_ROUTE,
+        lambda query: status_board_response(status_board, _parse_since(query)),
+    )
+
     service = ManManSubscribeService(
-        app_env, rabbit_mq_connection, slack_api, manman_status_api
+        app_env,
+        rabbitmq_connection_manager,
+        slack_api,
+        manman_status_api,
+        prefetch_count=prefetch_count,
+        concurrency=concurrency,
+        coalesce_window_seconds=coalesce_window_seconds,
+        status_board=status_board,
     )
     try:
         service.start()
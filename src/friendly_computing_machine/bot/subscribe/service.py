@@ -1,37 +1,75 @@
-import datetime
+import asyncio
 import json
 import logging
-import time
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
 from typing import Optional
 
-from amqpstorm import Channel, Connection
+from amqpstorm import Channel
+from opentelemetry import metrics
+from temporalio.client import Client
 
 from external.manman_status_api.api.default_api import DefaultApi as ManManStatusAPI
 from external.manman_status_api.models.external_status_info import ExternalStatusInfo
 from external.manman_status_api.models.status_type import StatusType
 from friendly_computing_machine.bot.app import SlackWebClientFCM
-from friendly_computing_machine.bot.slack_models import create_manman_status_blocks
-from friendly_computing_machine.bot.util import slack_send_message
-from friendly_computing_machine.db.dal import (
-    # get_manman_status_update_from_create,  # DEAD CODE - unused import
-    get_slack_message_from_id,  # TODO - be less lazy with this
-    get_slack_special_channel_type_from_name,
-    get_slack_special_channels_from_type,
-    # insert_manman_status_update,  # DEAD CODE - unused import, using upsert instead
-    update_manman_status_update,
+from friendly_computing_machine.bot.subscribe.decode import (
+    StatusDecodeOutcome,
+    decode_status_message,
 )
-from friendly_computing_machine.db.dal.manman_dal import upsert_manman_status_update
-from friendly_computing_machine.models.manman import (
-    ManManStatusUpdate,
-    ManManStatusUpdateCreate,
+from friendly_computing_machine.manman.status_board import (
+    ManManServiceStatus,
+    ManManStatusBoard,
 )
-from friendly_computing_machine.models.slack import (
-    SlackMessage,
+from friendly_computing_machine.models.manman import ManManStatusUpdateCreate
+from friendly_computing_machine.rabbitmq.ack import DeliveryAckTracker
+from friendly_computing_machine.rabbitmq.connection import RabbitMQConnectionManager
+from friendly_computing_machine.temporal.manman.workflow import (
+    ManManStatusWorkflow,
+    ManManStatusWorkflowParams,
+    get_manman_status_workflow_id,
+)
+from friendly_computing_machine.temporal.util import (
+    TaskQueue,
+    get_temporal_client_async,
+    get_temporal_queue_name,
 )
-from friendly_computing_machine.util import datetime_to_ts
 
 logger = logging.getLogger(__name__)
+meter = metrics.get_meter(__name__)
+
+coalesced_counter = meter.create_counter(
+    "fcm.manman.status.coalesced",
+    description="status events dropped in favor of a newer one for the same service",
+)
+
+stale_counter = meter.create_counter(
+    "fcm.manman.status.stale",
+    description="status events dropped for being too old, before they were validated",
+)
+
+DEFAULT_PREFETCH_COUNT = 100
+DEFAULT_CONCURRENCY = 8
+DEFAULT_ACK_BATCH_SIZE = 10
+DEFAULT_COALESCE_WINDOW_SECONDS = 2.0
+
+
+def _get_service_key(status_info: ExternalStatusInfo) -> tuple[str, int]:
+    service = ManManStatusUpdateCreate.from_status_info(status_info)
+    return service.service_type, service.service_id
+
+
+@dataclass
+class CoalescedStatus:
+    """
+    The newest status event held for a service, and every delivery it stands for.
+    Delivery tags are only meaningful on the channel they came from, so they are
+    settled through that channel's tracker.
+    """
+
+    status_info: ExternalStatusInfo
+    ack_tracker: DeliveryAckTracker
+    delivery_tags: list[int] = field(default_factory=list)
 
 
 @dataclass
@@ -51,38 +89,65 @@ class ManManSubscribeService:
     - Worker lifecycle events (start, running, lost, complete)
     - Instance lifecycle events (start, init, running, lost, complete)
 
-    Events are processed to:
-    - Send formatted Slack messages with action buttons
-
-    SIMPLIFIED SYNCHRONOUS CONTROL FLOW:
-    1. Initialization (__init__): Sets up RabbitMQ connection, channel, and queue configs.
-    2. Service Start (start()): Declares durable queues, binds them to exchange, registers consumers.
-    3. Message Callback (_amqp_message_callback): Directly processes messages synchronously.
-    4. Service Stop (stop()): Stops consuming and closes channel.
+    Events are forwarded to a ManManStatusWorkflow per worker/instance, which
+    records them and sends formatted Slack messages with action buttons.
+
+    CONTROL FLOW:
+    1. Initialization (__init__): Sets up the RabbitMQ connection manager and queue configs.
+    2. Service Start (start()): Connects to temporal, then consumes through the
+       connection manager. Every (re)connect declares the durable queue, binds it
+       to the exchange and registers the consumer on a fresh channel.
+    3. Message Callback (_amqp_message_callback): Parses the event and hands it off.
+       Events for a service are coalesced for a short window, then the newest is
+       signal-with-started into the service's workflow and acked. The workflow
+       does the slow part.
+    4. Service Stop (stop()): Stops consuming and closes the connection.
     """
 
     def __init__(
         self,
         app_env: str,
-        rabbitmq_connection: Connection,
+        rabbitmq_connection_manager: RabbitMQConnectionManager,
         slack_api: SlackWebClientFCM,
         manman_status_api: ManManStatusAPI,
+        prefetch_count: int = DEFAULT_PREFETCH_COUNT,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ack_batch_size: int = DEFAULT_ACK_BATCH_SIZE,
+        coalesce_window_seconds: float = DEFAULT_COALESCE_WINDOW_SECONDS,
+        status_board: Optional[ManManStatusBoard] = None,
     ):
         """
         Initialize the ManMan Subscribe Service.
 
         Args:
-            rabbitmq_connection: Connection object for RabbitMQ
+            rabbitmq_connection_manager: RabbitMQ connection manager, reconnects on failure
             slack_api: SlackWebClientFCM for Slack interactions
             manman_status_api: ManManStatusAPI for status interactions
             app_env: Application environment string
+            prefetch_count: unacked messages the broker may send ahead
+            concurrency: messages forwarded at once, one partition each
+            ack_batch_size: acks held back to send as one multiple ack
+            coalesce_window_seconds: how long a service's events are held so only
+                the newest is forwarded, 0 forwards every event
+            status_board: kept current with every event received, when given
         """
-        self._rabbitmq_connection = rabbitmq_connection
-        self._channel: Channel = rabbitmq_connection.channel()
+        self._rabbitmq_connection_manager = rabbitmq_connection_manager
+        self._channel: Optional[Channel] = None
         self._slack_api = slack_api
         self._is_running = False
         self._manman_status_api = manman_status_api
         self._app_env = app_env
+        self._prefetch_count = prefetch_count
+        self._concurrency = concurrency
+        self._ack_batch_size = ack_batch_size
+        # replaced along with the channel on every reconnect
+        self._ack_tracker: Optional[DeliveryAckTracker] = None
+        # events are partitioned by service, so one service's events are forwarded in order
+        self._partitions: list[asyncio.Queue] = []
+        self._coalesce_window_seconds = coalesce_window_seconds
+        # only touched from the temporal client loop
+        self._coalesced: dict[tuple[str, int], CoalescedStatus] = {}
+        self._status_board = status_board
 
         # Queue configuration using proper classes
         self._exchange = "external_service_events"
@@ -94,28 +159,19 @@ class ManManSubscribeService:
             ],
         )
 
-        # Hardcoding for now
-        self._manman_channel_type = get_slack_special_channel_type_from_name(
-            "manman_dev"
-        )
-        if self._manman_channel_type:
-            self._manman_channel_tups = get_slack_special_channels_from_type(
-                self._manman_channel_type
-            )
-        else:
-            logger.warning(
-                "No ManMan channel type found, using default channel for notifications."
-            )
-            self._manman_channel_tups = []
+        # the temporal client is async, it runs on its own loop next to the blocking consumer
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._temporal_client: Optional[Client] = None
 
         logger.info("ManMan Subscribe Service initialized")
 
     def start(self):
         """
-        Start the subscribe service in synchronous mode.
-        Declares queues, sets up consumers, and starts blocking message consumption.
+        Start the subscribe service.
+        Blocks consuming messages until stop() is called, reconnecting when the
+        broker goes away.
         """
-        logger.info("Starting ManMan Subscribe Service (Synchronous Mode)")
+        logger.info("Starting ManMan Subscribe Service")
         if self._is_running:
             logger.warning("Service is already running.")
             return
@@ -123,27 +179,10 @@ class ManManSubscribeService:
         self._is_running = True
 
         try:
-            # Set up queues and bindings
-            self._channel.queue.declare(queue=self._queue.name, durable=True)
-            for routing_key in self._queue.routing_keys:
-                self._channel.queue.bind(
-                    exchange=self._exchange,
-                    queue=self._queue.name,
-                    routing_key=routing_key,
-                )
-                logger.info(f"Binding created for routing key: {routing_key}")
-
-            # Register consumer for this queue
-            self._channel.basic.consume(
-                callback=self._amqp_message_callback,
-                queue=self._queue.name,
-                no_ack=False,  # Manual acknowledgment
-            )
-            logger.info(f"Consumer set up for queue: {self._queue.name}")
-
-            logger.info("Starting synchronous message consumption...")
-            # This blocks until stop_consuming() is called
-            self._channel.start_consuming()
+            self._start_temporal_client()
+            self._start_partitions()
+            # This blocks until stop() is called
+            self._rabbitmq_connection_manager.consume(self._setup_channel)
             logger.info("ManMan Subscribe Service stopped consuming.")
 
         except Exception as e:
@@ -163,279 +202,234 @@ class ManManSubscribeService:
 
         self._is_running = False
 
-        if self._channel and self._channel.is_open:
-            logger.info("Stopping AMQP consumer...")
+        logger.info("Stopping AMQP consumer and closing the connection.")
+        self._rabbitmq_connection_manager.stop()
+        self._channel = None
+        self._stop_temporal_client()
+        logger.info("ManMan Subscribe Service stopped.")
+
+    def _setup_channel(self, channel: Channel):
+        """
+        Declare the queue and its bindings and register the consumer on a new channel.
+        Runs on start and again after every reconnect.
+        """
+        # deliveries from a previous channel are settled through their own tracker,
+        # the broker redelivers them anyway since that channel is gone
+        self._channel = channel
+        self._ack_tracker = DeliveryAckTracker(channel, self._ack_batch_size)
+
+        # Set up queues and bindings
+        channel.queue.declare(queue=self._queue.name, durable=True)
+        for routing_key in self._queue.routing_keys:
+            channel.queue.bind(
+                exchange=self._exchange,
+                queue=self._queue.name,
+                routing_key=routing_key,
+            )
+            logger.info(f"Binding created for routing key: {routing_key}")
+
+        # bound what the broker pushes to what the partitions can work through
+        channel.basic.qos(prefetch_count=self._prefetch_count)
+        # Register consumer for this queue
+        channel.basic.consume(
+            callback=self._amqp_message_callback,
+            queue=self._queue.name,
+            no_ack=False,  # Manual acknowledgment
+        )
+        logger.info(
+            "Consuming %s with prefetch %s and %s partitions",
+            self._queue.name,
+            self._prefetch_count,
+            self._concurrency,
+        )
+
+    def _start_temporal_client(self):
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(
+            target=self._loop.run_forever, name="temporal-client", daemon=True
+        ).start()
+        self._temporal_client = self._run_async(get_temporal_client_async())
+        logger.info("temporal client connected")
+
+    def _stop_temporal_client(self):
+        if self._loop is None:
+            return
+        # events still held or being forwarded are unacked, the broker redelivers them
+        self._run_async(self._cancel_partitions())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop = None
+        self._temporal_client = None
+
+    def _run_async(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def _start_partitions(self):
+        self._partitions = [asyncio.Queue() for _ in range(self._concurrency)]
+        for partition in self._partitions:
+            asyncio.run_coroutine_threadsafe(self._run_partition(partition), self._loop)
+
+    async def _cancel_partitions(self):
+        tasks = [
+            task for task in asyncio.all_tasks() if task is not asyncio.current_task()
+        ]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _get_partition(self, service_key: tuple[str, int]) -> asyncio.Queue:
+        return self._partitions[hash(service_key) % len(self._partitions)]
+
+    def _coalesce(
+        self,
+        ack_tracker: DeliveryAckTracker,
+        delivery_tag: int,
+        status_info: ExternalStatusInfo,
+    ):
+        """
+        Hold a service's events for the coalesce window and forward only the newest.
+        Runs on the temporal client loop.
+        """
+        service_key = _get_service_key(status_info)
+        # CREATED posts the slack message the later events edit, so it is never dropped
+        if (
+            self._coalesce_window_seconds <= 0
+            or status_info.status_type == StatusType.CREATED
+        ):
+            self._flush_coalesced(service_key)
+            self._get_partition(service_key).put_nowait(
+                CoalescedStatus(status_info, ack_tracker, [delivery_tag])
+            )
+            return
+
+        held = self._coalesced.get(service_key)
+        if held is not None and held.ack_tracker is not ack_tracker:
+            # the channel was replaced, tags from the old one cannot be mixed in
+            self._flush_coalesced(service_key)
+            held = None
+        if held is None:
+            self._coalesced[service_key] = CoalescedStatus(
+                status_info, ack_tracker, [delivery_tag]
+            )
+            self._loop.call_later(
+                self._coalesce_window_seconds, self._flush_coalesced, service_key
+            )
+            return
+
+        held.delivery_tags.append(delivery_tag)
+        # same ordering as the status upsert, an older event never replaces a newer one
+        if status_info.as_of >= held.status_info.as_of:
+            held.status_info = status_info
+        coalesced_counter.add(1, {"service_type": service_key[0]})
+
+    def _flush_coalesced(self, service_key: tuple[str, int]):
+        held = self._coalesced.pop(service_key, None)
+        if held is not None:
+            self._get_partition(service_key).put_nowait(held)
+
+    async def _run_partition(self, partition: asyncio.Queue):
+        while True:
+            coalesced: CoalescedStatus = await partition.get()
+            forwarded = True
             try:
-                self._channel.stop_consuming()
-                logger.info("AMQP consumer stopped.")
+                await self._signal_status_update(coalesced.status_info)
             except Exception as e:
-                logger.error(f"Error stopping AMQP consumer: {e}")
-
-            logger.info("Closing AMQP channel.")
+                forwarded = False
+                logger.error(
+                    f"Error forwarding messages (delivery_tags: {coalesced.delivery_tags}): {e}",
+                    exc_info=True,
+                )
             try:
-                self._channel.close()
-                logger.info("AMQP channel closed.")
+                for delivery_tag in coalesced.delivery_tags:
+                    if forwarded:
+                        coalesced.ack_tracker.ack(delivery_tag)
+                    else:
+                        coalesced.ack_tracker.reject(delivery_tag, requeue=False)
             except Exception as e:
-                logger.error(f"Error closing AMQP channel: {e}")
+                # the channel is gone, the broker redelivers whatever was not acked
+                logger.error(f"Error settling messages {coalesced.delivery_tags}: {e}")
 
-        self._channel = None
-        logger.info("ManMan Subscribe Service stopped.")
+    async def _signal_status_update(self, status_info: ExternalStatusInfo):
+        """
+        Hand the event to its service's workflow, starting the workflow if it is not running.
+        """
+        service_type, service_id = _get_service_key(status_info)
+        await self._temporal_client.start_workflow(
+            ManManStatusWorkflow.run,
+            ManManStatusWorkflowParams(
+                service_type=service_type,
+                service_id=service_id,
+            ),
+            id=get_manman_status_workflow_id(self._app_env, service_type, service_id),
+            task_queue=get_temporal_queue_name(TaskQueue.MAIN),
+            start_signal="status_update",
+            start_signal_args=[status_info],
+        )
 
     def _amqp_message_callback(self, message):
         """
         Synchronous callback executed when a message is received.
+        Parses the message and hands it to the coalescing stage, whose
+        partitions forward it to the service's workflow and settle it.
         """
+        ack_tracker = self._ack_tracker
+        ack_tracker.received(message.delivery_tag)
         try:
-            logger.info(
-                f"Received message on queue {self._queue.name} (delivery_tag: {message.delivery_tag})"
+            logger.debug(
+                "Received message on queue %s (delivery_tag: %s)",
+                self._queue.name,
+                message.delivery_tag,
             )
 
-            # Parse message
-            message_data = json.loads(message.body)
-            logger.debug(f"Message JSON parsed: {message_data}")
-
-            status_info = ExternalStatusInfo.from_dict(message_data)
-            logger.debug(f"ExternalStatusInfo deserialized: {status_info}")
-
-            if status_info.as_of < datetime.datetime.now(
-                datetime.timezone.utc
-            ) - datetime.timedelta(minutes=5):
-                self._channel.basic.ack(delivery_tag=message.delivery_tag)
+            # stale and unknown events are dropped before the model is built
+            decoded = decode_status_message(message.body)
+            if decoded.outcome == StatusDecodeOutcome.STALE:
+                ack_tracker.ack(message.delivery_tag)
+                stale_counter.add(1)
+                logger.debug(
+                    "tag %s status update is too old: %s. Ignoring update.",
+                    message.delivery_tag,
+                    decoded.as_of,
+                )
+                return
+            if decoded.outcome == StatusDecodeOutcome.UNKNOWN_SERVICE:
                 logger.warning(
-                    f"tag {message.delivery_tag} status update {status_info.worker_id} is too old: {status_info.as_of}. Ignoring update."
+                    "Unknown status info type (delivery_tag: %s): %s",
+                    message.delivery_tag,
+                    message.body[:200],
                 )
+                ack_tracker.ack(message.delivery_tag)
                 return
 
-            # Process message based on type
-            if status_info.worker_id:
-                self._handle_status_update(status_info)
-            elif status_info.game_server_instance_id:
-                self._handle_status_update(status_info)
-            else:
-                logger.warning(f"Unknown status info type: {status_info}")
-
-            # Acknowledge message
-            self._channel.basic.ack(delivery_tag=message.delivery_tag)
-            logger.info(f"Message {message.delivery_tag} acknowledged.")
+            status_info = decoded.status_info
+            if self._status_board is not None:
+                # before coalescing, so the board never lags behind the window
+                self._status_board.update(
+                    ManManServiceStatus.from_status_update(
+                        ManManStatusUpdateCreate.from_status_info(status_info)
+                    )
+                )
+            logger.info(
+                "Received %s for %s (delivery_tag: %s)",
+                status_info.status_type,
+                _get_service_key(status_info),
+                message.delivery_tag,
+            )
+            self._loop.call_soon_threadsafe(
+                self._coalesce, ack_tracker, message.delivery_tag, status_info
+            )
 
         except json.JSONDecodeError as e:
             logger.warning(
                 f"Invalid JSON in message (delivery_tag: {message.delivery_tag}): {e}. Body: {message.body[:200]}"
             )
-            self._channel.basic.reject(delivery_tag=message.delivery_tag, requeue=False)
+            ack_tracker.reject(message.delivery_tag, requeue=False)
             logger.info(f"Message {message.delivery_tag} (invalid JSON) rejected.")
         except Exception as e:
             logger.error(
                 f"Error processing message (delivery_tag: {message.delivery_tag}): {e}",
                 exc_info=True,
             )
-            self._channel.basic.reject(delivery_tag=message.delivery_tag, requeue=False)
+            ack_tracker.reject(message.delivery_tag, requeue=False)
             logger.warning(
                 f"Message {message.delivery_tag} rejected due to processing error."
             )
-
-    def _handle_worker_status_update(self, status_info: ExternalStatusInfo):
-        """
-        Handle worker status update events.
-
-        Args:
-            status_info: ExternalStatusInfo object containing worker status information
-        """
-        logger.info(
-            f"Worker {status_info.worker_id} status update: {status_info.status_info_id}"
-        )
-
-        # TODO: temporal workflow
-        # create a workflow for each worker/server instance by-id
-        # when a worker/server instance is created, start a workflow
-        # when a worker/server instance is updated, send a signal to the workflow
-        # the workflow should handle the status updates and slack logic
-        # this will be the synchronization point for updates hopefully.
-        # can also keep track of event timestamp and make sure that we don't ever go from a current state to an older state
-        # however, for now I am just going to write to the database and send slack messages
-        # the database will ultimately be the source of truth regardless of implementation
-        # however, the control flow around it will be different
-        # TODO - write to database
-        # TODO - if new -> send slack message
-        # TODO - if exists -> update slack message
-        # TODO - always retrieve info in paralell (? what is this requirement mean? just temporal note?)
-        # from friendly_computing_machine.bot.util import slack_send_message
-
-        status_update_create = ManManStatusUpdateCreate.from_status_info(status_info)
-
-        # Use upsert pattern - handles both create and update cases gracefully
-        # This removes the need for time.sleep(3) race condition workaround
-        status_update: ManManStatusUpdate = upsert_manman_status_update(
-            status_update_create
-        )
-
-        # Handle Slack notification based on whether we need to create or update
-        if status_info.status_type == StatusType.CREATED:
-            # Create new Slack message
-            message = self._handle_slack_notification(status_info)
-            status_update.slack_message_id = message.id
-            status_update = update_manman_status_update(status_update)
-            logger.info(
-                "Created Slack notification for worker %s: message_id=%s",
-                status_update.service_id,
-                message.id,
-            )
-        elif status_info.status_type in [
-            StatusType.RUNNING,
-            StatusType.COMPLETE,
-            StatusType.LOST,
-        ]:
-            # Update existing Slack message
-            slack_message = get_slack_message_from_id(status_update.slack_message_id)
-            if not slack_message:
-                # Wait for message to be created in Slack
-                # This is a retry hack until temporal workflow is implemented
-                # shouldn't be as needed with synchronous workflow
-                time.sleep(2)
-                slack_message = get_slack_message_from_id(
-                    status_update.slack_message_id
-                )
-                if not slack_message:
-                    logger.error(
-                        "Slack message not found for status update %s after waiting",
-                        status_update.service_id,
-                    )
-                    return
-            if slack_message is None:
-                # avoid double sending messages. need create, for now...
-                logger.error(
-                    "Slack message not found for status update %s",
-                    status_update.service_id,
-                )
-                return
-            self._handle_slack_notification(
-                status_info,
-                update_ts=datetime_to_ts(slack_message.ts),
-            )
-            logger.info(
-                "Updated Slack notification for worker %s",
-                status_update.service_id,
-            )
-        else:
-            # Includes INITIALIZING, which is not handled here, but is for server
-            logger.warning(
-                f"Unhandled worker status type for worker {status_info.worker_id}: {status_info.status_type}"
-            )
-
-        logger.info(
-            f"Worker {status_info.worker_id} status update processed: {status_info.status_info_id}"
-        )
-
-    def _handle_status_update(self, status_info: ExternalStatusInfo):
-        """
-        Handle worker status update events.
-
-        Args:
-            status_info: ExternalStatusInfo object containing worker status information
-        """
-        logger.info("handling %s", status_info)
-
-        # TODO: temporal workflow
-        # create a workflow for each worker/server instance by-id
-        # when a worker/server instance is created, start a workflow
-        # when a worker/server instance is updated, send a signal to the workflow
-        # the workflow should handle the status updates and slack logic
-        # this will be the synchronization point for updates hopefully.
-        # can also keep track of event timestamp and make sure that we don't ever go from a current state to an older state
-        # however, for now I am just going to write to the database and send slack messages
-        # the database will ultimately be the source of truth regardless of implementation
-        # however, the control flow around it will be different
-        # TODO - write to database
-        # TODO - if new -> send slack message
-        # TODO - if exists -> update slack message
-        # TODO - always retrieve info in paralell (? what is this requirement mean? just temporal note?)
-        # from friendly_computing_machine.bot.util import slack_send_message
-
-        status_update_create = ManManStatusUpdateCreate.from_status_info(status_info)
-
-        # Use upsert pattern - handles both create and update cases gracefully
-        # This removes the need for time.sleep(3) race condition workaround
-        status_update: ManManStatusUpdate = upsert_manman_status_update(
-            status_update_create
-        )
-
-        # Handle Slack notification based on whether we need to create or update
-        if status_info.status_type == StatusType.CREATED:
-            # Create new Slack message
-            message = self._handle_slack_notification(status_info)
-            status_update.slack_message_id = message.id
-            status_update = update_manman_status_update(status_update)
-            logger.info(
-                "Created Slack notification for type %s with id %s: message_id=%s",
-                status_update.service_type,
-                status_update.service_id,
-                message.id,
-            )
-        elif status_info.status_type in [
-            StatusType.RUNNING,
-            StatusType.COMPLETE,
-            StatusType.LOST,
-        ]:
-            # Update existing Slack message
-            slack_message = get_slack_message_from_id(status_update.slack_message_id)
-            if not slack_message:
-                # Wait for message to be created in Slack
-                # This is a retry hack until temporal workflow is implemented
-                # shouldn't be as needed with synchronous workflow
-                time.sleep(2)
-                slack_message = get_slack_message_from_id(
-                    status_update.slack_message_id
-                )
-                if not slack_message:
-                    logger.error(
-                        "Slack message not found for status update %s after waiting",
-                        status_update.service_id,
-                    )
-                    return
-            if slack_message is None:
-                # avoid double sending messages. need create, for now...
-                logger.error(
-                    "Slack message not found for status update %s",
-                    status_update.service_id,
-                )
-                return
-            self._handle_slack_notification(
-                status_info,
-                update_ts=datetime_to_ts(slack_message.ts),
-            )
-            logger.info(
-                "Updated Slack notification for worker %s",
-                status_update.service_id,
-            )
-        else:
-            logger.warning("Unhandled status type %s", status_info.status_type)
-
-        logger.info("status_info %s handled successfully", status_info)
-
-    def _handle_slack_notification(
-        self,
-        status_info: ExternalStatusInfo,
-        update_ts: Optional[str] = None,
-    ) -> SlackMessage:
-        for (
-            special_channel,
-            slack_channel,
-            special_channel_type,
-        ) in self._manman_channel_tups:
-            try:
-                message_block = create_manman_status_blocks(
-                    special_channel_type=special_channel_type,
-                    current_status=status_info,
-                )
-                message = slack_send_message(
-                    channel=slack_channel.slack_id,
-                    blocks=message_block,
-                    update_ts=update_ts,
-                )
-                logger.info(f"Sent Slack notification to channel {special_channel}")
-                return message
-            except Exception as e:
-                logger.error(
-                    f"Failed to send Slack notification to channel {special_channel}: {e}"
-                )
-                raise
@@ -19,7 +19,8 @@ def slack_send_message(
     blocks: Optional[list[Block]] = None,
     thread_ts: Optional[datetime] = None,
     update_ts: Optional[str] = None,
-) -> SlackMessage:
+    record_message: bool = True,
+) -> Optional[SlackMessage]:
     """
     Send a message to Slack channel with either text or blocks.
 
@@ -29,9 +30,11 @@ def slack_send_message(
         blocks: List of Slack block objects for rich messages
         thread_ts: Optional thread timestamp for threaded replies
         update_ts: Optional message timestamp to update instead of posting new
+        record_message: Whether to insert the sent message into the database,
+            eg intermediate updates of a streamed message are not worth keeping
 
     Returns:
-        SlackMessage object representing the sent message
+        SlackMessage object representing the sent message, None if it was not recorded
     """
     web_client = get_slack_web_client()
     # Handle backward compatibility and determine message format
@@ -85,6 +88,9 @@ def slack_send_message(
             "message sent, is response ok? %s", "yes" if response.get("ok") else "no"
         )
 
+    if not record_message:
+        return None
+
     # our own messages aren't sent via event api
     # so need to insert them from the client response
     response_thread_ts = (
@@ -102,7 +108,7 @@ def slack_send_message(
         text=message_text,  # Store rendered text in database
         # unsure if message or response ts is more correct, or if it matters
         # TODO - check if this is giving wrong timezone
-        ts=update_ts or ts_to_datetime(message_data.get("ts")),
+        ts=ts_to_datetime(update_ts or message_data.get("ts")),
         thread_ts=ts_to_datetime(response_thread_ts) if response_thread_ts else None,
         parent_user_slack_id=message_data.get("parent_user_id"),
     )
@@ -5,10 +5,16 @@ import typer
 from friendly_computing_machine.cli.context.app_env import T_app_env
 from friendly_computing_machine.cli.context.db import FILENAME as DB_FILENAME
 from friendly_computing_machine.cli.context.db import T_database_url, setup_db
-from friendly_computing_machine.cli.context.gemini import T_google_api_key, setup_gemini
+from friendly_computing_machine.cli.context.gemini import (
+    T_gemini_response_mode,
+    T_google_api_key,
+    setup_gemini,
+)
 from friendly_computing_machine.cli.context.log import setup_logging
 from friendly_computing_machine.cli.context.manman_host import (
+    T_manman_catalog_ttl_seconds,
     T_manman_host_url,
+    setup_game_server_catalog,
     setup_manman_experience_api,
     setup_old_manman_api,
 )
@@ -23,6 +29,7 @@ from friendly_computing_machine.cli.context.temporal import (
     setup_temporal,
 )
 from friendly_computing_machine.db.util import should_run_migration
+from friendly_computing_machine.gemini.response_mode import GeminiResponseMode
 
 logger = logging.getLogger(__name__)
 app = typer.Typer(
@@ -79,6 +86,8 @@ def cli_run_slack_socket_app(
     google_api_key: T_google_api_key,
     database_url: T_database_url,
     skip_migration_check: bool = False,
+    gemini_response_mode: T_gemini_response_mode = GeminiResponseMode.MULTI_PASS,
+    manman_catalog_ttl_seconds: T_manman_catalog_ttl_seconds = 300,
 ):
     if skip_migration_check:
         logger.info("skipping migration check")
@@ -90,11 +99,15 @@ def cli_run_slack_socket_app(
     # which would remove the need for this db check and allow multiple socket apps
     # very cool
     setup_db(ctx, database_url)
+    setup_game_server_catalog(ctx, manman_catalog_ttl_seconds)
 
     logger.info("starting slack bot service (no task pool)")
     # Lazy import to avoid initializing Slack app during CLI parsing
+    from friendly_computing_machine.bot.app import init_gemini_response_mode
     from friendly_computing_machine.bot.main import run_slack_bot_only
 
+    logger.info("using gemini response mode %s", gemini_response_mode)
+    init_gemini_response_mode(gemini_response_mode)
     run_slack_bot_only(
         app_token=ctx.obj[SLACK_FILENAME]["slack_app_token"],
     )
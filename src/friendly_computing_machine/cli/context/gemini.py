@@ -1,22 +1,121 @@
+import datetime
 import logging
 import os
-from typing import Annotated
+from typing import Annotated, Optional
 
-import google.generativeai as genai
 import typer
 
+from friendly_computing_machine.gemini.cache import init_gemini_response_cache
+from friendly_computing_machine.gemini.response_mode import GeminiResponseMode
+
 logger = logging.getLogger(__name__)
 FILENAME = os.path.basename(__file__)
 
 T_google_api_key = Annotated[str, typer.Option(..., envvar="GOOGLE_API_KEY")]
+T_gemini_response_mode = Annotated[
+    GeminiResponseMode,
+    typer.Option(
+        envvar="FCM_GEMINI_RESPONSE_MODE",
+        help=(
+            "multi_pass makes a gemini call per step, structured does it in one call, "
+            "streaming edits the slack message as the response generates"
+        ),
+    ),
+]
+
+T_gemini_cache_size = Annotated[
+    int,
+    typer.Option(
+        envvar="FCM_GEMINI_CACHE_SIZE",
+        help="max gemini responses cached in memory, 0 disables the cache",
+    ),
+]
+T_gemini_cache_ttl_seconds = Annotated[
+    int, typer.Option(envvar="FCM_GEMINI_CACHE_TTL_SECONDS")
+]
+T_gemini_cache_db = Annotated[
+    bool,
+    typer.Option(
+        envvar="FCM_GEMINI_CACHE_DB",
+        help="share cached gemini responses between workers through the database",
+    ),
+]
+
+T_gemini_max_concurrency = Annotated[
+    int,
+    typer.Option(
+        envvar="FCM_GEMINI_MAX_CONCURRENCY",
+        help="max concurrent gemini requests per model, shrinks on quota errors",
+    ),
+]
+T_gemini_model_concurrency = Annotated[
+    Optional[list[str]],
+    typer.Option(
+        envvar="FCM_GEMINI_MODEL_CONCURRENCY",
+        help="per model override as MODEL=LIMIT, can be repeated",
+    ),
+]
 
 
 def setup_gemini(
     ctx: typer.Context,
     google_api_key: T_google_api_key,
 ):
+    # imported here so commands that never talk to gemini do not load it
+    import google.generativeai as genai
+
     logger.debug("gemini setup starting")
     genai.configure(api_key=google_api_key)
     logger.debug("gemini setup complete")
     # mark true just so it's not None
     ctx.obj[FILENAME] = True
+
+
+def setup_gemini_cache(
+    ctx: typer.Context,
+    cache_size: T_gemini_cache_size,
+    cache_ttl_seconds: T_gemini_cache_ttl_seconds,
+    cache_db: T_gemini_cache_db,
+):
+    if cache_size <= 0:
+        logger.info("gemini response cache disabled")
+        return
+    logger.debug("gemini cache setup starting")
+    init_gemini_response_cache(
+        max_entries=cache_size,
+        ttl=datetime.timedelta(seconds=cache_ttl_seconds),
+        use_db=cache_db,
+    )
+    logger.info(
+        "gemini response cache enabled, size=%s ttl=%ss db=%s",
+        cache_size,
+        cache_ttl_seconds,
+        cache_db,
+    )
+    logger.debug("gemini cache setup complete")
+
+
+def setup_gemini_pool(
+    ctx: typer.Context,
+    max_concurrency: T_gemini_max_concurrency,
+    model_concurrency: T_gemini_model_concurrency = None,
+):
+    from friendly_computing_machine.gemini.pool import init_gemini_model_pool
+
+    logger.debug("gemini pool setup starting")
+    max_concurrency_by_model = {}
+    for override in model_concurrency or []:
+        model_name, _, limit = override.rpartition("=")
+        if not model_name or not limit.isdigit():
+            raise typer.BadParameter(
+                f"expected MODEL=LIMIT, got {override}",
+                param_hint="--gemini-model-concurrency",
+            )
+        max_concurrency_by_model[model_name] = int(limit)
+    init_gemini_model_pool(max_concurrency, max_concurrency_by_model)
+    logger.info(
+        "gemini model pool enabled, max_concurrency=%s overrides=%s",
+        max_concurrency,
+        max_concurrency_by_model,
+    )
+    logger.debug("gemini pool setup complete")
@@ -3,7 +3,6 @@ import os
 
 import typer
 from opentelemetry._logs import set_logger_provider
-from opentelemetry.exporter.otlp.proto.grpc._log_exporter import OTLPLogExporter
 from opentelemetry.sdk._logs import LoggerProvider, LoggingHandler
 from opentelemetry.sdk._logs.export import BatchLogRecordProcessor, ConsoleLogExporter
 from opentelemetry.sdk.resources import Resource
@@ -33,6 +32,11 @@ def setup_logging(
     set_logger_provider(logger_provider)
 
     if log_otlp:
+        # grpc and protobuf are slow to import, only pay for them when exporting
+        from opentelemetry.exporter.otlp.proto.grpc._log_exporter import (
+            OTLPLogExporter,
+        )
+
         otlp_exporter = OTLPLogExporter(
             endpoint=os.getenv("OTEL_EXPORTER_OTLP_LOGS_ENDPOINT")
             or "http://0.0.0.0:4317",
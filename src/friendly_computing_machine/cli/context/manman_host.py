@@ -11,6 +11,7 @@ from friendly_computing_machine.manman.api import (
     ManManStatusAPI,
     OldManManAPI,
 )
+from friendly_computing_machine.manman.catalog import init_game_server_catalog
 
 logger = logging.getLogger(__name__)
 FILENAME = os.path.basename(__file__)
@@ -23,6 +24,13 @@ class SupportedAPI(Enum):
 
 
 T_manman_host_url = Annotated[str, typer.Option(..., envvar="MANMAN_HOST_URL")]
+T_manman_catalog_ttl_seconds = Annotated[
+    float,
+    typer.Option(
+        envvar="FCM_MANMAN_CATALOG_TTL_SECONDS",
+        help="how old the cached game server configs can get before they are refreshed",
+    ),
+]
 
 
 def setup_old_manman_api(
@@ -68,3 +76,16 @@ def setup_manman_experience_api(
     ManManExperienceAPI.init(url + "/experience")
     logger.info(f"ManMan Experience API initialized with host: {url}")
     ctx.obj.setdefault(FILENAME, {})[SupportedAPI.experience] = ManManExperienceAPI
+
+
+def setup_game_server_catalog(
+    ctx: typer.Context,
+    ttl_seconds: T_manman_catalog_ttl_seconds,
+):
+    """
+    Setup the game server catalog, needs the old ManMan API.
+    """
+    logger.debug("game server catalog setup starting")
+    init_game_server_catalog(ttl_seconds)
+    logger.info("game server catalog enabled, ttl %ss", ttl_seconds)
+    logger.debug("game server catalog setup complete")
@@ -25,6 +25,20 @@ T_rabbitmq_ssl_hostname = Annotated[
 T_rabbitmq_vhost = Annotated[
     Optional[str], typer.Option(..., envvar="FCM_RABBITMQ_VHOST")
 ]
+T_rabbitmq_heartbeat = Annotated[
+    Optional[int],
+    typer.Option(
+        envvar="FCM_RABBITMQ_HEARTBEAT",
+        help="seconds between heartbeats, a dead connection is noticed after about two missed ones",
+    ),
+]
+T_rabbitmq_prefetch_count = Annotated[
+    int,
+    typer.Option(
+        envvar="FCM_RABBITMQ_PREFETCH_COUNT",
+        help="unacked messages the broker may send ahead of processing",
+    ),
+]
 
 FILENAME = os.path.basename(__file__)
 logger = logging.getLogger(__name__)
@@ -39,6 +53,7 @@ def setup_rabbitmq(
     rabbitmq_enable_ssl: T_rabbitmq_enable_ssl = None,
     rabbitmq_ssl_hostname: T_rabbitmq_ssl_hostname = None,
     rabbitmq_vhost: T_rabbitmq_vhost = None,
+    rabbitmq_heartbeat: T_rabbitmq_heartbeat = None,
 ):
     logger.debug("rabbitmq setup starting")
     ctx.obj[FILENAME] = {
@@ -49,6 +64,7 @@ def setup_rabbitmq(
         "rabbitmq_enable_ssl": rabbitmq_enable_ssl,
         "rabbitmq_ssl_hostname": rabbitmq_ssl_hostname,
         "rabbitmq_vhost": rabbitmq_vhost,
+        "rabbitmq_heartbeat": rabbitmq_heartbeat,
     }
     init_rabbitmq(
         rabbitmq_host=rabbitmq_host,
@@ -58,5 +74,6 @@ def setup_rabbitmq(
         rabbitmq_enable_ssl=rabbitmq_enable_ssl,
         rabbitmq_ssl_hostname=rabbitmq_ssl_hostname,
         rabbitmq_vhost=rabbitmq_vhost,
+        rabbitmq_heartbeat=rabbitmq_heartbeat,
     )
     logger.debug("rabbitmq setup complete")
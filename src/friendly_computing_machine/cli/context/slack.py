@@ -5,11 +5,19 @@ from typing import Annotated
 import typer
 
 from friendly_computing_machine.bot.app import init_web_client
+from friendly_computing_machine.bot.special_channel import init_special_channel_routing
 
 # Slack App Token - for Socket Mode (real-time events)
 T_slack_app_token = Annotated[str, typer.Option(..., envvar="SLACK_APP_TOKEN")]
 # Slack Bot Token - for Web API calls (posting messages, opening modals)
 T_slack_bot_token = Annotated[str, typer.Option(..., envvar="SLACK_BOT_TOKEN")]
+T_special_channel_refresh_seconds = Annotated[
+    float,
+    typer.Option(
+        envvar="FCM_SPECIAL_CHANNEL_REFRESH_SECONDS",
+        help="how often the special channel routing table is reloaded from the database",
+    ),
+]
 FILENAME = os.path.basename(__file__)
 logger = logging.getLogger(__name__)
 
@@ -54,3 +62,13 @@ def setup_slack_web_client_only(
     }
     init_web_client(slack_bot_token)
     logger.debug("slack bot-only setup complete")
+
+
+def setup_special_channel_routing(
+    ctx: typer.Context,
+    refresh_seconds: T_special_channel_refresh_seconds,
+):
+    logger.debug("special channel routing setup starting")
+    init_special_channel_routing(refresh_seconds)
+    logger.info("special channel routing enabled, refresh every %ss", refresh_seconds)
+    logger.debug("special channel routing setup complete")
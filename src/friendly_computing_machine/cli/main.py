@@ -1,23 +1,48 @@
+import importlib
 import logging
+from typing import Optional
 
+import click
 import typer
-from temporalio import workflow
-
-# TODO - this is working, but should it? is this just the same as doing all?
-# anyway not doing anything super important so I'm sure it's fine.
-# I'm not sure this is the right way to do this but whatever going to do it until it breaks
-with workflow.unsafe.imports_passed_through():
-    from friendly_computing_machine.cli.bot_cli import app as bot_app
-    from friendly_computing_machine.cli.migration_cli import migration_app
-    from friendly_computing_machine.cli.subscribe_cli import app as subscribe_app
-    from friendly_computing_machine.cli.tools_cli import app as tool_app
-    from friendly_computing_machine.cli.workflow_cli import app as workflow_app
+from typer.core import TyperGroup
 
 logger = logging.getLogger(__name__)
 
-app = typer.Typer()
-app.add_typer(bot_app, name="bot")
-app.add_typer(migration_app, name="migration")
-app.add_typer(subscribe_app, name="subscribe")
-app.add_typer(tool_app, name="tools")
-app.add_typer(workflow_app, name="workflow")
+# subcommand name -> (module, typer app attribute)
+# each module is only imported when its subcommand is run, so a command only
+# pays for importing its own subsystem
+SUBCOMMANDS = {
+    "bot": ("friendly_computing_machine.cli.bot_cli", "app"),
+    "migration": ("friendly_computing_machine.cli.migration_cli", "migration_app"),
+    "subscribe": ("friendly_computing_machine.cli.subscribe_cli", "app"),
+    "tools": ("friendly_computing_machine.cli.tools_cli", "app"),
+    "workflow": ("friendly_computing_machine.cli.workflow_cli", "app"),
+}
+
+
+class LazySubcommandGroup(TyperGroup):
+    """
+    Group that imports a subcommand's typer app the first time it is looked up.
+    """
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted(SUBCOMMANDS)
+
+    def get_command(self, ctx: click.Context, name: str) -> Optional[click.Command]:
+        if name not in SUBCOMMANDS:
+            return None
+        module_name, attribute = SUBCOMMANDS[name]
+        sub_app = getattr(importlib.import_module(module_name), attribute)
+        command = typer.main.get_group(sub_app)
+        command.name = name
+        return command
+
+
+app = typer.Typer(cls=LazySubcommandGroup)
+
+
+@app.callback()
+def callback():
+    """
+    friendly computing machine
+    """
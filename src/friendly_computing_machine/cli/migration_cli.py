@@ -24,6 +24,7 @@ from friendly_computing_machine.models import (  # noqa: F401
     music_poll,
     slack,
     task,
+    watermark,
 )
 
 logger = logging.getLogger(__name__)
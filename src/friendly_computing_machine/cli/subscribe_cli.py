@@ -1,8 +1,14 @@
 import logging
+from typing import Annotated
 
 import typer
 
 from friendly_computing_machine.bot.subscribe.main import run_manman_subscribe
+from friendly_computing_machine.bot.subscribe.service import (
+    DEFAULT_COALESCE_WINDOW_SECONDS,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_PREFETCH_COUNT,
+)
 from friendly_computing_machine.cli.context.app_env import FILENAME as APP_ENV_FILENAME
 from friendly_computing_machine.cli.context.app_env import T_app_env, setup_app_env
 from friendly_computing_machine.cli.context.db import FILENAME as DB_FILENAME
@@ -15,9 +21,11 @@ from friendly_computing_machine.cli.context.manman_host import (
 )
 from friendly_computing_machine.cli.context.rabbitmq import (
     T_rabbitmq_enable_ssl,
+    T_rabbitmq_heartbeat,
     T_rabbitmq_host,
     T_rabbitmq_password,
     T_rabbitmq_port,
+    T_rabbitmq_prefetch_count,
     T_rabbitmq_ssl_hostname,
     T_rabbitmq_user,
     T_rabbitmq_vhost,
@@ -27,6 +35,10 @@ from friendly_computing_machine.cli.context.slack import (
     T_slack_bot_token,
     setup_slack_web_client_only,
 )
+from friendly_computing_machine.cli.context.temporal import (
+    T_temporal_host,
+    setup_temporal,
+)
 from friendly_computing_machine.db.util import should_run_migration
 from friendly_computing_machine.health import run_health_server
 
@@ -44,23 +56,27 @@ def callback(
     app_env: T_app_env,
     manman_host_url: T_manman_host_url,
     rabbitmq_host: T_rabbitmq_host,
+    temporal_host: T_temporal_host,
     rabbitmq_port: T_rabbitmq_port = 5672,
     rabbitmq_user: T_rabbitmq_user = None,
     rabbitmq_password: T_rabbitmq_password = None,
     rabbitmq_enable_ssl: T_rabbitmq_enable_ssl = False,
     rabbitmq_ssl_hostname: T_rabbitmq_ssl_hostname = None,
     rabbitmq_vhost: T_rabbitmq_vhost = "/",
+    rabbitmq_heartbeat: T_rabbitmq_heartbeat = 30,
     log_otlp: bool = False,
 ):
     """
     ManMan Subscribe Service - Event-driven microservice for manman notifications.
 
     Subscribes to RabbitMQ topics for worker and instance lifecycle events
-    and sends formatted Slack notifications with action buttons.
+    and forwards them to temporal, which sends formatted Slack notifications
+    with action buttons.
     """
     logger.debug("Subscribe CLI callback starting")
     setup_logging(ctx, log_otlp=log_otlp)
     setup_app_env(ctx, app_env)
+    setup_temporal(ctx, temporal_host, app_env)
     setup_slack_web_client_only(ctx, slack_bot_token)
     setup_old_manman_api(ctx, manman_host_url)
     setup_manman_status_api(ctx, manman_host_url)
@@ -73,6 +89,7 @@ def callback(
         rabbitmq_enable_ssl=rabbitmq_enable_ssl,
         rabbitmq_ssl_hostname=rabbitmq_ssl_hostname,
         rabbitmq_vhost=rabbitmq_vhost,
+        rabbitmq_heartbeat=rabbitmq_heartbeat,
     )
     logger.debug("Subscribe CLI callback complete")
 
@@ -82,6 +99,21 @@ def cli_run(
     ctx: typer.Context,
     database_url: T_database_url,
     skip_migration_check: bool = False,
+    rabbitmq_prefetch_count: T_rabbitmq_prefetch_count = DEFAULT_PREFETCH_COUNT,
+    concurrency: Annotated[
+        int,
+        typer.Option(
+            envvar="FCM_SUBSCRIBE_CONCURRENCY",
+            help="messages forwarded at once, events for one service stay in order",
+        ),
+    ] = DEFAULT_CONCURRENCY,
+    coalesce_window_seconds: Annotated[
+        float,
+        typer.Option(
+            envvar="FCM_SUBSCRIBE_COALESCE_WINDOW_SECONDS",
+            help="hold a service's status events this long and only forward the newest, 0 to disable",
+        ),
+    ] = DEFAULT_COALESCE_WINDOW_SECONDS,
 ):
     """
     Start the ManMan Subscribe Service.
@@ -102,4 +134,9 @@ def cli_run(
         logger.info("migration check passed, starting normally")
     run_health_server()
     logger.info("starting manman subscribe service")
-    run_manman_subscribe(app_env=ctx.obj[APP_ENV_FILENAME]["app_env"])
+    run_manman_subscribe(
+        app_env=ctx.obj[APP_ENV_FILENAME]["app_env"],
+        prefetch_count=rabbitmq_prefetch_count,
+        concurrency=concurrency,
+        coalesce_window_seconds=coalesce_window_seconds,
+    )
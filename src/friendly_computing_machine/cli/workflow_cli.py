@@ -1,5 +1,9 @@
 import asyncio
 import logging
+import statistics
+import time
+import uuid
+from typing import Annotated, Optional
 
 import typer
 
@@ -7,7 +11,17 @@ from friendly_computing_machine.cli.context.app_env import FILENAME as APP_ENV_F
 from friendly_computing_machine.cli.context.app_env import T_app_env, setup_app_env
 from friendly_computing_machine.cli.context.db import FILENAME as DB_FILENAME
 from friendly_computing_machine.cli.context.db import T_database_url, setup_db
-from friendly_computing_machine.cli.context.gemini import T_google_api_key, setup_gemini
+from friendly_computing_machine.cli.context.gemini import (
+    T_gemini_cache_db,
+    T_gemini_cache_size,
+    T_gemini_cache_ttl_seconds,
+    T_gemini_max_concurrency,
+    T_gemini_model_concurrency,
+    T_google_api_key,
+    setup_gemini,
+    setup_gemini_cache,
+    setup_gemini_pool,
+)
 from friendly_computing_machine.cli.context.log import setup_logging
 
 # from friendly_computing_machine.cli.context.slack import (
@@ -17,15 +31,25 @@ from friendly_computing_machine.cli.context.log import setup_logging
 # )
 from friendly_computing_machine.cli.context.slack import (
     T_slack_bot_token,
+    T_special_channel_refresh_seconds,
     setup_slack_web_client_only,
+    setup_special_channel_routing,
 )
 from friendly_computing_machine.cli.context.temporal import (
     T_temporal_host,
     setup_temporal,
 )
 from friendly_computing_machine.db.util import should_run_migration
+from friendly_computing_machine.gemini.response_mode import GeminiResponseMode
 from friendly_computing_machine.health import run_health_server
-from friendly_computing_machine.temporal.worker import run_worker
+from friendly_computing_machine.temporal.util import (
+    TaskQueue,
+    get_temporal_client_async,
+)
+from friendly_computing_machine.temporal.worker import (
+    reconcile_temporal_schedules,
+    run_worker,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +83,27 @@ def cli_run(
     database_url: T_database_url,
     slack_bot_token: T_slack_bot_token,
     skip_migration_check: bool = False,
+    queues: Annotated[
+        Optional[list[TaskQueue]],
+        typer.Option(
+            "--queue",
+            envvar="FCM_TEMPORAL_QUEUES",
+            help="task queue to serve, can be repeated. defaults to all queues",
+        ),
+    ] = None,
+    gemini_cache_size: T_gemini_cache_size = 1024,
+    gemini_cache_ttl_seconds: T_gemini_cache_ttl_seconds = 3600,
+    gemini_cache_db: T_gemini_cache_db = False,
+    gemini_max_concurrency: T_gemini_max_concurrency = 16,
+    gemini_model_concurrency: T_gemini_model_concurrency = None,
+    special_channel_refresh_seconds: T_special_channel_refresh_seconds = 30,
+    reconcile_schedules: Annotated[
+        bool,
+        typer.Option(
+            envvar="FCM_RECONCILE_SCHEDULES",
+            help="reconcile temporal schedules on startup. turn off when `reconcile-schedules` runs as a job",
+        ),
+    ] = True,
 ):
     setup_db(ctx, database_url)
     if skip_migration_check:
@@ -72,12 +117,96 @@ def cli_run(
         logger.info("migration check passed, starting normally")
 
     setup_gemini(ctx, google_api_key)
+    setup_gemini_cache(
+        ctx, gemini_cache_size, gemini_cache_ttl_seconds, gemini_cache_db
+    )
+    setup_gemini_pool(ctx, gemini_max_concurrency, gemini_model_concurrency)
     setup_slack_web_client_only(ctx, slack_bot_token)
+    setup_special_channel_routing(ctx, special_channel_refresh_seconds)
     run_health_server()
 
-    logger.info("starting temporal worker")
+    logger.info("starting temporal worker for queues %s", queues or "all")
     # TODO - pass down context
-    asyncio.run(run_worker(app_env=ctx.obj[APP_ENV_FILENAME]["app_env"]))
+    asyncio.run(
+        run_worker(
+            app_env=ctx.obj[APP_ENV_FILENAME]["app_env"],
+            queues=queues,
+            reconcile=reconcile_schedules,
+        )
+    )
+
+
+@app.command("reconcile-schedules")
+def cli_reconcile_schedules(ctx: typer.Context):
+    """
+    Create or update the temporal schedules, once, then exit.
+    """
+
+    async def _reconcile():
+        client = await get_temporal_client_async()
+        return await reconcile_temporal_schedules(
+            client, ctx.obj[APP_ENV_FILENAME]["app_env"]
+        )
+
+    results = asyncio.run(_reconcile())
+    for schedule_id, result in results.items():
+        typer.echo(f"{schedule_id}: {result}")
+
+
+@app.command("benchmark-wai")
+def cli_benchmark_wai(
+    slack_channel_slack_id: str,
+    prompt: str,
+    iterations: int = 5,
+    modes: Annotated[
+        Optional[list[GeminiResponseMode]],
+        typer.Option("--mode", help="response mode to run, can be repeated"),
+    ] = None,
+):
+    """
+    Run SlackContextGeminiWorkflow against a running worker and compare
+    end to end latency between gemini response modes.
+    Nothing is written to the channel summary. Only the streaming mode posts to
+    the channel, so it only runs when asked for with --mode.
+    """
+    # Lazy import to avoid pulling in workflow code during CLI parsing
+    from friendly_computing_machine.temporal.slack.workflow import (
+        SlackContextGeminiWorkflow,
+        SlackContextGeminiWorkflowParams,
+    )
+    from friendly_computing_machine.temporal.util import (
+        execute_workflow_async,
+        get_temporal_queue_name,
+    )
+
+    async def run_mode(response_mode: GeminiResponseMode) -> list[float]:
+        durations = []
+        for i in range(iterations):
+            start = time.perf_counter()
+            await execute_workflow_async(
+                SlackContextGeminiWorkflow.run,
+                SlackContextGeminiWorkflowParams(
+                    slack_channel_slack_id,
+                    prompt,
+                    response_mode=response_mode,
+                ),
+                id=f"benchmark-wai-{response_mode}-{uuid.uuid4()}",
+                task_queue=get_temporal_queue_name(TaskQueue.MAIN),
+            )
+            durations.append(time.perf_counter() - start)
+        return durations
+
+    default_modes = [GeminiResponseMode.MULTI_PASS, GeminiResponseMode.STRUCTURED]
+    for response_mode in modes or default_modes:
+        durations = asyncio.run(run_mode(response_mode))
+        logger.info(
+            "%s: n=%s mean=%.2fs p50=%.2fs max=%.2fs",
+            response_mode,
+            len(durations),
+            statistics.mean(durations),
+            statistics.median(durations),
+            max(durations),
+        )
 
 
 @app.command("test")
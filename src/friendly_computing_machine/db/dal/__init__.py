@@ -6,19 +6,29 @@ All functions are exposed here for backward compatibility.
 
 # Import all functions from submodules for backward compatibility
 from .genai_dal import (
+    delete_expired_genai_response_cache,
+    get_genai_channel_summary,
+    get_genai_response_cache,
     get_genai_text_by_id,
     get_genai_texts,
     get_genai_texts_by_slack_channel,
     insert_genai_text,
+    save_genai_channel_summary,
     update_genai_text_response,
+    upsert_genai_response_cache,
 )
 from .manman_dal import (
     delete_manman_status_update,
+    get_manman_status_slack_message_ts,
+    get_manman_status_slack_messages,
     get_manman_status_update_by_id,
     get_manman_status_update_from_create,
     get_manman_status_updates,
+    get_manman_status_updates_since,
     insert_manman_status_update,
     update_manman_status_update,
+    upsert_manman_status_slack_messages,
+    upsert_manman_status_update_returning_slack_message_ts,
 )
 from .music_poll_dal import (
     delete_music_poll,
@@ -43,6 +53,7 @@ from .music_poll_dal import (
 from .slack_dal import (
     find_poll_instance_messages,
     get_bot_slack_user_slack_ids,
+    get_enabled_slack_special_channels,
     get_music_poll_channel_slack_ids,
     get_slack_channel,
     get_slack_command_by_id,
@@ -51,9 +62,11 @@ from .slack_dal import (
     get_slack_special_channels_from_type,
     get_slack_team_id_map,
     get_slack_teams,
+    get_slack_user_slack_ids,
     get_user_teams_from_messages,
     insert_message,
     insert_slack_command,
+    replace_slack_user_staging,
     select_distinct_slack_team_slack_id_from_slack_message,
     update_slack_command,
     upsert_message,
@@ -68,11 +81,16 @@ from .task_dal import (
     upsert_task,
     upsert_tasks,
 )
+from .watermark_dal import (
+    get_watermark,
+    upsert_watermark,
+)
 
 __all__ = [
     # Slack functions
     "get_music_poll_channel_slack_ids",
     "get_bot_slack_user_slack_ids",
+    "get_slack_user_slack_ids",
     "insert_message",
     "upsert_message",
     "select_distinct_slack_team_slack_id_from_slack_message",
@@ -83,6 +101,7 @@ __all__ = [
     "get_user_teams_from_messages",
     "upsert_slack_users",
     "upsert_slack_users_activity",
+    "replace_slack_user_staging",
     "get_slack_channel",
     "find_poll_instance_messages",
     "insert_slack_command",
@@ -90,6 +109,7 @@ __all__ = [
     "update_slack_command",
     "get_slack_special_channel_type_from_name",
     "get_slack_special_channels_from_type",
+    "get_enabled_slack_special_channels",
     "get_slack_message_from_id",
     # Task functions
     "upsert_tasks",
@@ -102,6 +122,11 @@ __all__ = [
     "get_genai_texts_by_slack_channel",
     "get_genai_text_by_id",
     "update_genai_text_response",
+    "get_genai_channel_summary",
+    "save_genai_channel_summary",
+    "get_genai_response_cache",
+    "upsert_genai_response_cache",
+    "delete_expired_genai_response_cache",
     # Music Poll functions
     "insert_music_poll",
     "get_music_poll_by_id",
@@ -125,7 +150,15 @@ __all__ = [
     "insert_manman_status_update",
     "get_manman_status_update_by_id",
     "get_manman_status_updates",
+    "get_manman_status_updates_since",
     "update_manman_status_update",
     "delete_manman_status_update",
     "get_manman_status_update_from_create",
+    "get_manman_status_slack_messages",
+    "upsert_manman_status_slack_messages",
+    "upsert_manman_status_update_returning_slack_message_ts",
+    "get_manman_status_slack_message_ts",
+    # Watermark functions
+    "get_watermark",
+    "upsert_watermark",
 ]
@@ -4,10 +4,18 @@ import datetime
 import logging
 from typing import Optional
 
-from sqlmodel import Session, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session, delete, select, update
 
 from friendly_computing_machine.db.util import SessionManager
-from friendly_computing_machine.models.genai import GenAIText, GenAITextCreate
+from friendly_computing_machine.models.genai import (
+    GenAIChannelSummary,
+    GenAIChannelSummaryCreate,
+    GenAIResponseCache,
+    GenAIResponseCacheCreate,
+    GenAIText,
+    GenAITextCreate,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -75,3 +83,96 @@ def update_genai_text_response(
             session.commit()
             session.refresh(genai_text)
         return genai_text
+
+
+def get_genai_channel_summary(
+    slack_channel_slack_id: str, session: Optional[Session] = None
+) -> GenAIChannelSummary | None:
+    """Get the rolling GenAI summary for a Slack channel."""
+    with SessionManager(session) as session:
+        stmt = select(GenAIChannelSummary).where(
+            GenAIChannelSummary.slack_channel_slack_id == slack_channel_slack_id
+        )
+        return session.exec(stmt).one_or_none()
+
+
+def save_genai_channel_summary(
+    channel_summary: GenAIChannelSummaryCreate,
+    expected: Optional[GenAIChannelSummary],
+    session: Optional[Session] = None,
+) -> bool:
+    """
+    Save the rolling GenAI summary for a Slack channel, but only over the summary
+    it was folded onto: the stored row must still be at the genai_text_id and
+    updated_at of expected, or not exist when that is None. Overlapping folds in
+    one channel would otherwise overwrite each other.
+    Returns whether the row was written.
+    """
+    with SessionManager(session) as session:
+        if expected is None:
+            stmt = (
+                insert(GenAIChannelSummary)
+                .values(**channel_summary.model_dump())
+                .on_conflict_do_nothing(index_elements=["slack_channel_slack_id"])
+            )
+        else:
+            stmt = (
+                update(GenAIChannelSummary)
+                .where(
+                    GenAIChannelSummary.slack_channel_slack_id
+                    == channel_summary.slack_channel_slack_id,
+                    GenAIChannelSummary.genai_text_id == expected.genai_text_id,
+                    # the id does not move when an older request is folded in
+                    GenAIChannelSummary.updated_at == expected.updated_at,
+                )
+                .values(
+                    genai_text_id=channel_summary.genai_text_id,
+                    summary=channel_summary.summary,
+                    updated_at=channel_summary.updated_at,
+                )
+            )
+        row_count = session.exec(stmt).rowcount
+        session.commit()
+    return row_count > 0
+
+
+def get_genai_response_cache(
+    key: str, session: Optional[Session] = None
+) -> GenAIResponseCache | None:
+    """Get an unexpired cached GenAI response by key."""
+    with SessionManager(session) as session:
+        stmt = select(GenAIResponseCache).where(
+            GenAIResponseCache.key == key,
+            GenAIResponseCache.expires_at > datetime.datetime.now(),
+        )
+        return session.exec(stmt).one_or_none()
+
+
+def upsert_genai_response_cache(
+    cache_entry: GenAIResponseCacheCreate, session: Optional[Session] = None
+) -> None:
+    """Insert or overwrite a cached GenAI response by key."""
+    with SessionManager(session) as session:
+        insert_stmt = insert(GenAIResponseCache).values(**cache_entry.model_dump())
+        update_stmt = insert_stmt.on_conflict_do_update(
+            index_elements=["key"],
+            set_={
+                "gemini_model": insert_stmt.excluded.gemini_model,
+                "response": insert_stmt.excluded.response,
+                "created_at": insert_stmt.excluded.created_at,
+                "expires_at": insert_stmt.excluded.expires_at,
+            },
+        )
+        session.exec(update_stmt)
+        session.commit()
+
+
+def delete_expired_genai_response_cache(session: Optional[Session] = None) -> int:
+    """Delete expired cached GenAI responses."""
+    with SessionManager(session) as session:
+        stmt = delete(GenAIResponseCache).where(
+            GenAIResponseCache.expires_at <= datetime.datetime.now()
+        )
+        row_count = session.exec(stmt).rowcount
+        session.commit()
+    return row_count
@@ -1,5 +1,6 @@
 """ManMan model DAL functions."""
 
+import datetime
 import logging
 from typing import Optional
 
@@ -10,7 +11,9 @@ from friendly_computing_machine.db.util import SessionManager, db_update
 from friendly_computing_machine.models.manman import (
     ManManStatusUpdate,
     ManManStatusUpdateCreate,
+    ManManStatusUpdateSlackMessage,
 )
+from friendly_computing_machine.models.slack import SlackMessage
 
 logger = logging.getLogger(__name__)
 
@@ -51,11 +54,12 @@ def upsert_manman_status_update(
             if k not in ["service_type", "service_id"]
         }
         # Handle conflict on (service_type, service_id) unique constraint
-        # Only update if the new as_of is later than the existing one
+        # Only update if the new as_of is not older than the existing one
         update_stmt = insert_stmt.on_conflict_do_update(
             index_elements=["service_type", "service_id"],
             set_=update_dict,
-            where=(ManManStatusUpdate.as_of < insert_stmt.excluded.as_of),
+            # equal as_of re-applies the same update, so retries do not fail
+            where=(ManManStatusUpdate.as_of <= insert_stmt.excluded.as_of),
         ).returning(ManManStatusUpdate)
 
         # Execute the statement and get the result
@@ -71,6 +75,89 @@ def upsert_manman_status_update(
         return ret_res
 
 
+def upsert_manman_status_update_returning_slack_message_ts(
+    manman_status_update: ManManStatusUpdateCreate, session: Optional[Session] = None
+) -> tuple[Optional[ManManStatusUpdate], dict[int, datetime.datetime]]:
+    """Upsert a ManMan status update and get the ts of its slack messages in one statement.
+
+    The upsert runs in a CTE that the slack messages are left joined onto, so the
+    row and its messages come back in a single round trip.
+
+    Returns:
+        The upserted row, None if the stored row is newer and was left alone, and
+        the slack message ts by slack channel id
+    """
+    with SessionManager(session) as session:
+        values_dict = manman_status_update.model_dump(exclude_unset=True)
+        insert_stmt = insert(ManManStatusUpdate).values(**values_dict)
+        upserted = (
+            insert_stmt.on_conflict_do_update(
+                index_elements=["service_type", "service_id"],
+                set_={
+                    k: v
+                    for k, v in values_dict.items()
+                    if k not in ["service_type", "service_id"]
+                },
+                where=(ManManStatusUpdate.as_of <= insert_stmt.excluded.as_of),
+            )
+            .returning(*ManManStatusUpdate.__table__.columns)
+            .cte("upserted")
+        )
+        stmt = (
+            select(
+                upserted,
+                ManManStatusUpdateSlackMessage.slack_channel_id,
+                SlackMessage.ts,
+            )
+            .outerjoin(
+                ManManStatusUpdateSlackMessage,
+                ManManStatusUpdateSlackMessage.manman_status_update_id == upserted.c.id,
+            )
+            .outerjoin(
+                SlackMessage,
+                SlackMessage.id == ManManStatusUpdateSlackMessage.slack_message_id,
+            )
+        )
+        rows = session.exec(stmt).all()
+        session.commit()
+
+        if not rows:
+            return None, {}
+        status_update = ManManStatusUpdate.model_validate(
+            {column.name: rows[0]._mapping[column] for column in upserted.columns}
+        )
+        slack_message_ts = {
+            row.slack_channel_id: row.ts
+            for row in rows
+            if row.slack_channel_id is not None
+        }
+        return status_update, slack_message_ts
+
+
+def get_manman_status_slack_message_ts(
+    service_type: str, service_id: int, session: Optional[Session] = None
+) -> dict[int, datetime.datetime]:
+    """Get the ts of the slack messages posted for a service, by slack channel id."""
+    with SessionManager(session) as session:
+        stmt = (
+            select(ManManStatusUpdateSlackMessage.slack_channel_id, SlackMessage.ts)
+            .join(
+                ManManStatusUpdate,
+                ManManStatusUpdate.id
+                == ManManStatusUpdateSlackMessage.manman_status_update_id,
+            )
+            .join(
+                SlackMessage,
+                SlackMessage.id == ManManStatusUpdateSlackMessage.slack_message_id,
+            )
+            .where(
+                ManManStatusUpdate.service_type == service_type,
+                ManManStatusUpdate.service_id == service_id,
+            )
+        )
+        return dict(session.exec(stmt).all())
+
+
 def get_manman_status_update_by_id(
     manman_status_update_id: int, session: Optional[Session] = None
 ) -> ManManStatusUpdate | None:
@@ -108,6 +195,20 @@ def get_manman_status_updates(
         return list(session.exec(stmt).all())
 
 
+def get_manman_status_updates_since(
+    as_of: datetime.datetime, session: Optional[Session] = None
+) -> list[ManManStatusUpdate]:
+    """Get the ManMan status updates at or after as_of, oldest first."""
+    with SessionManager(session) as session:
+        # range scan on idx_as_of_service
+        stmt = (
+            select(ManManStatusUpdate)
+            .where(ManManStatusUpdate.as_of >= as_of)
+            .order_by(ManManStatusUpdate.as_of)
+        )
+        return list(session.exec(stmt).all())
+
+
 def update_manman_status_update(
     manman_status_update: ManManStatusUpdate,
     session: Optional[Session] = None,
@@ -131,6 +232,60 @@ def update_manman_status_update(
     return manman_status_update
 
 
+def get_manman_status_slack_messages(
+    manman_status_update_id: int, session: Optional[Session] = None
+) -> dict[int, SlackMessage]:
+    """Get the slack messages posted for a status update, by slack channel id."""
+    with SessionManager(session) as session:
+        stmt = (
+            select(ManManStatusUpdateSlackMessage.slack_channel_id, SlackMessage)
+            .join(
+                SlackMessage,
+                SlackMessage.id == ManManStatusUpdateSlackMessage.slack_message_id,
+            )
+            .where(
+                ManManStatusUpdateSlackMessage.manman_status_update_id
+                == manman_status_update_id
+            )
+        )
+        return {
+            slack_channel_id: slack_message
+            for slack_channel_id, slack_message in session.exec(stmt).all()
+        }
+
+
+def upsert_manman_status_slack_messages(
+    manman_status_update_id: int,
+    slack_message_ids: dict[int, int],
+    session: Optional[Session] = None,
+) -> int:
+    """Link slack messages, by slack channel id, to a status update.
+
+    Returns:
+        Number of links written
+    """
+    if not slack_message_ids:
+        return 0
+    with SessionManager(session) as session:
+        insert_stmt = insert(ManManStatusUpdateSlackMessage).values(
+            [
+                {
+                    "manman_status_update_id": manman_status_update_id,
+                    "slack_channel_id": slack_channel_id,
+                    "slack_message_id": slack_message_id,
+                }
+                for slack_channel_id, slack_message_id in slack_message_ids.items()
+            ]
+        )
+        upsert_stmt = insert_stmt.on_conflict_do_update(
+            index_elements=["manman_status_update_id", "slack_channel_id"],
+            set_={"slack_message_id": insert_stmt.excluded.slack_message_id},
+        )
+        result = session.exec(upsert_stmt)
+        session.commit()
+        return result.rowcount
+
+
 def delete_manman_status_update(
     manman_status_update_id: int, session: Optional[Session] = None
 ) -> bool:
@@ -1,9 +1,10 @@
 """Slack model DAL functions."""
 
+import datetime
 import logging
 from typing import Optional
 
-from sqlmodel import Session, and_, or_, select
+from sqlmodel import Session, and_, delete, or_, select
 
 from friendly_computing_machine.db.util import SessionManager, db_update
 from friendly_computing_machine.models.music_poll import MusicPoll, MusicPollInstance
@@ -19,6 +20,7 @@ from friendly_computing_machine.models.slack import (
     SlackTeamCreate,
     SlackUser,
     SlackUserCreate,
+    SlackUserStaging,
 )
 
 logger = logging.getLogger(__name__)
@@ -50,6 +52,14 @@ def get_bot_slack_user_slack_ids() -> set[str]:
     return {row for row in results}
 
 
+def get_slack_user_slack_ids() -> set[str]:
+    """Get Slack IDs of all known users."""
+    stmt = select(SlackUser.slack_id)
+    with SessionManager() as session:
+        results = session.exec(stmt)
+    return {row for row in results}
+
+
 def insert_message(in_message: SlackMessageCreate) -> SlackMessage:
     """Insert a new Slack message."""
     message = SlackMessage(
@@ -226,6 +236,33 @@ def upsert_slack_users_activity(
     return result
 
 
+def replace_slack_user_staging(
+    run_id: str,
+    slack_users: list[SlackUserCreate],
+    session: Optional[Session] = None,
+) -> int:
+    """Stage Slack users for a run, replacing anything already staged for that run."""
+    with SessionManager(session) as session:
+        # retries of the same run should not stage the same users twice
+        session.exec(delete(SlackUserStaging).where(SlackUserStaging.run_id == run_id))
+        created_at = datetime.datetime.now()
+        session.add_all(
+            [
+                SlackUserStaging(
+                    run_id=run_id,
+                    slack_id=slack_user.slack_id,
+                    name=slack_user.name,
+                    is_bot=slack_user.is_bot,
+                    slack_team_slack_id=slack_user.slack_team_slack_id,
+                    created_at=created_at,
+                )
+                for slack_user in slack_users
+            ]
+        )
+        session.commit()
+    return len(slack_users)
+
+
 def get_slack_channel(
     slack_channel_id: int | None = None,
     slack_channel_slack_id: str | None = None,
@@ -343,3 +380,25 @@ def get_slack_special_channels_from_type(
             (result, result.slack_channel, result.slack_special_channel_type)
             for result in results
         ]
+
+
+def get_enabled_slack_special_channels(
+    session: Optional[Session] = None,
+) -> list[tuple[SlackSpecialChannel, SlackChannel, SlackSpecialChannelType]]:
+    """Get every enabled Slack special channel with its channel and type, in one query."""
+    with SessionManager(session) as session:
+        stmt = (
+            select(SlackSpecialChannel, SlackChannel, SlackSpecialChannelType)
+            .join(
+                SlackChannel,
+                SlackChannel.id == SlackSpecialChannel.slack_channel_id,
+            )
+            .join(
+                SlackSpecialChannelType,
+                SlackSpecialChannelType.id
+                == SlackSpecialChannel.slack_special_channel_type_id,
+            )
+            .where(SlackSpecialChannel.enabled)
+            .order_by(SlackSpecialChannel.id)
+        )
+        return list(session.exec(stmt).all())
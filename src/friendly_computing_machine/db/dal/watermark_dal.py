@@ -0,0 +1,37 @@
+"""Watermark model DAL functions."""
+
+import logging
+from typing import Optional
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session, select
+
+from friendly_computing_machine.db.util import SessionManager
+from friendly_computing_machine.models.watermark import Watermark, WatermarkCreate
+
+logger = logging.getLogger(__name__)
+
+
+def get_watermark(name: str, session: Optional[Session] = None) -> Watermark | None:
+    """Get a watermark by name."""
+    with SessionManager(session) as session:
+        stmt = select(Watermark).where(Watermark.name == name)
+        return session.exec(stmt).one_or_none()
+
+
+def upsert_watermark(
+    watermark: WatermarkCreate, session: Optional[Session] = None
+) -> None:
+    """Insert or overwrite a watermark by name."""
+    with SessionManager(session) as session:
+        values_dict = watermark.model_dump()
+        insert_stmt = insert(Watermark).values(**values_dict)
+        update_stmt = insert_stmt.on_conflict_do_update(
+            index_elements=["name"],
+            set_={
+                "value": insert_stmt.excluded.value,
+                "as_of": insert_stmt.excluded.as_of,
+            },
+        )
+        session.exec(update_stmt)
+        session.commit()
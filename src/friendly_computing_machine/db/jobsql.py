@@ -88,7 +88,7 @@ def backfill_music_poll_instance_next_id(in_session: Optional[Session] = None):
         session.commit()
 
 
-def delete_slack_message_duplicates():
+def delete_slack_message_duplicates() -> int:
     with SessionManager() as session:
         # too lazy to redo with sqlmodel
         slack_id_dupe_count = session.execute(
@@ -125,9 +125,10 @@ def delete_slack_message_duplicates():
             slack_ts_dupe_count,
             slack_id_dupe_count + slack_ts_dupe_count,
         )
+    return slack_id_dupe_count + slack_ts_dupe_count
 
 
-def backfill_slack_messages_slack_user_id():
+def backfill_slack_messages_slack_user_id() -> int:
     with SessionManager() as session:
         stmt = (
             update(SlackMessage)
@@ -141,13 +142,16 @@ def backfill_slack_messages_slack_user_id():
                 )
             )
         )
-        session.exec(stmt)
+        row_count = session.exec(stmt).rowcount
         session.commit()
         # not done - slack_parent_user_id
-        logger.info("backfill_slack_messages_slack_user_id complete")
+        logger.info(
+            "backfill_slack_messages_slack_user_id complete, row_count=%s", row_count
+        )
+    return row_count
 
 
-def backfill_slack_messages_slack_channel_id():
+def backfill_slack_messages_slack_channel_id() -> int:
     with SessionManager() as session:
         stmt = (
             update(SlackMessage)
@@ -161,12 +165,15 @@ def backfill_slack_messages_slack_channel_id():
                 )
             )
         )
-        session.exec(stmt)
+        row_count = session.exec(stmt).rowcount
         session.commit()
-        logger.info("backfill_slack_messages_slack_channel_id complete")
+        logger.info(
+            "backfill_slack_messages_slack_channel_id complete, row_count=%s", row_count
+        )
+    return row_count
 
 
-def backfill_slack_messages_slack_team_id():
+def backfill_slack_messages_slack_team_id() -> int:
     with SessionManager() as session:
         stmt = (
             update(SlackMessage)
@@ -180,12 +187,15 @@ def backfill_slack_messages_slack_team_id():
                 )
             )
         )
-        session.exec(stmt)
+        row_count = session.exec(stmt).rowcount
         session.commit()
-        logger.info("backfill_slack_messages_slack_team_id complete")
+        logger.info(
+            "backfill_slack_messages_slack_team_id complete, row_count=%s", row_count
+        )
+    return row_count
 
 
-def backfill_genai_text_slack_channel_id(session: Optional[Session] = None):
+def backfill_genai_text_slack_channel_id(session: Optional[Session] = None) -> int:
     with SessionManager(session) as session:
         stmt = (
             update(GenAIText)
@@ -199,12 +209,15 @@ def backfill_genai_text_slack_channel_id(session: Optional[Session] = None):
                 )
             )
         )
-        session.exec(stmt)
+        row_count = session.exec(stmt).rowcount
         session.commit()
-        logger.info("backfill_genai_text_slack_channel_id complete")
+        logger.info(
+            "backfill_genai_text_slack_channel_id complete, row_count=%s", row_count
+        )
+    return row_count
 
 
-def backfill_genai_text_slack_user_id(session: Optional[Session] = None):
+def backfill_genai_text_slack_user_id(session: Optional[Session] = None) -> int:
     with SessionManager(session) as session:
         stmt = (
             update(GenAIText)
@@ -218,6 +231,70 @@ def backfill_genai_text_slack_user_id(session: Optional[Session] = None):
                 )
             )
         )
-        session.exec(stmt)
+        row_count = session.exec(stmt).rowcount
+        session.commit()
+        logger.info(
+            "backfill_genai_text_slack_user_id complete, row_count=%s", row_count
+        )
+    return row_count
+
+
+def merge_slack_user_staging(run_id: str) -> int:
+    """
+    Upsert the Slack users staged by a run into slackuser, then clear the staging rows.
+
+    Returns the number of users inserted or changed.
+    """
+    with SessionManager() as session:
+        row_count = session.execute(
+            text("""
+            insert into fcm.slackuser(slack_id, name, is_bot, slack_team_slack_id, slack_team_id)
+            select distinct on (sus.slack_id)
+                sus.slack_id, sus.name, sus.is_bot, sus.slack_team_slack_id, st.id
+            from fcm.slackuserstaging sus
+                left join fcm.slackteam st on st.slack_id = sus.slack_team_slack_id
+            where sus.run_id = :run_id
+            order by sus.slack_id, sus.id desc
+            on conflict (slack_id) do update
+            set name = excluded.name,
+                slack_team_slack_id = excluded.slack_team_slack_id,
+                slack_team_id = excluded.slack_team_id
+            -- skip the write entirely for unchanged users
+            where (slackuser.name, slackuser.slack_team_slack_id, slackuser.slack_team_id)
+                is distinct from (excluded.name, excluded.slack_team_slack_id, excluded.slack_team_id)
+        """),
+            {"run_id": run_id},
+        ).rowcount
+        # also clean up anything left behind by runs that never got this far
+        session.execute(
+            text("""
+            delete from fcm.slackuserstaging
+            where run_id = :run_id
+                or created_at < now() - interval '1 day'
+        """),
+            {"run_id": run_id},
+        )
         session.commit()
-        logger.info("backfill_genai_text_slack_user_id complete")
+        logger.info("merge_slack_user_staging complete, row_count=%s", row_count)
+    return row_count
+
+
+def get_slack_change_marker() -> dict[str, int | None]:
+    """
+    Get the newest id of every table the slack backfills read from.
+
+    All of these are primary key lookups, so this is cheap enough to run
+    before deciding if the backfills need to run at all.
+    """
+    with SessionManager() as session:
+        row = session.execute(
+            text("""
+            select
+                (select max(id) from fcm.slackmessage) as slack_message_id,
+                (select max(id) from fcm.genaitext) as genai_text_id,
+                (select max(id) from fcm.slackuser) as slack_user_id,
+                (select max(id) from fcm.slackchannel) as slack_channel_id,
+                (select max(id) from fcm.slackteam) as slack_team_id
+        """)
+        ).one()
+    return dict(row._mapping)
@@ -1,9 +1,8 @@
 import logging
 from textwrap import dedent
 
-import google.generativeai as genai
-
 from friendly_computing_machine.db.dal import get_genai_texts_by_slack_channel
+from friendly_computing_machine.gemini.pool import get_gemini_model
 from friendly_computing_machine.util import deprecated
 
 logger = logging.getLogger(__name__)
@@ -59,7 +58,7 @@ def generate_text_with_slack_context(
 def generate_text(user_name: str, prompt_text: str) -> tuple:
     try:
         # TODO - model name - using default for now
-        model = genai.GenerativeModel()
+        model = get_gemini_model()
         logger.info("about to generate response for %s", prompt_text[:100])
         response = model.generate_content(prompt_text)
 
@@ -0,0 +1,159 @@
+import asyncio
+import datetime
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Optional
+
+from opentelemetry import metrics
+
+from friendly_computing_machine.db.dal import (
+    delete_expired_genai_response_cache,
+    get_genai_response_cache,
+    upsert_genai_response_cache,
+)
+from friendly_computing_machine.models.genai import GenAIResponseCacheCreate
+
+logger = logging.getLogger(__name__)
+meter = metrics.get_meter(__name__)
+
+cache_lookup_counter = meter.create_counter(
+    "fcm.gemini.cache.lookups",
+    description="gemini response cache lookups, by result (memory_hit, db_hit, miss)",
+)
+
+__GLOBALS = {}
+
+# purge expired rows from the db tier every N writes
+DB_PURGE_INTERVAL = 100
+
+
+def make_cache_key(
+    model_name: str, generation_config: Optional[dict], prompt: str
+) -> str:
+    """
+    Hash everything that decides what gemini responds with.
+    """
+    payload = json.dumps(
+        {
+            "model_name": model_name,
+            "generation_config": generation_config or {},
+            "prompt": prompt,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class GeminiResponseCache:
+    """
+    Content addressed cache of gemini responses.
+
+    The memory tier is a per process LRU with a TTL. When use_db is set, misses fall
+    through to a postgres table so workers share responses with each other.
+    """
+
+    def __init__(self, max_entries: int, ttl: datetime.timedelta, use_db: bool = False):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.use_db = use_db
+        self.stats = Counter()
+        # key -> (monotonic expiry, response)
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db_write_count = 0
+
+    def _record(self, result: str, model_name: str):
+        self.stats[result] += 1
+        cache_lookup_counter.add(1, {"result": result, "model_name": model_name})
+
+    def _get_memory(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, response = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    def _set_memory(self, key: str, response: str):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl.total_seconds(), response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _set_db(self, key: str, model_name: str, response: str):
+        now = datetime.datetime.now()
+        upsert_genai_response_cache(
+            GenAIResponseCacheCreate(
+                key=key,
+                gemini_model=model_name,
+                response=response,
+                created_at=now,
+                expires_at=now + self.ttl,
+            )
+        )
+        self._db_write_count += 1
+        if self._db_write_count % DB_PURGE_INTERVAL == 0:
+            purged = delete_expired_genai_response_cache()
+            logger.info("purged %s expired gemini cache rows", purged)
+
+    async def get(self, key: str, model_name: str) -> Optional[str]:
+        response = self._get_memory(key)
+        if response is not None:
+            self._record("memory_hit", model_name)
+            return response
+
+        if self.use_db:
+            try:
+                cache_entry = await asyncio.to_thread(get_genai_response_cache, key)
+            except Exception:
+                # the cache is an optimization, never fail the request because of it
+                logger.exception("gemini cache db lookup failed")
+                cache_entry = None
+            if cache_entry is not None:
+                self._set_memory(key, cache_entry.response)
+                self._record("db_hit", model_name)
+                return cache_entry.response
+
+        self._record("miss", model_name)
+        return None
+
+    async def set(self, key: str, model_name: str, response: str):
+        self._set_memory(key, response)
+        if self.use_db:
+            try:
+                await asyncio.to_thread(self._set_db, key, model_name, response)
+            except Exception:
+                logger.exception("gemini cache db write failed")
+
+    def hit_rate(self) -> float:
+        lookups = sum(self.stats.values())
+        if lookups == 0:
+            return 0.0
+        return (self.stats["memory_hit"] + self.stats["db_hit"]) / lookups
+
+
+def init_gemini_response_cache(
+    max_entries: int, ttl: datetime.timedelta, use_db: bool = False
+) -> GeminiResponseCache:
+    if "response_cache" in __GLOBALS:
+        raise RuntimeError("double gemini response cache init")
+    cache = GeminiResponseCache(max_entries=max_entries, ttl=ttl, use_db=use_db)
+    __GLOBALS["response_cache"] = cache
+    return cache
+
+
+def get_gemini_response_cache() -> Optional[GeminiResponseCache]:
+    """
+    :return: the process wide response cache, None if caching was not enabled
+    """
+    return __GLOBALS.get("response_cache")
@@ -0,0 +1,214 @@
+import asyncio
+import contextlib
+import json
+import logging
+import threading
+import time
+from typing import AsyncIterator, Optional
+
+import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
+from opentelemetry import metrics
+
+logger = logging.getLogger(__name__)
+meter = metrics.get_meter(__name__)
+
+in_flight_counter = meter.create_up_down_counter(
+    "fcm.gemini.requests.in_flight",
+    description="gemini requests currently running",
+)
+queue_wait_histogram = meter.create_histogram(
+    "fcm.gemini.requests.queue_wait",
+    unit="s",
+    description="time spent waiting for a concurrency slot before calling gemini",
+)
+request_counter = meter.create_counter(
+    "fcm.gemini.requests",
+    description="gemini requests, by outcome (success, throttled, error)",
+)
+
+__GLOBALS = {}
+
+# quota and overload responses, these shrink the concurrency limit
+THROTTLE_EXCEPTIONS = (
+    google_exceptions.TooManyRequests,
+    google_exceptions.ServiceUnavailable,
+)
+
+
+class AIMDLimiter:
+    """
+    Concurrency limit that grows by about one slot per window of successful
+    requests and halves when gemini pushes back (additive increase, multiplicative decrease).
+
+    Not thread safe, it is meant to be used from the worker's event loop.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_limit: int,
+        min_limit: int = 1,
+        decrease_factor: float = 0.5,
+        decrease_cooldown_seconds: float = 5.0,
+    ):
+        self.name = name
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.decrease_factor = decrease_factor
+        self.decrease_cooldown_seconds = decrease_cooldown_seconds
+        self.limit = float(max_limit)
+        self.in_flight = 0
+        self._waiters: list[asyncio.Future] = []
+        self._last_decrease = float("-inf")
+
+    def _has_slot(self) -> bool:
+        return self.in_flight < max(self.min_limit, int(self.limit))
+
+    async def acquire(self):
+        start = time.monotonic()
+        while not self._has_slot():
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # woken and then cancelled before taking the slot, pass it on
+                if waiter.done() and not waiter.cancelled():
+                    self._wake_waiters()
+                raise
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self.in_flight += 1
+        attributes = {"model_name": self.name}
+        queue_wait_histogram.record(time.monotonic() - start, attributes)
+        in_flight_counter.add(1, attributes)
+
+    def release(self, outcome: str):
+        self.in_flight -= 1
+        attributes = {"model_name": self.name}
+        in_flight_counter.add(-1, attributes)
+        request_counter.add(1, {**attributes, "outcome": outcome})
+
+        if outcome == "throttled":
+            now = time.monotonic()
+            # a burst of in flight requests all failing together is one signal, not many
+            if now - self._last_decrease >= self.decrease_cooldown_seconds:
+                self._last_decrease = now
+                self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+                logger.warning(
+                    "gemini %s throttled, concurrency limit down to %s",
+                    self.name,
+                    int(self.limit),
+                )
+        elif outcome == "success" and self.limit < self.max_limit:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+        self._wake_waiters()
+
+    def _wake_waiters(self):
+        free_slots = max(self.min_limit, int(self.limit)) - self.in_flight
+        while free_slots > 0 and self._waiters:
+            waiter = self._waiters.pop(0)
+            if not waiter.done():
+                waiter.set_result(None)
+                free_slots -= 1
+
+    @contextlib.asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        await self.acquire()
+        outcome = "error"
+        try:
+            yield
+            outcome = "success"
+        except THROTTLE_EXCEPTIONS:
+            outcome = "throttled"
+            raise
+        finally:
+            self.release(outcome)
+
+
+class GeminiModelPool:
+    """
+    Process wide registry of gemini models, so they are built once per
+    generation config instead of per request, with a concurrency limiter per model.
+    """
+
+    def __init__(
+        self,
+        default_max_concurrency: int,
+        max_concurrency_by_model: Optional[dict[str, int]] = None,
+    ):
+        self.default_max_concurrency = default_max_concurrency
+        self.max_concurrency_by_model = max_concurrency_by_model or {}
+        self._models: dict[str, genai.GenerativeModel] = {}
+        self._limiters: dict[str, AIMDLimiter] = {}
+        # get_model is also called from sync code on other threads
+        self._lock = threading.Lock()
+
+    def get_model(
+        self, generation_config: Optional[dict] = None
+    ) -> genai.GenerativeModel:
+        config_key = json.dumps(generation_config or {}, sort_keys=True, default=str)
+        with self._lock:
+            model = self._models.get(config_key)
+            if model is None:
+                model = genai.GenerativeModel(generation_config=generation_config)
+                self._models[config_key] = model
+            return model
+
+    def get_limiter(self, model_name: str) -> AIMDLimiter:
+        with self._lock:
+            limiter = self._limiters.get(model_name)
+            if limiter is None:
+                limiter = AIMDLimiter(
+                    model_name,
+                    max_limit=self.max_concurrency_by_model.get(
+                        model_name, self.default_max_concurrency
+                    ),
+                )
+                self._limiters[model_name] = limiter
+            return limiter
+
+
+def init_gemini_model_pool(
+    default_max_concurrency: int,
+    max_concurrency_by_model: Optional[dict[str, int]] = None,
+) -> GeminiModelPool:
+    if "model_pool" in __GLOBALS:
+        raise RuntimeError("double gemini model pool init")
+    pool = GeminiModelPool(default_max_concurrency, max_concurrency_by_model)
+    __GLOBALS["model_pool"] = pool
+    return pool
+
+
+def get_gemini_model_pool() -> Optional[GeminiModelPool]:
+    """
+    :return: the process wide model pool, None if it was not set up
+    """
+    return __GLOBALS.get("model_pool")
+
+
+def get_gemini_model(generation_config: Optional[dict] = None) -> genai.GenerativeModel:
+    """
+    Get a model from the pool, or a fresh one when there is no pool.
+    """
+    pool = get_gemini_model_pool()
+    if pool is None:
+        return genai.GenerativeModel(generation_config=generation_config)
+    return pool.get_model(generation_config)
+
+
+@contextlib.asynccontextmanager
+async def gemini_request_slot(model_name: str) -> AsyncIterator[None]:
+    """
+    Hold a concurrency slot for model_name while calling gemini.
+    Does nothing when there is no pool.
+    """
+    pool = get_gemini_model_pool()
+    if pool is None:
+        yield
+        return
+    async with pool.get_limiter(model_name).slot():
+        yield
@@ -0,0 +1,74 @@
+from dataclasses import dataclass
+from typing import Sequence
+
+# rough average for english text, close enough for keeping prompts bounded
+CHARS_PER_TOKEN = 4
+TRUNCATION_MARKER = "...(truncated)"
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in text without calling the model.
+    """
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Cut text down to about max_tokens, marking that it was cut.
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    max_chars = max(0, max_tokens * CHARS_PER_TOKEN - len(TRUNCATION_MARKER))
+    return text[:max_chars] + TRUNCATION_MARKER
+
+
+@dataclass
+class BudgetedPrompt:
+    """
+    A prompt built by PromptBuilder, and what it took to fit the budget.
+    """
+
+    text: str
+    estimated_tokens: int
+    entries_included: int
+    entries_dropped: int
+
+
+class PromptBuilder:
+    """
+    Assemble a prompt from a header, a list of entries and a footer within a token budget.
+
+    Entries are expected oldest first. The newest entries are kept and the oldest
+    dropped once the budget runs out. Parts are joined once, so building is linear
+    in the size of the prompt.
+    """
+
+    def __init__(self, token_budget: int):
+        self.token_budget = token_budget
+
+    def build(
+        self,
+        entries: Sequence[str],
+        header: str = "",
+        footer: str = "",
+    ) -> BudgetedPrompt:
+        remaining = (
+            self.token_budget - estimate_tokens(header) - estimate_tokens(footer)
+        )
+        kept: list[str] = []
+        for entry in reversed(entries):
+            entry_tokens = estimate_tokens(entry)
+            if entry_tokens > remaining:
+                break
+            kept.append(entry)
+            remaining -= entry_tokens
+        kept.reverse()
+
+        text = "".join([header, *kept, footer])
+        return BudgetedPrompt(
+            text=text,
+            estimated_tokens=estimate_tokens(text),
+            entries_included=len(kept),
+            entries_dropped=len(entries) - len(kept),
+        )
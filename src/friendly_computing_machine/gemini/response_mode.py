@@ -0,0 +1,14 @@
+from enum import StrEnum
+
+
+class GeminiResponseMode(StrEnum):
+    """
+    How SlackContextGeminiWorkflow talks to gemini.
+    """
+
+    # separate calls for the vibe, the response and call to action detection
+    MULTI_PASS = "multi_pass"
+    # one structured output call returning the response, vibe and call to action together
+    STRUCTURED = "structured"
+    # like multi pass, but the response is streamed into a slack message as it generates
+    STREAMING = "streaming"
@@ -1,21 +1,66 @@
+import json
 import logging
 import socketserver
 import threading
+import urllib.parse
+from typing import Callable, Optional
 
 logger = logging.getLogger(__name__)
 
+__GLOBALS = {"routes": {}}
+
 # Minimal HTTP response (just enough for the liveness probe)
 HEALTH_RESPONSE = b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok"
 
+# query params -> json body
+T_health_route = Callable[[dict[str, list[str]]], dict]
+
+
+def register_health_route(path: str, route: T_health_route):
+    """
+    Serve route's json at path on the health server, every other path stays the liveness probe.
+    """
+    __GLOBALS["routes"][path] = route
+
+
+def _get_health_route(path: str) -> Optional[T_health_route]:
+    return __GLOBALS["routes"].get(path)
+
+
+def _json_response(status: str, body: dict) -> bytes:
+    content = json.dumps(body).encode()
+    return (
+        f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(content)}\r\n\r\n"
+    ).encode() + content
+
 
 class HealthCheckHandler(socketserver.BaseRequestHandler):
     def handle(self):
-        # We don't actually need to read the request.  Just send the 200 OK.
-        self.request.sendall(HEALTH_RESPONSE)
+        # a client that connects and says nothing should not hold a thread forever
+        self.request.settimeout(5)
+        # only the request line matters, e.g. GET /manman/status?since=3 HTTP/1.1
+        request_line = (
+            self.request.recv(4096).split(b"\r\n", 1)[0].decode(errors="replace")
+        )
+        parts = request_line.split(" ")
+        url = urllib.parse.urlsplit(parts[1] if len(parts) > 1 else "/")
+        route = _get_health_route(url.path)
+        if route is None:
+            self.request.sendall(HEALTH_RESPONSE)
+            return
+        try:
+            response = _json_response("200 OK", route(urllib.parse.parse_qs(url.query)))
+        except Exception:
+            logger.exception("health route %s failed", url.path)
+            response = _json_response("500 Internal Server Error", {"error": "failed"})
+        self.request.sendall(response)
 
 
 def _run_health_server():
-    with socketserver.TCPServer(("0.0.0.0", 7654), HealthCheckHandler) as server:
+    with socketserver.ThreadingTCPServer(
+        ("0.0.0.0", 7654), HealthCheckHandler
+    ) as server:
         server.serve_forever()
 
 
@@ -1,5 +1,9 @@
 # if these ever need to be broken up, we can move it into the class for tighter scope
-from typing import Generic, Type, TypeVar
+import time
+from typing import Generic, Optional, Type, TypeVar
+
+import urllib3
+from opentelemetry import metrics
 
 from external.manman_experience_api.api.default_api import (
     DefaultApi as ManManExperienceDefaultApi,
@@ -23,12 +27,88 @@ T_Configuration = TypeVar("T_Configuration")
 T_Client = TypeVar("T_Client")
 T_API = TypeVar("T_API")
 
+meter = metrics.get_meter(__name__)
+request_duration_histogram = meter.create_histogram(
+    "fcm.manman.api.duration",
+    unit="s",
+    description="manman api request latency, by api, method and status",
+)
+
+# slack bolt handles actions on 10 threads, each can hold one connection
+DEFAULT_POOL_SIZE = 10
+DEFAULT_CONNECT_TIMEOUT_SECONDS = 3.0
+DEFAULT_READ_TIMEOUT_SECONDS = 10.0
+DEFAULT_RETRIES = 2
+
+
+def build_retry(total: int = DEFAULT_RETRIES) -> urllib3.Retry:
+    """
+    Retry failed connections for any request, but only retry read errors and
+    gateway errors for idempotent methods, so a start or stop is never sent twice.
+    """
+    return urllib3.Retry(
+        total=total,
+        allowed_methods=urllib3.Retry.DEFAULT_ALLOWED_METHODS,
+        status_forcelist=(502, 503, 504),
+        backoff_factor=0.2,
+        # hand the last response back so the api raises its usual ApiException
+        raise_on_status=False,
+    )
+
+
+class _TimedRESTClient:
+    """
+    Wraps the generated rest client to default the request timeout and time each request.
+    """
+
+    def __init__(self, rest_client, api_name: str, timeout: tuple[float, float]):
+        self._rest_client = rest_client
+        self._api_name = api_name
+        self._timeout = timeout
+
+    def request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+    ):
+        status = "error"
+        start = time.perf_counter()
+        try:
+            response = self._rest_client.request(
+                method,
+                url,
+                headers=headers,
+                body=body,
+                post_params=post_params,
+                _request_timeout=_request_timeout or self._timeout,
+            )
+            status = response.status
+            return response
+        finally:
+            request_duration_histogram.record(
+                time.perf_counter() - start,
+                {"api": self._api_name, "method": method.upper(), "status": status},
+            )
+
+    def __getattr__(self, name):
+        return getattr(self._rest_client, name)
+
 
 class BaseManManAPI(Generic[T_Configuration, T_Client, T_API]):
-    """Base class for ManMan API clients."""
+    """
+    Base class for ManMan API clients.
+
+    Each api keeps one client with its own connection pool, so the connections
+    stay alive between calls, and hands out one shared api instance.
+    """
 
     _config: T_Configuration = None  # type: ignore
     _client: T_Client = None  # type: ignore
+    _api: Optional[T_API] = None
 
     # These will be set by subclasses
     _configuration_type: Type[T_Configuration] = None  # type: ignore
@@ -36,12 +116,28 @@ class BaseManManAPI(Generic[T_Configuration, T_Client, T_API]):
     _api_type: Type[T_API] = None  # type: ignore
 
     @classmethod
-    def init(cls, host: str):
+    def init(
+        cls,
+        host: str,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        connect_timeout_seconds: float = DEFAULT_CONNECT_TIMEOUT_SECONDS,
+        read_timeout_seconds: float = DEFAULT_READ_TIMEOUT_SECONDS,
+        retries: int = DEFAULT_RETRIES,
+    ):
         """Initialize the API client configuration."""
         if cls._config is not None:
             return
-        cls._config = cls._configuration_type(host=host)
-        cls._client = cls._api_client_type(configuration=cls._config)
+        config = cls._configuration_type(host=host, retries=build_retry(retries))
+        config.connection_pool_maxsize = pool_size
+        client = cls._api_client_type(configuration=config)
+        client.rest_client = _TimedRESTClient(
+            client.rest_client,
+            cls.__name__,
+            (connect_timeout_seconds, read_timeout_seconds),
+        )
+        cls._config = config
+        cls._client = client
+        cls._api = cls._api_type(api_client=client)
 
     @classmethod
     def _get_client(cls) -> T_Client:
@@ -55,7 +151,8 @@ class BaseManManAPI(Generic[T_Configuration, T_Client, T_API]):
     @classmethod
     def get_api(cls) -> T_API:
         """Get the API instance."""
-        return cls._api_type(api_client=cls._get_client())
+        cls._get_client()
+        return cls._api
 
 
 class OldManManAPI(BaseManManAPI[OldConfiguration, OldApiClient, OldDefaultApi]):
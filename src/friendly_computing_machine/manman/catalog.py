@@ -0,0 +1,139 @@
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+from external.old_manman_api.models.game_server_config import GameServerConfig
+from friendly_computing_machine.manman.api import OldManManAPI
+
+logger = logging.getLogger(__name__)
+
+__GLOBALS = {}
+
+
+def _fetch_game_server_configs() -> list[GameServerConfig]:
+    return OldManManAPI.get_api().get_game_servers_host_gameserver_get()
+
+
+class GameServerCatalog:
+    """
+    Game server configs from manman, by game_server_config_id.
+
+    Reads are served from memory. Once the configs are older than the ttl they
+    are still served while a background refresh replaces them
+    (stale-while-revalidate), so only the very first read waits on manman,
+    and a lookup of a config that is not there yet. A failed refresh keeps the
+    configs it had.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        fetch: Callable[[], list[GameServerConfig]] = _fetch_game_server_configs,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self._fetch = fetch
+        self._configs: Optional[dict[int, GameServerConfig]] = None
+        self._fetched_at = float("-inf")
+        self._lock = threading.Lock()
+        self._refreshing = False
+
+    def refresh(self) -> dict[int, GameServerConfig]:
+        configs = {config.game_server_config_id: config for config in self._fetch()}
+        self._configs = configs
+        self._fetched_at = time.monotonic()
+        logger.debug("game server catalog refreshed, %s configs", len(configs))
+        return configs
+
+    def _refresh_in_background(self):
+        try:
+            self.refresh()
+        except Exception:
+            logger.exception("game server catalog refresh failed, serving stale")
+        finally:
+            self._refreshing = False
+
+    def refresh_in_background(self):
+        """
+        Start a refresh without waiting on it, unless one is already running.
+        """
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(
+            target=self._refresh_in_background,
+            name="game-server-catalog",
+            daemon=True,
+        ).start()
+
+    def _get_configs(self) -> dict[int, GameServerConfig]:
+        configs = self._configs
+        if configs is None:
+            # nothing to serve yet, this one read has to wait
+            return self.refresh()
+        if time.monotonic() - self._fetched_at >= self.ttl_seconds:
+            self.refresh_in_background()
+        return configs
+
+    def get_configs(self) -> list[GameServerConfig]:
+        return list(self._get_configs().values())
+
+    def get_config(self, game_server_config_id: int) -> Optional[GameServerConfig]:
+        """
+        A config added since the last refresh is a miss, so a miss refreshes
+        once before giving up on it.
+        """
+        config = self._get_configs().get(game_server_config_id)
+        if config is not None:
+            return config
+        try:
+            configs = self.refresh()
+        except Exception:
+            logger.exception("game server catalog refresh failed, serving stale")
+            return None
+        return configs.get(game_server_config_id)
+
+
+def init_game_server_catalog(ttl_seconds: float) -> GameServerCatalog:
+    if "catalog" in __GLOBALS:
+        raise RuntimeError("double game server catalog init")
+    catalog = GameServerCatalog(ttl_seconds)
+    # warm it up so the first modal does not wait on manman either
+    catalog.refresh_in_background()
+    __GLOBALS["catalog"] = catalog
+    return catalog
+
+
+def get_game_server_catalog() -> Optional[GameServerCatalog]:
+    """
+    :return: the process wide game server catalog, None if it was not set up
+    """
+    return __GLOBALS.get("catalog")
+
+
+def get_game_server_configs() -> list[GameServerConfig]:
+    """
+    Get the game server configs from the catalog, or from manman when there is no catalog.
+    """
+    catalog = get_game_server_catalog()
+    if catalog is None:
+        return _fetch_game_server_configs()
+    return catalog.get_configs()
+
+
+def get_game_server_config(game_server_config_id: int) -> Optional[GameServerConfig]:
+    """
+    Get one game server config from the catalog, or from manman when there is no catalog.
+    """
+    catalog = get_game_server_catalog()
+    if catalog is None:
+        return next(
+            (
+                config
+                for config in _fetch_game_server_configs()
+                if config.game_server_config_id == game_server_config_id
+            ),
+            None,
+        )
+    return catalog.get_config(game_server_config_id)
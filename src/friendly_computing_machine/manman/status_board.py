@@ -0,0 +1,182 @@
+import datetime
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Iterable, Mapping, Optional
+
+from friendly_computing_machine.models.manman import ManManStatusUpdateBase
+
+logger = logging.getLogger(__name__)
+
+__GLOBALS = {}
+
+DEFAULT_MAX_CHANGES = 1024
+
+T_service_key = tuple[str, int]
+
+
+@dataclass(frozen=True, slots=True)
+class ManManServiceStatus:
+    """
+    The latest known status of a worker or game server instance.
+    """
+
+    service_type: str
+    service_id: int
+    current_status: str
+    as_of: datetime.datetime
+
+    @classmethod
+    def from_status_update(
+        cls, status_update: ManManStatusUpdateBase
+    ) -> "ManManServiceStatus":
+        return cls(
+            service_type=status_update.service_type,
+            service_id=status_update.service_id,
+            current_status=status_update.current_status,
+            as_of=status_update.as_of,
+        )
+
+
+@dataclass(frozen=True)
+class ManManStatusBoardSnapshot:
+    version: int
+    statuses: Mapping[T_service_key, ManManServiceStatus]
+
+
+class ManManStatusBoard:
+    """
+    Latest status per (service_type, service_id), held in memory.
+
+    Writers update it in place, the copy handed out by snapshot() is only made
+    when someone asks for one and is reused until the next change. Recent
+    changes are kept by version so pollers can ask for what changed since the
+    snapshot they hold.
+    """
+
+    def __init__(self, max_changes: int = DEFAULT_MAX_CHANGES):
+        self._lock = threading.Lock()
+        self._statuses: dict[T_service_key, ManManServiceStatus] = {}
+        self._snapshot: Optional[ManManStatusBoardSnapshot] = None
+        self._version = 0
+        # (version, key) of the most recent changes, oldest first
+        self._changes: deque[tuple[int, T_service_key]] = deque(maxlen=max_changes)
+
+    def _apply(
+        self,
+        statuses: dict[T_service_key, ManManServiceStatus],
+        status: ManManServiceStatus,
+    ) -> bool:
+        key = (status.service_type, status.service_id)
+        current = statuses.get(key)
+        # same ordering as the status upsert, an older event never replaces a newer one
+        if current is not None and current.as_of > status.as_of:
+            return False
+        if current == status:
+            return False
+        statuses[key] = status
+        self._version += 1
+        self._changes.append((self._version, key))
+        return True
+
+    def update(self, status: ManManServiceStatus) -> bool:
+        """
+        :return: whether the board changed
+        """
+        return self.update_many([status]) > 0
+
+    def update_many(self, statuses: Iterable[ManManServiceStatus]) -> int:
+        """
+        :return: how many services changed
+        """
+        with self._lock:
+            return sum(self._apply(self._statuses, status) for status in statuses)
+
+    def snapshot(self) -> ManManStatusBoardSnapshot:
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is None or snapshot.version != self._version:
+                snapshot = ManManStatusBoardSnapshot(
+                    self._version, MappingProxyType(dict(self._statuses))
+                )
+                self._snapshot = snapshot
+            return snapshot
+
+    def get(self, service_type: str, service_id: int) -> Optional[ManManServiceStatus]:
+        with self._lock:
+            return self._statuses.get((service_type, service_id))
+
+    def changes_since(
+        self, version: int
+    ) -> Optional[tuple[int, list[ManManServiceStatus]]]:
+        """
+        The services that changed after version, newest status each.
+
+        :return: the current version and the changed statuses, None if the
+            changes since version are no longer kept, or version is newer than the
+            board (it restarted), and a new snapshot is needed
+        """
+        with self._lock:
+            if version > self._version:
+                # from before a restart, the board started counting again
+                return None
+            if version == self._version:
+                return self._version, []
+            oldest_kept = self._changes[0][0] if self._changes else self._version + 1
+            if version + 1 < oldest_kept:
+                return None
+            keys = dict.fromkeys(key for v, key in self._changes if v > version)
+            return self._version, [self._statuses[key] for key in keys]
+
+
+def _status_to_dict(status: ManManServiceStatus) -> dict:
+    return {
+        "service_type": status.service_type,
+        "service_id": status.service_id,
+        "current_status": status.current_status,
+        "as_of": status.as_of.isoformat(),
+    }
+
+
+def status_board_response(
+    board: ManManStatusBoard, since: Optional[int] = None
+) -> dict:
+    """
+    The board as json, for the subscriber's health server.
+
+    :param since: a version the caller already has, only the changes after it
+        are listed when they are still kept
+    """
+    if since is not None:
+        changes = board.changes_since(since)
+        if changes is not None:
+            version, statuses = changes
+            return {
+                "version": version,
+                "since": since,
+                "statuses": [_status_to_dict(status) for status in statuses],
+            }
+    snapshot = board.snapshot()
+    return {
+        "version": snapshot.version,
+        "statuses": [_status_to_dict(status) for status in snapshot.statuses.values()],
+    }
+
+
+def init_manman_status_board(
+    max_changes: int = DEFAULT_MAX_CHANGES,
+) -> ManManStatusBoard:
+    if "status_board" in __GLOBALS:
+        raise RuntimeError("double manman status board init")
+    board = ManManStatusBoard(max_changes)
+    __GLOBALS["status_board"] = board
+    return board
+
+
+def get_manman_status_board() -> Optional[ManManStatusBoard]:
+    """
+    :return: the process wide status board, None if it was not set up
+    """
+    return __GLOBALS.get("status_board")
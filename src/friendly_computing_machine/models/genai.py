@@ -38,3 +38,47 @@ class GenAITextCreate(GenAITextBase):
             response=self.response,
             response_as_of=self.response_as_of,
         )
+
+
+class GenAIChannelSummaryBase(Base):
+    """
+    Rolling summary of the genai requests in a slack channel.
+
+    genai_text_id is the newest GenAIText folded into the summary, so it only
+    needs regenerating once a newer request lands.
+    """
+
+    slack_channel_slack_id: str = Field(index=True, unique=True)
+    genai_text_id: int = Field(foreign_key="genaitext.id")
+    summary: str
+    updated_at: datetime.datetime
+
+
+class GenAIChannelSummary(GenAIChannelSummaryBase, table=True):
+    id: int = Field(default=None, nullable=False, primary_key=True)
+
+
+class GenAIChannelSummaryCreate(GenAIChannelSummaryBase):
+    pass
+
+
+class GenAIResponseCacheBase(Base):
+    """
+    Shared tier of the gemini response cache.
+
+    key is a hash of the model name, generation config and prompt.
+    """
+
+    key: str = Field(index=True, unique=True)
+    gemini_model: str
+    response: str
+    created_at: datetime.datetime
+    expires_at: datetime.datetime = Field(index=True)
+
+
+class GenAIResponseCache(GenAIResponseCacheBase, table=True):
+    id: int = Field(default=None, nullable=False, primary_key=True)
+
+
+class GenAIResponseCacheCreate(GenAIResponseCacheBase):
+    pass
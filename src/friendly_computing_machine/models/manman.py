@@ -35,13 +35,19 @@ class ManManStatusUpdate(ManManStatusUpdateBase, table=True):
 
     id: int = Field(default=None, nullable=False, primary_key=True)
 
-    # trying out putting this on the model instead of the base class
-    slack_message_id: int | None = Field(
-        nullable=True,
-        index=True,
-        foreign_key="slackmessage.id",
-        default=None,
-    )
+
+class ManManStatusUpdateSlackMessage(Base, table=True):
+    """
+    The slack message posted for a status update in one channel.
+    Later statuses of the same service edit these messages.
+    """
+
+    __table_args__ = (UniqueConstraint("manman_status_update_id", "slack_channel_id"),)
+
+    id: int = Field(default=None, nullable=False, primary_key=True)
+    manman_status_update_id: int = Field(foreign_key="manmanstatusupdate.id")
+    slack_channel_id: int = Field(foreign_key="slackchannel.id")
+    slack_message_id: int = Field(foreign_key="slackmessage.id", index=True)
 
 
 class ManManStatusUpdateCreate(ManManStatusUpdateBase):
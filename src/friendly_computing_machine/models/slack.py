@@ -56,6 +56,22 @@ class SlackUserCreate(SlackUserBase):
         )
 
 
+class SlackUserStaging(Base, table=True):
+    """
+    Slack user profiles fetched by a workflow run, waiting to be merged into SlackUser.
+
+    Keeps the profiles out of the temporal payloads, only the run_id is passed around.
+    """
+
+    id: int = Field(default=None, nullable=False, primary_key=True)
+    run_id: str = Field(index=True)
+    slack_id: str
+    name: str
+    is_bot: bool = False
+    slack_team_slack_id: str = Field(nullable=True)
+    created_at: datetime.datetime
+
+
 # -----
 # message
 class SlackMessageBase(Base):
@@ -0,0 +1,26 @@
+import datetime
+
+from sqlmodel import Field
+
+from friendly_computing_machine.models.base import Base
+
+
+class WatermarkBase(Base):
+    """
+    Last processed position for a recurring job.
+
+    The value is opaque to the database, the job that owns the watermark decides
+    what goes in it and how to compare it.
+    """
+
+    name: str = Field(index=True, unique=True)
+    value: str
+    as_of: datetime.datetime
+
+
+class Watermark(WatermarkBase, table=True):
+    id: int = Field(default=None, nullable=False, primary_key=True)
+
+
+class WatermarkCreate(WatermarkBase):
+    pass
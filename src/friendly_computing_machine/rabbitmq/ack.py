@@ -0,0 +1,62 @@
+import logging
+import threading
+
+from amqpstorm import Channel
+
+logger = logging.getLogger(__name__)
+
+
+class DeliveryAckTracker:
+    """
+    Settle deliveries on a channel when they finish out of order.
+
+    An ack is held back until every earlier delivery is settled, then the
+    ready ones go out as a single basic.ack with multiple=True. Rejects are
+    sent right away. Safe to call from several threads.
+    """
+
+    def __init__(self, channel: Channel, batch_size: int = 1):
+        self._channel = channel
+        self._batch_size = batch_size
+        self._lock = threading.Lock()
+        self._in_flight: set[int] = set()
+        self._ackable: list[int] = []
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    def received(self, delivery_tag: int):
+        with self._lock:
+            self._in_flight.add(delivery_tag)
+
+    def ack(self, delivery_tag: int):
+        with self._lock:
+            self._in_flight.discard(delivery_tag)
+            self._ackable.append(delivery_tag)
+            self._flush()
+
+    def reject(self, delivery_tag: int, requeue: bool = False):
+        with self._lock:
+            self._in_flight.discard(delivery_tag)
+            self._channel.basic.reject(delivery_tag=delivery_tag, requeue=requeue)
+            # the reject may have been what held back the acks after it
+            self._flush()
+
+    def _flush(self):
+        # a multiple ack covers every outstanding tag up to the one sent,
+        # so only tags below the oldest one still in flight are safe
+        oldest_in_flight = min(self._in_flight, default=None)
+        ready = [
+            tag
+            for tag in self._ackable
+            if oldest_in_flight is None or tag < oldest_in_flight
+        ]
+        if not ready:
+            return
+        # when nothing is in flight there is nothing left to batch with
+        if len(ready) < self._batch_size and self._in_flight:
+            return
+        self._channel.basic.ack(delivery_tag=max(ready), multiple=len(ready) > 1)
+        logger.debug("acked %s deliveries up to %s", len(ready), max(ready))
+        self._ackable = [tag for tag in self._ackable if tag > max(ready)]
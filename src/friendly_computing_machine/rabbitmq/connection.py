@@ -0,0 +1,172 @@
+import contextlib
+import logging
+import threading
+import time
+from typing import Callable, Iterator, Optional
+
+import amqpstorm
+from amqpstorm import Channel
+from opentelemetry import metrics
+
+logger = logging.getLogger(__name__)
+meter = metrics.get_meter(__name__)
+
+reconnect_counter = meter.create_counter(
+    "fcm.rabbitmq.reconnects",
+    description="attempts to reconnect to rabbitmq, by outcome (success, failure)",
+)
+downtime_histogram = meter.create_histogram(
+    "fcm.rabbitmq.downtime",
+    unit="s",
+    description="time from losing the rabbitmq connection to consuming again",
+)
+
+DEFAULT_CHANNEL_POOL_SIZE = 4
+DEFAULT_INITIAL_BACKOFF_SECONDS = 0.5
+DEFAULT_MAX_BACKOFF_SECONDS = 30.0
+
+
+class RabbitMQConnectionManager:
+    """
+    Owns the rabbitmq connection and replaces it when it drops.
+
+    Consumers hand consume() a setup function that declares their queues,
+    bindings and consumers on a channel. It is run again on a fresh channel
+    after every reconnect, so a broker restart costs the reconnect backoff
+    instead of the process. Publishers borrow channels from a small pool.
+    """
+
+    def __init__(
+        self,
+        connection_factory: Callable[[], amqpstorm.Connection],
+        channel_pool_size: int = DEFAULT_CHANNEL_POOL_SIZE,
+        initial_backoff_seconds: float = DEFAULT_INITIAL_BACKOFF_SECONDS,
+        max_backoff_seconds: float = DEFAULT_MAX_BACKOFF_SECONDS,
+    ):
+        self._connection_factory = connection_factory
+        self._channel_pool_size = channel_pool_size
+        self._initial_backoff_seconds = initial_backoff_seconds
+        self._max_backoff_seconds = max_backoff_seconds
+        self._connection: Optional[amqpstorm.Connection] = None
+        self._lock = threading.RLock()
+        self._channel_pool: list[Channel] = []
+        self._consumer_channel: Optional[Channel] = None
+        self._stopped = threading.Event()
+
+    def get_connection(self) -> amqpstorm.Connection:
+        """
+        Get the open connection, connecting once if there is none.
+        """
+        with self._lock:
+            if self._connection is None or self._connection.is_closed:
+                self._connection = self._connection_factory()
+            return self._connection
+
+    def _close_connection(self):
+        self._channel_pool.clear()
+        if self._connection is None:
+            return
+        try:
+            self._connection.close()
+        except amqpstorm.AMQPError as e:
+            logger.debug("error closing broken rabbitmq connection: %s", e)
+        self._connection = None
+
+    def reconnect(self) -> bool:
+        """
+        Replace the connection, backing off exponentially until it works.
+
+        :return: False if the manager was stopped before reconnecting
+        """
+        attempt = 0
+        while not self._stopped.is_set():
+            with self._lock:
+                self._close_connection()
+                try:
+                    self._connection = self._connection_factory()
+                    reconnect_counter.add(1, {"outcome": "success"})
+                    logger.info(
+                        "reconnected to rabbitmq after %s attempts", attempt + 1
+                    )
+                    return True
+                except amqpstorm.AMQPError as e:
+                    reconnect_counter.add(1, {"outcome": "failure"})
+                    delay = min(
+                        self._max_backoff_seconds,
+                        self._initial_backoff_seconds * 2**attempt,
+                    )
+                    logger.warning(
+                        "rabbitmq reconnect attempt %s failed, retrying in %.1fs: %s",
+                        attempt + 1,
+                        delay,
+                        e,
+                    )
+            attempt += 1
+            self._stopped.wait(delay)
+        return False
+
+    def consume(self, setup: Callable[[Channel], None]):
+        """
+        Run setup on a channel and consume from it until stop() is called.
+        Blocks. When the connection or channel fails, reconnects and runs setup again.
+        """
+        self._stopped.clear()
+        down_since: Optional[float] = None
+        while not self._stopped.is_set():
+            try:
+                channel = self.get_connection().channel()
+                self._consumer_channel = channel
+                setup(channel)
+                if down_since is not None:
+                    downtime_histogram.record(time.monotonic() - down_since)
+                    down_since = None
+                # returns once stop_consuming() is called
+                channel.start_consuming()
+            except amqpstorm.AMQPError as e:
+                if self._stopped.is_set():
+                    break
+                logger.warning("lost rabbitmq consumer channel: %s", e)
+                if down_since is None:
+                    down_since = time.monotonic()
+                if not self.reconnect():
+                    break
+        self._consumer_channel = None
+
+    @contextlib.contextmanager
+    def channel(self) -> Iterator[Channel]:
+        """
+        Borrow an open channel for publishing, it goes back to the pool afterwards.
+        """
+        with self._lock:
+            channel = None
+            while self._channel_pool and channel is None:
+                pooled = self._channel_pool.pop()
+                if pooled.is_open:
+                    channel = pooled
+            if channel is None:
+                channel = self.get_connection().channel()
+        try:
+            yield channel
+        finally:
+            with self._lock:
+                if (
+                    channel.is_open
+                    and len(self._channel_pool) < self._channel_pool_size
+                ):
+                    self._channel_pool.append(channel)
+                elif channel.is_open:
+                    channel.close()
+
+    def stop(self):
+        """
+        Stop consuming and close the connection.
+        """
+        self._stopped.set()
+        channel = self._consumer_channel
+        if channel is not None and channel.is_open:
+            try:
+                channel.stop_consuming()
+            except amqpstorm.AMQPError as e:
+                logger.error("error stopping rabbitmq consumer: %s", e)
+        with self._lock:
+            self._close_connection()
@@ -3,6 +3,8 @@ from typing import Optional
 
 import amqpstorm
 
+from friendly_computing_machine.rabbitmq.connection import RabbitMQConnectionManager
+
 logger = logging.getLogger(__name__)
 
 
@@ -14,7 +16,8 @@ class __global:
     rabbitmq_enable_ssl = None
     rabbitmq_ssl_hostname = None
     rabbitmq_vhost = None
-    _connection = None
+    rabbitmq_heartbeat = None
+    _connection_manager = None
 
 
 def init_rabbitmq(
@@ -25,12 +28,13 @@ def init_rabbitmq(
     rabbitmq_enable_ssl: Optional[bool] = None,
     rabbitmq_ssl_hostname: Optional[str] = None,
     rabbitmq_vhost: Optional[str] = None,
+    rabbitmq_heartbeat: Optional[int] = None,
 ):
     """
     Initialize the RabbitMQ connection settings in the global context.
     This is used to set up the RabbitMQ connection parameters for the application.
     """
-    if __global._connection:
+    if __global._connection_manager:
         raise RuntimeError(
             "RabbitMQ connection already initialized. Please use get_rabbitmq_connection() to access the connection."
         )
@@ -42,18 +46,31 @@ def init_rabbitmq(
     __global.rabbitmq_enable_ssl = rabbitmq_enable_ssl
     __global.rabbitmq_ssl_hostname = rabbitmq_ssl_hostname
     __global.rabbitmq_vhost = rabbitmq_vhost
+    __global.rabbitmq_heartbeat = rabbitmq_heartbeat
 
     logger.info("RabbitMQ configuration initialized")
 
 
+def get_rabbitmq_connection_manager() -> RabbitMQConnectionManager:
+    """
+    Get or create the global RabbitMQ connection manager, which reconnects on failure.
+    """
+    if __global._connection_manager is None:
+        __global._connection_manager = RabbitMQConnectionManager(
+            _create_rabbitmq_connection
+        )
+    return __global._connection_manager
+
+
 def get_rabbitmq_connection() -> amqpstorm.Connection:
     """
     Get or create a global RabbitMQ connection.
     Returns the existing connection if it's open, otherwise creates a new one.
     """
-    if __global._connection and not __global._connection.is_closed:
-        return __global._connection
+    return get_rabbitmq_connection_manager().get_connection()
 
+
+def _create_rabbitmq_connection() -> amqpstorm.Connection:
     # Use individual parameters
     host = __global.rabbitmq_host
     port = __global.rabbitmq_port
@@ -64,25 +81,28 @@ def get_rabbitmq_connection() -> amqpstorm.Connection:
     try:
         logger.info(f"Connecting to RabbitMQ at {host}:{port} (SSL: {ssl})")
 
-        ssl_options = {}
+        connection_options = {}
         if ssl:
-            ssl_options["ssl"] = True
+            connection_options["ssl"] = True
             if __global.rabbitmq_ssl_hostname:
-                ssl_options["ssl_options"] = {
+                connection_options["ssl_options"] = {
                     "server_hostname": __global.rabbitmq_ssl_hostname
                 }
 
-        __global._connection = amqpstorm.Connection(
+        if __global.rabbitmq_heartbeat is not None:
+            connection_options["heartbeat"] = __global.rabbitmq_heartbeat
+
+        connection = amqpstorm.Connection(
             hostname=host,
             port=port,
             username=username,
             password=password,
             virtual_host=__global.rabbitmq_vhost or "/",
-            **ssl_options,
+            **connection_options,
         )
 
         logger.info("Successfully connected to RabbitMQ")
-        return __global._connection
+        return connection
 
     except Exception as e:
         logger.error(f"Failed to connect to RabbitMQ: {e}")
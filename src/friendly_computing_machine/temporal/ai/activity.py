@@ -1,21 +1,83 @@
+import json
+import logging
 import random
+from dataclasses import dataclass
 from textwrap import dedent
+from typing import AsyncIterator, Callable, Optional
 
-import google.generativeai as genai
+from opentelemetry import trace
 from temporalio import activity
 
+from friendly_computing_machine.gemini.cache import (
+    get_gemini_response_cache,
+    make_cache_key,
+)
+from friendly_computing_machine.gemini.pool import (
+    gemini_request_slot,
+    get_gemini_model,
+)
+from friendly_computing_machine.gemini.prompt import PromptBuilder, truncate_to_tokens
 from friendly_computing_machine.models.genai import GenAIText
 
+logger = logging.getLogger(__name__)
 
-async def gen_text(prompt: str) -> str:
+# bounds for generate_summary, so latency and cost don't grow with the history
+SUMMARY_PROMPT_TOKEN_BUDGET = 4000
+SUMMARY_ENTRY_MAX_TOKENS = 500
+
+
+async def gen_text(
+    prompt: str,
+    generation_config: Optional[dict] = None,
+    is_cacheable: Optional[Callable[[str], bool]] = None,
+) -> str:
     """
     Generate text using the Gemini AI model.
+    Goes through the response cache and the model pool when the worker has them enabled.
+    is_cacheable can reject responses that should not be replayed, eg malformed output.
     """
-    model = genai.GenerativeModel()
-    response = await model.generate_content_async(prompt)
+    model = get_gemini_model(generation_config)
+    cache = get_gemini_response_cache()
+    key = None
+    if cache is not None:
+        key = make_cache_key(model.model_name, generation_config, prompt)
+        cached_text = await cache.get(key, model.model_name)
+        if cached_text is not None:
+            return cached_text
+
+    async with gemini_request_slot(model.model_name):
+        response = await model.generate_content_async(prompt)
+    if cache is not None and (is_cacheable is None or is_cacheable(response.text)):
+        await cache.set(key, model.model_name, response.text)
     return response.text
 
 
+async def gen_text_stream(prompt: str) -> AsyncIterator[str]:
+    """
+    Generate text using the Gemini AI model, yielding chunks as they arrive.
+    A cached response is yielded as a single chunk.
+    """
+    model = get_gemini_model()
+    cache = get_gemini_response_cache()
+    key = None
+    if cache is not None:
+        key = make_cache_key(model.model_name, None, prompt)
+        cached_text = await cache.get(key, model.model_name)
+        if cached_text is not None:
+            yield cached_text
+            return
+
+    chunks = []
+    # the slot is held until the stream is done, that is when gemini is done with it
+    async with gemini_request_slot(model.model_name):
+        response = await model.generate_content_async(prompt, stream=True)
+        async for chunk in response:
+            chunks.append(chunk.text)
+            yield chunk.text
+    if cache is not None:
+        await cache.set(key, model.model_name, "".join(chunks))
+
+
 @activity.defn
 async def generate_gemini_response(
     prompt_text: str,
@@ -27,31 +89,87 @@ async def generate_gemini_response(
 
 
 @activity.defn
-async def generate_summary(messages: list[GenAIText]) -> str:
+async def generate_summary(
+    messages: list[GenAIText],
+    token_budget: int = SUMMARY_PROMPT_TOKEN_BUDGET,
+) -> str:
     """
-    Generate a summary from a list of responses
+    Generate a summary from a list of responses.
+    The oldest messages are dropped when the prompt would go over token_budget.
     """
-    summary_prompt = dedent("""
-        Here is are the previous genAI requests:\n
-    """)
-    for msg in sorted(messages, key=lambda x: x.created_at):
-        summary_prompt += dedent(f"""
-            - message_{msg.id}:
-                - prompt: "{msg.prompt}"
-                - response: "{msg.response or ""}"
-            """)
-    summary_prompt += (
+    entries = [
+        (
+            f"\n- message_{msg.id}:\n"
+            f'    - prompt: "{truncate_to_tokens(msg.prompt, SUMMARY_ENTRY_MAX_TOKENS)}"\n'
+            f'    - response: "{truncate_to_tokens(msg.response or "", SUMMARY_ENTRY_MAX_TOKENS)}"\n'
+        )
+        for msg in sorted(messages, key=lambda x: x.created_at)
+    ]
+    prompt = PromptBuilder(token_budget).build(
+        entries,
+        header="\nHere is are the previous genAI requests:\n\n",
+        footer=(
+            "\n"
+            "\n"
+            "That concludes the previous genAI requests. "
+            "Please summarize the important topics from these requests and responses."
+            "This will be fed into another model as a seed prompt.\n"
+            "Please produce the summary in list format. "
+            "Please do not include any other text or formatting. "
+            "Just the list of important topics.\n"
+            "If requests or topics are repeated, emphasis can be placed on them."
+        ),
+    )
+
+    span = trace.get_current_span()
+    span.set_attribute("prompt.chars", len(prompt.text))
+    span.set_attribute("prompt.estimated_tokens", prompt.estimated_tokens)
+    span.set_attribute("prompt.entries_included", prompt.entries_included)
+    span.set_attribute("prompt.entries_dropped", prompt.entries_dropped)
+    if prompt.entries_dropped:
+        logger.info(
+            "summary prompt over budget, dropped %s oldest of %s messages",
+            prompt.entries_dropped,
+            len(entries),
+        )
+    return await gen_text(prompt.text)
+
+
+@dataclass
+class FoldSummaryParams:
+    """
+    Parameters for fold_summary.
+    """
+
+    previous_summary: str
+    prompt: str
+    response: str
+
+
+async def fold_summary(params: FoldSummaryParams) -> str:
+    """
+    Fold the latest request and response into an existing summary
+    instead of re-summarizing the whole history.
+    Not an activity, fold_slack_channel_summary_activity calls it between
+    reading and saving the channel summary.
+    """
+    fold_prompt = (
+        "Here is a summary of the important topics from previous genAI requests:\n"
+        f"{params.previous_summary}\n"
         "\n"
+        "Here is the latest genAI request:\n"
+        f'- prompt: "{params.prompt}"\n'
+        f'- response: "{params.response}"\n'
         "\n"
-        "That concludes the previous genAI requests. "
-        "Please summarize the important topics from these requests and responses."
+        "Please update the summary with the important topics from the latest request. "
         "This will be fed into another model as a seed prompt.\n"
         "Please produce the summary in list format. "
         "Please do not include any other text or formatting. "
         "Just the list of important topics.\n"
+        "Keep the list short, older topics that are no longer relevant can be dropped. "
         "If requests or topics are repeated, emphasis can be placed on them."
     )
-    return await gen_text(summary_prompt)
+    return await gen_text(fold_prompt)
 
 
 @activity.defn
@@ -114,3 +232,112 @@ async def detect_call_to_action(response: str) -> bool:
 
     detection_result = await gen_text(detection_prompt)
     return detection_result.strip().upper() == "YES"
+
+
+@dataclass
+class StructuredResponseParams:
+    """
+    Parameters for the generate_structured_response activity.
+    """
+
+    prompt_text: str
+    previous_context: str
+    inversion_probability: float = 0.10
+
+
+@dataclass
+class StructuredResponse:
+    """
+    Result of the generate_structured_response activity.
+    """
+
+    response: str
+    vibe: str
+    is_call_to_action: bool
+
+
+CALL_TO_ACTION_CRITERIA = """
+A call to action that warrants @here includes:
+- Urgent announcements or requests
+- Time-sensitive opportunities
+- Important meetings or events requiring participation
+- Critical alerts or warnings
+- Requests for immediate feedback or input from the team
+"""
+
+
+STRUCTURED_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "vibe": {"type": "string"},
+        "response": {"type": "string"},
+        "is_call_to_action": {"type": "boolean"},
+    },
+    "required": ["vibe", "response", "is_call_to_action"],
+}
+
+
+def _is_structured_response(response_text: str) -> bool:
+    try:
+        result = json.loads(response_text)
+    except json.JSONDecodeError:
+        return False
+    return isinstance(result, dict) and all(
+        key in result for key in STRUCTURED_RESPONSE_SCHEMA["required"]
+    )
+
+
+@activity.defn
+async def generate_structured_response(
+    params: StructuredResponseParams,
+) -> StructuredResponse:
+    """
+    Generate the vibe, the response and call to action detection in a single
+    structured output request, instead of a call for each.
+    """
+    if random.random() < params.inversion_probability:
+        vibe_instruction = (
+            "Figure out the vibe of the user prompt, then use the OPPOSITE vibe. "
+            "vibe is a one sentence summary of the OPPOSITE vibe."
+        )
+    else:
+        vibe_instruction = (
+            "Figure out the vibe of the user prompt. "
+            "vibe is a one sentence summary of the vibe."
+        )
+
+    structured_prompt = (
+        "# Response Guidelines\n\n"
+        "## Context Information\n"
+        f"Previous conversation summary:\n{params.previous_context}\n\n"
+        "## User Prompt\n"
+        f"{params.prompt_text}\n\n"
+        "## Output\n"
+        f"- {vibe_instruction} Be as concise as possible.\n"
+        "- response is your response to the user prompt. "
+        "Please consider the vibe when crafting it.\n"
+        "- is_call_to_action is true if the response contains a call to action "
+        "that should notify all members of a Slack channel (with @here).\n"
+        f"{CALL_TO_ACTION_CRITERIA}\n"
+        "## Additional Instructions\n"
+        "- Consider the previous conversation context when relevant, but don't explicitly reference it\n"
+        "- Keep responses concise (100-150 words) unless the user specifically requests a longer answer\n"
+        "- Be helpful, accurate, and engaging in your response\n"
+        "- Format your response appropriately for the question type\n"
+    )
+
+    response_text = await gen_text(
+        structured_prompt,
+        generation_config={
+            "response_mime_type": "application/json",
+            "response_schema": STRUCTURED_RESPONSE_SCHEMA,
+        },
+        is_cacheable=_is_structured_response,
+    )
+    # a malformed response raises and the activity is retried
+    result = json.loads(response_text)
+    return StructuredResponse(
+        response=result["response"],
+        vibe=result["vibe"],
+        is_call_to_action=bool(result["is_call_to_action"]),
+    )
@@ -1,10 +1,14 @@
 import logging
 from abc import ABC, abstractmethod
+from datetime import timedelta
+from enum import StrEnum
 from typing import Any, Optional
 
+from temporalio.api.common.v1 import Payload
 from temporalio.client import (
     Client,
     Schedule,
+    ScheduleAction,
     ScheduleActionStartWorkflow,
     ScheduleAlreadyRunningError,
     ScheduleSpec,
@@ -12,12 +16,75 @@ from temporalio.client import (
     ScheduleUpdate,
     ScheduleUpdateInput,
 )
+from temporalio.converter import PayloadConverter
+from temporalio.service import RPCError, RPCStatusCode
 
-from friendly_computing_machine.temporal.util import get_temporal_queue_name
+from friendly_computing_machine.temporal.util import TaskQueue, get_temporal_queue_name
 
 logger = logging.getLogger(__name__)
 
 
+class ScheduleReconcileResult(StrEnum):
+    CREATED = "created"
+    UPDATED = "updated"
+    UNCHANGED = "unchanged"
+
+
+def _spec_key(spec: ScheduleSpec) -> tuple:
+    # describe fills in defaults that were left unset, so normalize those
+    # cron expressions come back as calendars, schedules using them always look changed
+    return (
+        sorted(
+            (interval.every, interval.offset or timedelta(0))
+            for interval in spec.intervals
+        ),
+        spec.calendars,
+        spec.cron_expressions,
+        spec.skip,
+        spec.start_at,
+        spec.end_at,
+        spec.jitter or timedelta(0),
+        spec.time_zone_name or None,
+    )
+
+
+def _action_key(action: ScheduleAction, payload_converter: PayloadConverter) -> tuple:
+    if not isinstance(action, ScheduleActionStartWorkflow):
+        return (action,)
+    args = list(action.args)
+    # described actions carry encoded args, desired ones carry the values
+    if args and not isinstance(args[0], Payload):
+        args = payload_converter.to_payloads(args)
+    return (
+        action.workflow,
+        args,
+        action.id,
+        action.task_queue,
+        action.execution_timeout,
+        action.run_timeout,
+        action.task_timeout,
+        action.retry_policy,
+    )
+
+
+def get_schedule_diff(
+    desired: Schedule,
+    current: Schedule,
+    payload_converter: PayloadConverter = PayloadConverter.default,
+) -> list[str]:
+    """
+    :return: names of the parts of current that differ from desired, empty if none do
+    """
+    changed = []
+    if _spec_key(desired.spec) != _spec_key(current.spec):
+        changed.append("spec")
+    if _action_key(desired.action, payload_converter) != _action_key(
+        current.action, payload_converter
+    ):
+        changed.append("action")
+    return changed
+
+
 class AbstractScheduleWorkflow(ABC):
     @abstractmethod
     async def run(self, wf_arg: Optional[Any] = None):
@@ -56,13 +123,25 @@ class AbstractScheduleWorkflow(ABC):
         # default to nothing for now
         return ScheduleState(note="this is the default note")
 
-    def get_schedule_update(self, input: ScheduleUpdateInput) -> ScheduleUpdate:
-        # Supposed to do something with the input, but not sure what yet
-        # for now just overwriting schedule all the time
-        # probably introduces some terrible race condition, but we'll deal with that later
-        # upsert update will at least simplify development (hopefully)
-        logger.debug("schedule update input: %s", input)
-        return ScheduleUpdate(schedule=self.get_schedule(input.description.id))
+    def get_schedule_update(
+        self,
+        input: ScheduleUpdateInput,
+        app_env: str,
+        payload_converter: PayloadConverter = PayloadConverter.default,
+    ) -> Optional[ScheduleUpdate]:
+        """
+        Update the schedule only when its spec or action differ from the desired ones.
+        Returning None leaves the schedule alone.
+        """
+        desired = self.get_schedule(app_env)
+        current = input.description.schedule
+        changed = get_schedule_diff(desired, current, payload_converter)
+        if not changed:
+            return None
+        logger.info("schedule %s changed: %s", input.description.id, ", ".join(changed))
+        # keep the current state, a schedule paused by hand should stay paused
+        desired.state = current.state
+        return ScheduleUpdate(schedule=desired)
 
     def get_id(self, app_env) -> str:
         # For now, just use the class name. should be fine
@@ -72,7 +151,7 @@ class AbstractScheduleWorkflow(ABC):
         return f"wf-schedule-{self.get_id(app_env)}"
 
     def get_temporal_queue_name(self) -> str:
-        return get_temporal_queue_name("main")
+        return get_temporal_queue_name(TaskQueue.MAIN)
 
     def get_schedule(self, app_env: str, wf_arg: Optional[Any] = None) -> Schedule:
         # TODO - wf_arg is kind of a hack but it is useful for now otherwise
@@ -101,31 +180,39 @@ class AbstractScheduleWorkflow(ABC):
             state=self.get_schedule_state(),
         )
 
-    async def async_upsert_schedule(self, client: Client, app_env: str):
+    async def async_upsert_schedule(
+        self, client: Client, app_env: str
+    ) -> ScheduleReconcileResult:
+        """
+        Create the schedule, or update it if it drifted from the desired one.
+        An unchanged schedule costs one describe and no writes.
+        """
         # TODO - this should probably be static, but it is not for now
         # Maybe a class method. Using self for override and getting right class name atm
         # but there is definitely a better way to do this that doesn't require
         # instantiating the class and then discarding it
         schedule_id = self.get_schedule_id(app_env)
-        try:
-            await client.create_schedule(
-                self.get_schedule_id(app_env),
-                self.get_schedule(app_env),
-            )
-            logger.info(
-                "schedule created for the first time: %s",
-                schedule_id,
-            )
-        except ScheduleAlreadyRunningError as e:
-            logger.info("%s - %s", e, schedule_id)
-            handle = client.get_schedule_handle(
-                schedule_id,
-            )
-            await handle.update(
-                self.get_schedule_update,
-            )
+        payload_converter = client.data_converter.payload_converter
+        result = ScheduleReconcileResult.UNCHANGED
 
-        logger.info(
-            "schedule upserted: %s",
-            schedule_id,
-        )
+        def updater(input: ScheduleUpdateInput) -> Optional[ScheduleUpdate]:
+            nonlocal result
+            update = self.get_schedule_update(input, app_env, payload_converter)
+            if update is not None:
+                result = ScheduleReconcileResult.UPDATED
+            return update
+
+        try:
+            await client.get_schedule_handle(schedule_id).update(updater)
+        except RPCError as e:
+            if e.status != RPCStatusCode.NOT_FOUND:
+                raise
+            try:
+                await client.create_schedule(schedule_id, self.get_schedule(app_env))
+                result = ScheduleReconcileResult.CREATED
+            except ScheduleAlreadyRunningError:
+                # someone else created it between the describe and the create
+                logger.info("schedule created concurrently: %s", schedule_id)
+
+        logger.info("schedule %s: %s", result, schedule_id)
+        return result
@@ -1,11 +1,17 @@
+import datetime
+import json
 import logging
+from dataclasses import asdict, dataclass
+from typing import Optional
 
 from temporalio import activity
 
 from friendly_computing_machine.db.dal import (
+    get_slack_team_id_map,
+    get_watermark,
     select_distinct_slack_team_slack_id_from_slack_message,
     upsert_slack_teams,
-    upsert_slack_users,
+    upsert_watermark,
 )
 from friendly_computing_machine.db.jobsql import (
     backfill_genai_text_slack_channel_id,
@@ -14,47 +20,48 @@ from friendly_computing_machine.db.jobsql import (
     backfill_slack_messages_slack_team_id,
     backfill_slack_messages_slack_user_id,
     delete_slack_message_duplicates,
+    get_slack_change_marker,
+    merge_slack_user_staging,
 )
-from friendly_computing_machine.models.slack import SlackTeamCreate, SlackUserCreate
+from friendly_computing_machine.models.slack import SlackTeamCreate
+from friendly_computing_machine.models.watermark import WatermarkCreate
 
 logger = logging.getLogger(__name__)
 
 
 @activity.defn
-def backfill_slack_messages_slack_user_id_activity():
+def backfill_slack_messages_slack_user_id_activity() -> int:
     """Backfills slack messages with slack user IDs."""
     logger.info("starting slack user id backfill")
-    backfill_slack_messages_slack_user_id()
-    return "OK"
+    return backfill_slack_messages_slack_user_id()
 
 
 @activity.defn
-def backfill_slack_messages_slack_channel_id_activity():
+def backfill_slack_messages_slack_channel_id_activity() -> int:
     """Backfills slack messages with slack channel IDs."""
     logger.info("starting slack channel id backfill")
-    backfill_slack_messages_slack_channel_id()
-    return "OK"
+    return backfill_slack_messages_slack_channel_id()
 
 
 @activity.defn
-def backfill_slack_messages_slack_team_id_activity():
+def backfill_slack_messages_slack_team_id_activity() -> int:
     """Backfills slack messages with slack team IDs."""
     logger.info("starting slack team id backfill")
-    backfill_slack_messages_slack_team_id()
-    return "OK"
+    return backfill_slack_messages_slack_team_id()
 
 
 @activity.defn
-def delete_slack_message_duplicates_activity():
+def delete_slack_message_duplicates_activity() -> int:
     """Delete duplicate slack messages."""
     logger.info("starting slack message duplicate deletion")
-    delete_slack_message_duplicates()
-    return "OK"
+    return delete_slack_message_duplicates()
 
 
 @activity.defn
-async def backfill_teams_from_messages_activity():
+async def backfill_teams_from_messages_activity() -> int:
+    """Create teams found in slack messages. Returns the number of new teams."""
     slack_team_slack_ids = select_distinct_slack_team_slack_id_from_slack_message()
+    existing_slack_team_slack_ids = get_slack_team_id_map().keys()
     slack_team_creates = [
         SlackTeamCreate(
             slack_id=slack_team_id,
@@ -62,33 +69,105 @@ async def backfill_teams_from_messages_activity():
             name="i don't care enough to get the permissions to get the name",
         )
         for slack_team_id in slack_team_slack_ids
+        if slack_team_id not in existing_slack_team_slack_ids
     ]
 
     upsert_slack_teams(slack_team_creates)
+    return len(slack_team_creates)
 
 
 @activity.defn
-async def upsert_slack_user_creates_activity(
-    user_creates: list[SlackUserCreate],
-) -> str:
-    """
-    Upsert slack users.
-    """
-    upsert_slack_users(user_creates)
-    return "OK"
+def upsert_slack_users_from_staging_activity(run_id: str) -> int:
+    """Upsert the slack users staged by a run. Returns the number of users changed."""
+    logger.info("starting slack user staging merge for run %s", run_id)
+    return merge_slack_user_staging(run_id)
 
 
 @activity.defn
-def backfill_genai_text_slack_user_id_activity() -> str:
+def backfill_genai_text_slack_user_id_activity() -> int:
     """Backfill GenAI text records with missing Slack user IDs."""
     logger.info("starting genai text slack user id backfill")
-    backfill_genai_text_slack_user_id()
-    return "OK"
+    return backfill_genai_text_slack_user_id()
 
 
 @activity.defn
-def backfill_genai_text_slack_channel_id_activity() -> str:
+def backfill_genai_text_slack_channel_id_activity() -> int:
     """Backfill GenAI text records with missing Slack channel IDs."""
     logger.info("starting genai text slack channel id backfill")
-    backfill_genai_text_slack_channel_id()
+    return backfill_genai_text_slack_channel_id()
+
+
+@dataclass
+class SlackChangeMarker:
+    """
+    Newest ids of the tables read by the slack backfills.
+
+    If none of these moved since the last run, the backfills have nothing to do.
+    """
+
+    slack_message_id: Optional[int] = None
+    genai_text_id: Optional[int] = None
+    slack_user_id: Optional[int] = None
+    slack_channel_id: Optional[int] = None
+    slack_team_id: Optional[int] = None
+
+    def to_watermark_value(self) -> str:
+        return json.dumps(asdict(self), sort_keys=True)
+
+    @classmethod
+    def from_watermark_value(cls, value: str) -> "SlackChangeMarker":
+        return cls(**json.loads(value))
+
+
+@dataclass
+class SlackChangeCheckResult:
+    """
+    Result of the check_slack_changes_activity.
+    """
+
+    marker: SlackChangeMarker
+    has_changed: bool
+
+
+@dataclass
+class SaveSlackChangeMarkerParams:
+    """
+    Parameters for the save_slack_change_marker_activity.
+    """
+
+    watermark_name: str
+    marker: SlackChangeMarker
+
+
+@activity.defn
+def check_slack_changes_activity(watermark_name: str) -> SlackChangeCheckResult:
+    """Compare the current slack change marker against the stored watermark."""
+    marker = SlackChangeMarker(**get_slack_change_marker())
+    watermark = get_watermark(watermark_name)
+    if watermark is None:
+        logger.info("no watermark found for %s", watermark_name)
+        return SlackChangeCheckResult(marker=marker, has_changed=True)
+
+    previous_marker = SlackChangeMarker.from_watermark_value(watermark.value)
+    has_changed = previous_marker != marker
+    logger.info(
+        "watermark %s has_changed=%s previous=%s current=%s",
+        watermark_name,
+        has_changed,
+        previous_marker,
+        marker,
+    )
+    return SlackChangeCheckResult(marker=marker, has_changed=has_changed)
+
+
+@activity.defn
+def save_slack_change_marker_activity(params: SaveSlackChangeMarkerParams) -> str:
+    """Store the slack change marker once the backfills have caught up to it."""
+    upsert_watermark(
+        WatermarkCreate(
+            name=params.watermark_name,
+            value=params.marker.to_watermark_value(),
+            as_of=datetime.datetime.now(),
+        )
+    )
     return "OK"
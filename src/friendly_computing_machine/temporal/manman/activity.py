@@ -0,0 +1,245 @@
+import datetime
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Optional
+
+from opentelemetry import metrics
+from temporalio import activity
+
+from external.manman_status_api.models.external_status_info import ExternalStatusInfo
+from external.manman_status_api.models.status_type import StatusType
+from friendly_computing_machine.bot.slack_models import create_manman_status_blocks
+from friendly_computing_machine.bot.special_channel import get_special_channel_routing
+from friendly_computing_machine.bot.util import slack_send_message
+from friendly_computing_machine.db.dal import (
+    get_manman_status_slack_message_ts,
+    get_manman_status_update_from_create,
+    get_slack_special_channel_type_from_name,
+    get_slack_special_channels_from_type,
+    upsert_manman_status_slack_messages,
+    upsert_manman_status_update_returning_slack_message_ts,
+)
+from friendly_computing_machine.models.manman import ManManStatusUpdateCreate
+from friendly_computing_machine.models.slack import (
+    SlackChannel,
+    SlackMessage,
+    SlackSpecialChannel,
+    SlackSpecialChannelType,
+)
+from friendly_computing_machine.util import datetime_to_ts
+
+logger = logging.getLogger(__name__)
+meter = metrics.get_meter(__name__)
+
+not_ready_counter = meter.create_counter(
+    "fcm.manman.status.not_ready",
+    description="status updates whose slack message did not exist yet, by attempt",
+)
+parked_counter = meter.create_up_down_counter(
+    "fcm.manman.status.parked",
+    description="services with a status update parked until their slack message exists",
+)
+
+# Hardcoding for now
+MANMAN_SPECIAL_CHANNEL_TYPE_NAME = "manman_dev"
+# statuses that edit the message posted for CREATED
+UPDATE_STATUS_TYPES = (StatusType.RUNNING, StatusType.COMPLETE, StatusType.LOST)
+MANMAN_STATUS_MAX_ATTEMPTS = 6
+MANMAN_FANOUT_CONCURRENCY = 8
+
+
+def _get_manman_channels() -> list[
+    tuple[SlackSpecialChannel, SlackChannel, SlackSpecialChannelType]
+]:
+    routing = get_special_channel_routing()
+    if routing is not None:
+        return routing.get_channels(MANMAN_SPECIAL_CHANNEL_TYPE_NAME)
+    channel_type = get_slack_special_channel_type_from_name(
+        MANMAN_SPECIAL_CHANNEL_TYPE_NAME
+    )
+    if channel_type is None:
+        logger.warning("No ManMan channel type found, skipping notification")
+        return []
+    return get_slack_special_channels_from_type(channel_type)
+
+
+def _send_to_channel(
+    status_info: ExternalStatusInfo,
+    slack_channel: SlackChannel,
+    special_channel_type: SlackSpecialChannelType,
+    slack_message_ts: Optional[datetime.datetime],
+) -> Optional[SlackMessage]:
+    message_block = create_manman_status_blocks(
+        special_channel_type=special_channel_type,
+        current_status=status_info,
+    )
+    return slack_send_message(
+        channel=slack_channel.slack_id,
+        blocks=message_block,
+        update_ts=datetime_to_ts(slack_message_ts) if slack_message_ts else None,
+    )
+
+
+def _fan_out_manman_status_notification(
+    status_info: ExternalStatusInfo,
+    channels: list[tuple[SlackSpecialChannel, SlackChannel, SlackSpecialChannelType]],
+    slack_message_ts: dict[int, datetime.datetime],
+) -> tuple[dict[int, int], list[str]]:
+    """
+    Update the notification in every channel that has one and post it in the
+    rest, all channels at once.
+
+    :return: ids of the newly posted messages by slack channel id, and the
+        slack ids of the channels that failed
+    """
+    posted: dict[int, int] = {}
+    failed: list[str] = []
+    if not channels:
+        return posted, failed
+
+    with ThreadPoolExecutor(
+        max_workers=min(len(channels), MANMAN_FANOUT_CONCURRENCY)
+    ) as executor:
+        futures = {
+            executor.submit(
+                _send_to_channel,
+                status_info,
+                slack_channel,
+                special_channel_type,
+                slack_message_ts.get(slack_channel.id),
+            ): slack_channel
+            for _, slack_channel, special_channel_type in channels
+        }
+        for future in as_completed(futures):
+            slack_channel = futures[future]
+            try:
+                message = future.result()
+            except Exception as e:
+                logger.error(
+                    "Failed to send Slack notification to channel %s: %s",
+                    slack_channel.slack_id,
+                    e,
+                )
+                failed.append(slack_channel.slack_id)
+                continue
+            if slack_channel.id not in slack_message_ts and message is not None:
+                posted[slack_channel.id] = message.id
+    return posted, failed
+
+
+@dataclass
+class ProcessManManStatusParams:
+    """
+    Parameters for the process_manman_status_activity.
+    """
+
+    status_info: ExternalStatusInfo
+    # how many times the service's workflow has parked an event waiting on its slack message
+    attempt: int = 0
+
+
+class ProcessManManStatusResult(StrEnum):
+    PROCESSED = "processed"
+    # recorded, but the slack message to update does not exist yet, try again later
+    NOT_READY = "not_ready"
+    # recorded, but still no slack message after the last attempt, not shown
+    DROPPED = "dropped"
+
+
+@activity.defn
+def process_manman_status_activity(
+    params: ProcessManManStatusParams,
+) -> ProcessManManStatusResult:
+    """
+    Record a status update and create or update its slack notification.
+
+    The status is always recorded. Updates also need the slack message posted
+    for CREATED, when it is not there yet NOT_READY is returned, so the workflow
+    can park the slack edit instead of this activity blocking on it.
+    """
+    status_info = params.status_info
+    logger.info("handling %s, attempt %s", status_info, params.attempt)
+    status_update_create = ManManStatusUpdateCreate.from_status_info(status_info)
+    metric_attributes = {"service_type": status_update_create.service_type}
+    # a parked event is unparked once it is run again, temporal's own retries
+    # of that run must not count it again
+    if params.attempt > 0 and activity.info().attempt == 1:
+        parked_counter.add(-1, metric_attributes)
+
+    # Use upsert pattern - handles both create and update cases gracefully
+    status_update, slack_message_ts = (
+        upsert_manman_status_update_returning_slack_message_ts(status_update_create)
+    )
+    channels = None
+    if status_update is None:
+        if status_info.status_type != StatusType.CREATED:
+            logger.info(
+                "status_info %s is older than the stored status, skipping", status_info
+            )
+            return ProcessManManStatusResult.PROCESSED
+        # a CREATED that arrives after a later status still posts the message
+        # that status is parked waiting to edit, linked to the stored row
+        status_update = get_manman_status_update_from_create(status_update_create)
+        slack_message_ts = get_manman_status_slack_message_ts(
+            status_update.service_type, status_update.service_id
+        )
+        # channels that already have the message may show the later status
+        channels = [
+            channel
+            for channel in _get_manman_channels()
+            if channel[1].id not in slack_message_ts
+        ]
+        if not channels:
+            logger.info(
+                "status_info %s is older than the stored status and already posted",
+                status_info,
+            )
+            return ProcessManManStatusResult.PROCESSED
+        slack_message_ts = {}
+
+    # CREATED posts where there is no message yet, a retried CREATED edits what it
+    # already posted instead of posting twice
+    if status_info.status_type in UPDATE_STATUS_TYPES and not slack_message_ts:
+        not_ready_counter.add(1, {**metric_attributes, "attempt": params.attempt})
+        if params.attempt + 1 >= MANMAN_STATUS_MAX_ATTEMPTS:
+            logger.error(
+                "Slack message not found for %s %s after %s attempts, not showing %s",
+                status_update_create.service_type,
+                status_update_create.service_id,
+                params.attempt + 1,
+                status_info.status_type,
+            )
+            return ProcessManManStatusResult.DROPPED
+        parked_counter.add(1, metric_attributes)
+        logger.info(
+            "Slack message not found for %s %s yet",
+            status_update_create.service_type,
+            status_update_create.service_id,
+        )
+        return ProcessManManStatusResult.NOT_READY
+    if status_info.status_type not in (StatusType.CREATED, *UPDATE_STATUS_TYPES):
+        logger.warning("Unhandled status type %s", status_info.status_type)
+        return ProcessManManStatusResult.PROCESSED
+
+    if channels is None:
+        channels = _get_manman_channels()
+    posted, failed = _fan_out_manman_status_notification(
+        status_info, channels, slack_message_ts
+    )
+    upsert_manman_status_slack_messages(status_update.id, posted)
+    logger.info(
+        "Slack notification for %s %s: %s updated, %s posted, %s failed",
+        status_update.service_type,
+        status_update.service_id,
+        len(slack_message_ts),
+        len(posted),
+        len(failed),
+    )
+    if failed:
+        # what was posted is recorded, so the retry only edits those channels
+        raise RuntimeError(f"failed to notify channels {failed}")
+
+    logger.info("status_info %s handled successfully", status_info)
+    return ProcessManManStatusResult.PROCESSED
@@ -0,0 +1,168 @@
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Optional
+
+from temporalio import workflow
+from temporalio.common import RetryPolicy
+from temporalio.exceptions import ActivityError
+
+from external.manman_status_api.models.external_status_info import ExternalStatusInfo
+from friendly_computing_machine.temporal.manman.activity import (
+    ProcessManManStatusParams,
+    ProcessManManStatusResult,
+    process_manman_status_activity,
+)
+from friendly_computing_machine.temporal.util import TaskQueue, get_temporal_queue_name
+
+logger = logging.getLogger(__name__)
+
+# a service that has been quiet this long is done, its next event starts a new run
+MANMAN_STATUS_IDLE_TIMEOUT = timedelta(minutes=30)
+# first wait for a parked event, doubled on every attempt after
+MANMAN_STATUS_RETRY_DELAY = timedelta(seconds=2)
+# keep the history short for long lived services
+MANMAN_STATUS_CONTINUE_AS_NEW_AFTER = 200
+
+
+def get_manman_status_workflow_id(
+    app_env: str, service_type: str, service_id: int
+) -> str:
+    return f"fcm-{app_env}-manman-status-{service_type}-{service_id}"
+
+
+@dataclass
+class ManManStatusWorkflowParams:
+    """
+    Parameters for the ManManStatusWorkflow.
+    """
+
+    service_type: str
+    service_id: int
+    # carried over on continue as new
+    last_as_of: Optional[datetime] = None
+    pending: list[ExternalStatusInfo] = field(default_factory=list)
+    park_attempts: int = 0
+
+
+@workflow.defn
+class ManManStatusWorkflow:
+    """
+    Entity workflow for a single manman worker or game server instance.
+
+    The subscriber signal-with-starts it for every status event of the service,
+    so events for one service are processed one at a time, oldest first, while
+    different services run in parallel. Events that are not newer than the last
+    processed one are dropped.
+
+    Every event is recorded when it is processed. An update that arrives before
+    its slack message exists has its slack edit parked on a timer and retried
+    with backoff, while newer events keep being accepted.
+    """
+
+    def __init__(self):
+        self._pending: list[ExternalStatusInfo] = []
+
+    @workflow.signal
+    def status_update(self, status_info: ExternalStatusInfo):
+        self._pending.append(status_info)
+
+    @workflow.run
+    async def run(self, params: ManManStatusWorkflowParams) -> int:
+        self._pending.extend(params.pending)
+        last_as_of = params.last_as_of
+        # the newest update still waiting for its slack message, retried at retry_at
+        parked: Optional[ExternalStatusInfo] = None
+        retry_at = workflow.now()
+        park_attempts = params.park_attempts
+        processed = 0
+
+        while True:
+            if not self._pending:
+                timeout = (
+                    MANMAN_STATUS_IDLE_TIMEOUT
+                    if parked is None
+                    else max(retry_at - workflow.now(), timedelta(0))
+                )
+                try:
+                    await workflow.wait_condition(
+                        lambda: len(self._pending) > 0, timeout=timeout
+                    )
+                except asyncio.TimeoutError:
+                    if not self._pending and parked is None:
+                        logger.info(
+                            "%s %s idle, processed %s",
+                            params.service_type,
+                            params.service_id,
+                            processed,
+                        )
+                        return processed
+            if parked is not None and workflow.now() >= retry_at:
+                self._pending.append(parked)
+                parked = None
+            if not self._pending:
+                continue
+
+            self._pending.sort(key=lambda status_info: status_info.as_of)
+            status_info = self._pending.pop(0)
+            if last_as_of is not None and status_info.as_of <= last_as_of:
+                logger.info(
+                    "dropping status %s as of %s, already at %s",
+                    status_info.status_type,
+                    status_info.as_of,
+                    last_as_of,
+                )
+                continue
+
+            try:
+                result = await workflow.execute_activity(
+                    process_manman_status_activity,
+                    ProcessManManStatusParams(
+                        status_info=status_info, attempt=park_attempts
+                    ),
+                    task_queue=get_temporal_queue_name(TaskQueue.MAIN),
+                    start_to_close_timeout=timedelta(seconds=30),
+                    retry_policy=RetryPolicy(maximum_attempts=3),
+                )
+            except ActivityError as e:
+                # one bad event should not block the ones after it
+                logger.error(
+                    "failed to process status %s for %s %s: %s",
+                    status_info.status_type,
+                    params.service_type,
+                    params.service_id,
+                    e,
+                )
+                result = ProcessManManStatusResult.DROPPED
+
+            if result == ProcessManManStatusResult.NOT_READY:
+                # only the latest state is shown, so an older parked update is replaced
+                if parked is None or status_info.as_of >= parked.as_of:
+                    parked = status_info
+                park_attempts += 1
+                retry_at = workflow.now() + MANMAN_STATUS_RETRY_DELAY * 2 ** (
+                    park_attempts - 1
+                )
+                continue
+
+            if park_attempts > 0:
+                park_attempts = 0
+                # whatever was missing may be there now
+                retry_at = workflow.now()
+            last_as_of = status_info.as_of
+            processed += 1
+
+            if (
+                processed >= MANMAN_STATUS_CONTINUE_AS_NEW_AFTER
+                or workflow.info().is_continue_as_new_suggested()
+            ):
+                workflow.continue_as_new(
+                    ManManStatusWorkflowParams(
+                        service_type=params.service_type,
+                        service_id=params.service_id,
+                        last_as_of=last_as_of,
+                        pending=self._pending + ([parked] if parked else []),
+                        park_attempts=park_attempts,
+                    )
+                )
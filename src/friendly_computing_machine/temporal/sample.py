@@ -6,6 +6,10 @@ from temporalio import activity, workflow
 # TODO - this is probably not needed
 with workflow.unsafe.imports_passed_through():
     from friendly_computing_machine.temporal.ai.activity import generate_gemini_response
+    from friendly_computing_machine.temporal.util import (
+        TaskQueue,
+        get_temporal_queue_name,
+    )
 
 
 @activity.defn
@@ -28,6 +32,7 @@ class SayHello:
         response = await workflow.execute_activity(
             generate_gemini_response,
             prompt,
+            task_queue=get_temporal_queue_name(TaskQueue.AI),
             schedule_to_close_timeout=timedelta(seconds=5),
         )
         return await workflow.execute_activity(
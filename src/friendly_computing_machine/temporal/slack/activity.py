@@ -1,19 +1,46 @@
+import asyncio
+import datetime
 import logging
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from typing import Optional
 
 from temporalio import activity
 
 from friendly_computing_machine.bot.app import get_slack_web_client
+from friendly_computing_machine.bot.slack_client import SlackWebClientFCM
+from friendly_computing_machine.bot.util import slack_send_message
 from friendly_computing_machine.db.dal import (
+    get_genai_channel_summary,
     get_genai_texts_by_slack_channel,
+    get_slack_user_slack_ids,
     get_user_teams_from_messages,
+    replace_slack_user_staging,
+    save_genai_channel_summary,
+)
+from friendly_computing_machine.models.genai import (
+    GenAIChannelSummaryCreate,
+    GenAIText,
 )
-from friendly_computing_machine.models.genai import GenAIText
 from friendly_computing_machine.models.slack import SlackUserCreate
+from friendly_computing_machine.temporal.ai.activity import (
+    FoldSummaryParams,
+    fold_summary,
+    gen_text_stream,
+)
 
 logger = logging.getLogger(__name__)
 
+SLACK_USERS_LIST_PAGE_SIZE = 200
+SLACK_PROFILE_FETCH_CONCURRENCY = 4
+# chat.update is rate limited, a second between edits is plenty for reading along
+SLACK_STREAM_UPDATE_INTERVAL_SECONDS = 1.0
+SLACK_STREAM_PLACEHOLDER_TEXT = "_thinking..._"
+# folds of overlapping requests in one channel retry against each other
+SLACK_CHANNEL_SUMMARY_FOLD_ATTEMPTS = 5
+
 
 # TODO - put this in db.dal_activity (or just activity? or activity.dal and)
 @activity.defn
@@ -22,6 +49,93 @@ async def get_slack_channel_context(slack_channel_slack_id: str) -> list[GenAITe
     return texts
 
 
+@activity.defn
+def get_slack_channel_summary_activity(slack_channel_slack_id: str) -> Optional[str]:
+    """
+    Get the rolling genai summary for a channel, None if the channel has none yet.
+    """
+    channel_summary = get_genai_channel_summary(slack_channel_slack_id)
+    if channel_summary is None:
+        return None
+    return channel_summary.summary
+
+
+@dataclass
+class FoldSlackChannelSummaryParams:
+    """
+    Parameters for the fold_slack_channel_summary_activity.
+    """
+
+    slack_channel_slack_id: str
+    genai_text_id: int
+    # folded onto when the channel has no summary yet
+    previous_summary: str
+    prompt: str
+    response: str
+
+
+@activity.defn
+async def fold_slack_channel_summary_activity(
+    params: FoldSlackChannelSummaryParams,
+) -> bool:
+    """
+    Fold a genai request into the channel's rolling summary and save it.
+
+    The summary is read again right before folding, and the save only goes
+    through if nobody saved in between. When another request in the channel
+    got there first, this one is folded again onto that summary, so
+    overlapping requests all end up in it.
+    Returns false if it kept losing to other folds.
+    """
+    for attempt in range(SLACK_CHANNEL_SUMMARY_FOLD_ATTEMPTS):
+        current = await asyncio.to_thread(
+            get_genai_channel_summary, params.slack_channel_slack_id
+        )
+        summary = await fold_summary(
+            FoldSummaryParams(
+                previous_summary=(
+                    current.summary if current is not None else params.previous_summary
+                ),
+                prompt=params.prompt,
+                response=params.response,
+            )
+        )
+        saved = await asyncio.to_thread(
+            save_genai_channel_summary,
+            GenAIChannelSummaryCreate(
+                slack_channel_slack_id=params.slack_channel_slack_id,
+                # the newest request folded in so far, even when this one is older
+                genai_text_id=(
+                    max(current.genai_text_id, params.genai_text_id)
+                    if current is not None
+                    else params.genai_text_id
+                ),
+                summary=summary,
+                updated_at=datetime.datetime.now(),
+            ),
+            current,
+        )
+        if saved:
+            logger.info(
+                "channel summary for %s folded genai_text %s after %s attempts",
+                params.slack_channel_slack_id,
+                params.genai_text_id,
+                attempt + 1,
+            )
+            return True
+        logger.info(
+            "channel summary for %s changed while folding genai_text %s, folding again",
+            params.slack_channel_slack_id,
+            params.genai_text_id,
+        )
+    logger.warning(
+        "gave up folding genai_text %s into the channel summary for %s",
+        params.genai_text_id,
+        params.slack_channel_slack_id,
+    )
+    return False
+
+
 @dataclass
 class GenerateContextPromptParams:
     """
@@ -58,40 +172,200 @@ async def generate_context_prompt(params: GenerateContextPromptParams) -> str:
     return context_prompt
 
 
+@dataclass
+class SlackUserInfoBackfillResult:
+    """
+    Result of the backfill_slack_user_info_activity.
+    The profiles themselves are staged in the database under run_id.
+    """
+
+    run_id: str
+    staged_count: int
+    failed_count: int
+
+
+def _slack_user_name(slack_user_profile: dict) -> str | None:
+    return slack_user_profile.get("display_name") or slack_user_profile.get("real_name")
+
+
+def _fetch_slack_user_profile(
+    slack_client: SlackWebClientFCM,
+    slack_user_slack_id: str,
+    slack_team_slack_id: str,
+) -> SlackUserCreate:
+    slack_user_profile_response = slack_client.users_profile_get(
+        user=slack_user_slack_id
+    )
+    if slack_user_profile_response.status_code != 200:
+        raise RuntimeError(f"status not 200 {slack_user_profile_response}")
+    return SlackUserCreate(
+        slack_id=slack_user_slack_id,
+        name=_slack_user_name(slack_user_profile_response.get("profile")),
+        slack_team_slack_id=slack_team_slack_id,
+    )
+
+
 @activity.defn
-async def backfill_slack_user_info_activity() -> list[SlackUserCreate]:
+def backfill_slack_user_info_activity(run_id: str) -> SlackUserInfoBackfillResult:
     """
     Backfill slack user info.
+    Workspace members come from users.list, one call per page. Users that only show up
+    in messages (eg shared channels) are fetched individually, but only until we know them.
+    Fetched profiles are staged in the database under run_id rather than returned.
     """
 
     slack_client = get_slack_web_client()
-    slack_client.team_info()
-    slack_user_team_pairs = get_user_teams_from_messages(
-        slack_team_slack_id=slack_client.team_id
+    slack_user_team_map = dict(
+        get_user_teams_from_messages(slack_team_slack_id=slack_client.team_id)
     )
-    slack_user_creates = []
-    for slack_user_slack_id, slack_team_slack_id in slack_user_team_pairs:
-        try:
-            slack_user_profile_response = slack_client.users_profile_get(
-                user=slack_user_slack_id
+
+    slack_user_creates: dict[str, SlackUserCreate] = {}
+    for page in slack_client.users_list(limit=SLACK_USERS_LIST_PAGE_SIZE):
+        for member in page.get("members", []):
+            slack_team_slack_id = slack_user_team_map.get(member["id"])
+            if slack_team_slack_id is None:
+                continue
+            slack_user_creates[member["id"]] = SlackUserCreate(
+                slack_id=member["id"],
+                name=_slack_user_name(member.get("profile", {})),
+                is_bot=member.get("is_bot", False),
+                slack_team_slack_id=slack_team_slack_id,
+            )
+
+    known_slack_user_slack_ids = get_slack_user_slack_ids()
+    missing_slack_user_team_pairs = [
+        (slack_user_slack_id, slack_team_slack_id)
+        for slack_user_slack_id, slack_team_slack_id in slack_user_team_map.items()
+        if slack_user_slack_id not in slack_user_creates
+        and slack_user_slack_id not in known_slack_user_slack_ids
+    ]
+
+    failed_count = 0
+    # the web client retries on 429, this just keeps us from tripping it constantly
+    with ThreadPoolExecutor(
+        max_workers=SLACK_PROFILE_FETCH_CONCURRENCY,
+        thread_name_prefix="slack-user-profile",
+    ) as executor:
+        futures = [
+            executor.submit(
+                _fetch_slack_user_profile,
+                slack_client,
+                slack_user_slack_id,
+                slack_team_slack_id,
             )
-            if slack_user_profile_response.status_code != 200:
-                raise RuntimeError(f"status not 200 {slack_user_profile_response}")
-            slack_user_profile = slack_user_profile_response.get("profile")
-            slack_user_creates.append(
-                SlackUserCreate(
-                    slack_id=slack_user_slack_id,
-                    name=slack_user_profile.get("display_name")
-                    or slack_user_profile.get("real_name"),
-                    slack_team_slack_id=slack_team_slack_id,
-                )
+            for slack_user_slack_id, slack_team_slack_id in missing_slack_user_team_pairs
+        ]
+        for future in as_completed(futures):
+            try:
+                slack_user_create = future.result()
+                slack_user_creates[slack_user_create.slack_id] = slack_user_create
+            except Exception as e:
+                failed_count += 1
+                logger.exception(e)
+
+    staged_count = replace_slack_user_staging(run_id, list(slack_user_creates.values()))
+    logger.info(
+        "staged %s slack users for run %s, %s fetched individually, %s failed",
+        staged_count,
+        run_id,
+        len(missing_slack_user_team_pairs),
+        failed_count,
+    )
+    return SlackUserInfoBackfillResult(
+        run_id=run_id,
+        staged_count=staged_count,
+        failed_count=failed_count,
+    )
+
+
+@dataclass
+class StreamSlackResponseParams:
+    """
+    Parameters for the stream_gemini_response_to_slack activity.
+    """
+
+    slack_channel_slack_id: str
+    prompt_text: str
+
+
+@dataclass
+class StreamSlackResponseResult:
+    """
+    Result of the stream_gemini_response_to_slack activity.
+    """
+
+    response: str
+    slack_message_ts: str
+
+
+@activity.defn
+async def stream_gemini_response_to_slack(
+    params: StreamSlackResponseParams,
+) -> StreamSlackResponseResult:
+    """
+    Post a placeholder message and edit it as the gemini response streams in.
+    The streamed message is not recorded, finish_slack_stream_activity does that
+    once the final text is known.
+    """
+    web_client = get_slack_web_client()
+    placeholder_response = await asyncio.to_thread(
+        web_client.chat_postMessage,
+        channel=params.slack_channel_slack_id,
+        text=SLACK_STREAM_PLACEHOLDER_TEXT,
+    )
+    slack_message_ts = placeholder_response["ts"]
+
+    response = ""
+    last_update = time.monotonic()
+    try:
+        async for chunk in gen_text_stream(params.prompt_text):
+            response += chunk
+            activity.heartbeat()
+            if time.monotonic() - last_update < SLACK_STREAM_UPDATE_INTERVAL_SECONDS:
+                continue
+            await asyncio.to_thread(
+                slack_send_message,
+                params.slack_channel_slack_id,
+                message=response,
+                update_ts=slack_message_ts,
+                record_message=False,
             )
-        except Exception as e:
-            logger.exception(e)
+            last_update = time.monotonic()
+    except Exception:
+        # don't leave a dangling placeholder behind when the activity is retried
+        await asyncio.to_thread(
+            web_client.chat_delete,
+            channel=params.slack_channel_slack_id,
+            ts=slack_message_ts,
+        )
+        raise
 
-    # TODO - persist these some other way to avoid passing back via temporal?
-    # maybe not so bad for my purposes, but definitely not scalable
-    return slack_user_creates
+    return StreamSlackResponseResult(
+        response=response, slack_message_ts=slack_message_ts
+    )
+
+
+@dataclass
+class FinishSlackStreamParams:
+    """
+    Parameters for the finish_slack_stream_activity.
+    """
+
+    slack_channel_slack_id: str
+    slack_message_ts: str
+    text: str
+
+
+@activity.defn
+def finish_slack_stream_activity(params: FinishSlackStreamParams):
+    """
+    Replace a streamed message with its final text and record it.
+    """
+    slack_send_message(
+        params.slack_channel_slack_id,
+        message=params.text,
+        update_ts=params.slack_message_ts,
+    )
 
 
 @dataclass
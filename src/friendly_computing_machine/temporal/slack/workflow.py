@@ -1,36 +1,51 @@
 import asyncio
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import timedelta
+from typing import Optional
 
 from temporalio import workflow
 from temporalio.client import ScheduleIntervalSpec, ScheduleSpec
 
+from friendly_computing_machine.gemini.response_mode import GeminiResponseMode
 from friendly_computing_machine.temporal.ai.activity import (
+    StructuredResponseParams,
     detect_call_to_action,
     generate_gemini_response,
+    generate_structured_response,
     generate_summary,
     get_vibe,
 )
 from friendly_computing_machine.temporal.base import AbstractScheduleWorkflow
 from friendly_computing_machine.temporal.db.job_activity import (
+    SaveSlackChangeMarkerParams,
     backfill_genai_text_slack_channel_id_activity,
     backfill_genai_text_slack_user_id_activity,
     backfill_slack_messages_slack_channel_id_activity,
     backfill_slack_messages_slack_team_id_activity,
     backfill_slack_messages_slack_user_id_activity,
     backfill_teams_from_messages_activity,
+    check_slack_changes_activity,
     delete_slack_message_duplicates_activity,
-    upsert_slack_user_creates_activity,
+    save_slack_change_marker_activity,
+    upsert_slack_users_from_staging_activity,
 )
 from friendly_computing_machine.temporal.slack.activity import (
+    FinishSlackStreamParams,
     FixSlackTaggingParams,
+    FoldSlackChannelSummaryParams,
     GenerateContextPromptParams,
+    StreamSlackResponseParams,
     backfill_slack_user_info_activity,
+    finish_slack_stream_activity,
     fix_slack_tagging_activity,
+    fold_slack_channel_summary_activity,
     generate_context_prompt,
     get_slack_channel_context,
+    get_slack_channel_summary_activity,
+    stream_gemini_response_to_slack,
 )
+from friendly_computing_machine.temporal.util import TaskQueue, get_temporal_queue_name
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +58,29 @@ class SlackContextGeminiWorkflowParams:
 
     slack_channel_slack_id: str
     prompt: str
+    # the GenAIText row for this request, the channel summary is keyed on it
+    genai_text_id: Optional[int] = None
+    response_mode: GeminiResponseMode = GeminiResponseMode.MULTI_PASS
+
+
+@workflow.defn
+class SlackChannelSummaryWorkflow:
+    """
+    Workflow to fold a single genai request into the rolling channel summary.
+    Started by SlackContextGeminiWorkflow once it has a response, so the next
+    request in the channel can read the summary instead of generating it.
+    """
+
+    @workflow.run
+    async def run(self, params: FoldSlackChannelSummaryParams) -> bool:
+        return await workflow.execute_activity(
+            fold_slack_channel_summary_activity,
+            params,
+            task_queue=get_temporal_queue_name(TaskQueue.AI),
+            # room for a few folds when another request in the channel races it
+            schedule_to_close_timeout=timedelta(seconds=90),
+            start_to_close_timeout=timedelta(seconds=60),
+        )
 
 
 @workflow.defn
@@ -50,63 +88,138 @@ class SlackContextGeminiWorkflow:
     """
     Workflow to generate a response using the Gemini AI model.
     This workflow is specifically designed to work with the Slack context.
-    It retrieves the previous messages from the Slack channel and generates a response
-    based on the provided prompt and the summarized context.
+    It reads the rolling summary of the Slack channel and generates a response
+    based on the provided prompt and that summary. The summary is only generated
+    from the previous messages when the channel does not have one yet.
     """
 
     @workflow.run
     async def run(self, params: SlackContextGeminiWorkflowParams):
-        slack_prompts = await workflow.execute_activity(
-            get_slack_channel_context,
+        vibe_handle = None
+        if params.response_mode != GeminiResponseMode.STRUCTURED:
+            vibe_handle = workflow.start_activity(
+                get_vibe,
+                params.prompt,
+                task_queue=get_temporal_queue_name(TaskQueue.AI),
+                start_to_close_timeout=timedelta(seconds=10),
+            )
+        summary = await workflow.execute_activity(
+            get_slack_channel_summary_activity,
             params.slack_channel_slack_id,
+            task_queue=get_temporal_queue_name(TaskQueue.MAIN),
             schedule_to_close_timeout=timedelta(seconds=5),
             start_to_close_timeout=timedelta(seconds=5),
         )
-        summary_future = workflow.execute_activity(
-            generate_summary,
-            slack_prompts,
-            schedule_to_close_timeout=timedelta(seconds=10),
-            start_to_close_timeout=timedelta(seconds=10),
-        )
-        vibe_future = workflow.execute_activity(
-            get_vibe,
-            params.prompt,
-            start_to_close_timeout=timedelta(seconds=10),
-        )
-
-        vibe, summary = await asyncio.gather(vibe_future, summary_future)
-
-        # this is a hack to do something I don't know how to do
-        # and doesn't really work, but it's at least a start
-        # TODO - understand context
-        context_prompt = await workflow.execute_activity(
-            generate_context_prompt,
-            GenerateContextPromptParams(params.prompt, summary, vibe),
-            schedule_to_close_timeout=timedelta(seconds=10),
-            start_to_close_timeout=timedelta(seconds=10),
-        )
-        response = await workflow.execute_activity(
-            generate_gemini_response,
-            context_prompt,
-            schedule_to_close_timeout=timedelta(seconds=10),
-            start_to_close_timeout=timedelta(seconds=10),
-        )
-
-        # Detect if this response contains a call to action
-        is_call_to_action = await workflow.execute_activity(
-            detect_call_to_action,
-            response,
-            schedule_to_close_timeout=timedelta(seconds=10),
-            start_to_close_timeout=timedelta(seconds=10),
-        )
+        if summary is None:
+            # cold channel, summarize the history once and the summary workflow
+            # keeps it rolling from here
+            slack_prompts = await workflow.execute_activity(
+                get_slack_channel_context,
+                params.slack_channel_slack_id,
+                task_queue=get_temporal_queue_name(TaskQueue.MAIN),
+                schedule_to_close_timeout=timedelta(seconds=5),
+                start_to_close_timeout=timedelta(seconds=5),
+            )
+            summary = await workflow.execute_activity(
+                generate_summary,
+                slack_prompts,
+                task_queue=get_temporal_queue_name(TaskQueue.AI),
+                schedule_to_close_timeout=timedelta(seconds=10),
+                start_to_close_timeout=timedelta(seconds=10),
+            )
+
+        # only set when the response was streamed into slack
+        slack_message_ts = None
+        if vibe_handle is None:
+            structured_response = await workflow.execute_activity(
+                generate_structured_response,
+                StructuredResponseParams(params.prompt, summary),
+                task_queue=get_temporal_queue_name(TaskQueue.AI),
+                schedule_to_close_timeout=timedelta(seconds=20),
+                start_to_close_timeout=timedelta(seconds=15),
+            )
+            response = structured_response.response
+            is_call_to_action = structured_response.is_call_to_action
+        else:
+            vibe = await vibe_handle
+            # this is a hack to do something I don't know how to do
+            # and doesn't really work, but it's at least a start
+            # TODO - understand context
+            context_prompt = await workflow.execute_activity(
+                generate_context_prompt,
+                GenerateContextPromptParams(params.prompt, summary, vibe),
+                task_queue=get_temporal_queue_name(TaskQueue.MAIN),
+                schedule_to_close_timeout=timedelta(seconds=10),
+                start_to_close_timeout=timedelta(seconds=10),
+            )
+            if params.response_mode == GeminiResponseMode.STREAMING:
+                streamed_response = await workflow.execute_activity(
+                    stream_gemini_response_to_slack,
+                    StreamSlackResponseParams(
+                        params.slack_channel_slack_id, context_prompt
+                    ),
+                    task_queue=get_temporal_queue_name(TaskQueue.AI),
+                    schedule_to_close_timeout=timedelta(seconds=120),
+                    start_to_close_timeout=timedelta(seconds=60),
+                    heartbeat_timeout=timedelta(seconds=15),
+                )
+                response = streamed_response.response
+                slack_message_ts = streamed_response.slack_message_ts
+            else:
+                response = await workflow.execute_activity(
+                    generate_gemini_response,
+                    context_prompt,
+                    task_queue=get_temporal_queue_name(TaskQueue.AI),
+                    schedule_to_close_timeout=timedelta(seconds=10),
+                    start_to_close_timeout=timedelta(seconds=10),
+                )
+            is_call_to_action = None
+
+        if params.genai_text_id is not None:
+            # only waits for the start, the summary is updated in the background
+            await workflow.start_child_workflow(
+                SlackChannelSummaryWorkflow.run,
+                FoldSlackChannelSummaryParams(
+                    slack_channel_slack_id=params.slack_channel_slack_id,
+                    genai_text_id=params.genai_text_id,
+                    previous_summary=summary,
+                    prompt=params.prompt,
+                    response=response,
+                ),
+                id=f"{workflow.info().workflow_id}-summary",
+                task_queue=get_temporal_queue_name(TaskQueue.MAIN),
+                parent_close_policy=workflow.ParentClosePolicy.ABANDON,
+            )
+
+        if is_call_to_action is None:
+            # Detect if this response contains a call to action
+            is_call_to_action = await workflow.execute_activity(
+                detect_call_to_action,
+                response,
+                task_queue=get_temporal_queue_name(TaskQueue.AI),
+                schedule_to_close_timeout=timedelta(seconds=10),
+                start_to_close_timeout=timedelta(seconds=10),
+            )
 
         tagged_response = await workflow.execute_activity(
             fix_slack_tagging_activity,
             FixSlackTaggingParams(response, is_call_to_action),
+            task_queue=get_temporal_queue_name(TaskQueue.MAIN),
             schedule_to_close_timeout=timedelta(seconds=5),
             start_to_close_timeout=timedelta(seconds=5),
         )
 
+        if slack_message_ts is not None:
+            await workflow.execute_activity(
+                finish_slack_stream_activity,
+                FinishSlackStreamParams(
+                    params.slack_channel_slack_id, slack_message_ts, tagged_response
+                ),
+                task_queue=get_temporal_queue_name(TaskQueue.MAIN),
+                schedule_to_close_timeout=timedelta(seconds=10),
+                start_to_close_timeout=timedelta(seconds=5),
+            )
+
         return tagged_response
 
 
@@ -119,6 +232,18 @@ class SlackMessageQODWorkflowParams:
     pass
 
 
+@dataclass
+class SlackMessageQODWorkflowResult:
+    """
+    Result of the SlackMessageQODWorkflow.
+    """
+
+    # true when nothing changed since the last run and no backfill was executed
+    skipped: bool
+    # backfill activity name -> rows modified, only for backfills that did something
+    modified: dict[str, int] = field(default_factory=dict)
+
+
 @workflow.defn
 class SlackMessageQODWorkflow(AbstractScheduleWorkflow):
     """
@@ -133,31 +258,50 @@ class SlackMessageQODWorkflow(AbstractScheduleWorkflow):
             intervals=[ScheduleIntervalSpec(every=timedelta(minutes=2))],
         )
 
+    def get_watermark_name(self) -> str:
+        return self.__class__.__name__
+
     @workflow.run
     async def run(
         self, params: SlackContextGeminiWorkflowParams = SlackMessageQODWorkflowParams()
-    ):
+    ) -> SlackMessageQODWorkflowResult:
         logger.info("params %s", params)
 
-        await workflow.start_activity(
+        # cheap check first, most runs of this schedule have nothing new to process
+        change_check = await workflow.execute_activity(
+            check_slack_changes_activity,
+            self.get_watermark_name(),
+            task_queue=get_temporal_queue_name(TaskQueue.DB),
+            start_to_close_timeout=timedelta(seconds=5),
+        )
+        if not change_check.has_changed:
+            logger.info("no slack changes since last run, skipping backfills")
+            return SlackMessageQODWorkflowResult(skipped=True)
+
+        new_team_count = await workflow.start_activity(
             backfill_teams_from_messages_activity,
+            task_queue=get_temporal_queue_name(TaskQueue.DB),
             start_to_close_timeout=timedelta(seconds=10),
         )
 
         channel_activity = workflow.start_activity(
             backfill_slack_messages_slack_channel_id_activity,
+            task_queue=get_temporal_queue_name(TaskQueue.DB),
             start_to_close_timeout=timedelta(seconds=10),
         )
         user_activity = workflow.start_activity(
             backfill_slack_messages_slack_user_id_activity,
+            task_queue=get_temporal_queue_name(TaskQueue.DB),
             start_to_close_timeout=timedelta(seconds=10),
         )
         team_activity = workflow.start_activity(
             backfill_slack_messages_slack_team_id_activity,
+            task_queue=get_temporal_queue_name(TaskQueue.DB),
             start_to_close_timeout=timedelta(seconds=10),
         )
         delete_activity = workflow.start_activity(
             delete_slack_message_duplicates_activity,
+            task_queue=get_temporal_queue_name(TaskQueue.DB),
             start_to_close_timeout=timedelta(seconds=10),
         )
 
@@ -173,10 +317,12 @@ class SlackMessageQODWorkflow(AbstractScheduleWorkflow):
         # execute genai tasks after slack tasks because they are dependent on the ids being updated
         genai_user_id = workflow.execute_activity(
             backfill_genai_text_slack_user_id_activity,
+            task_queue=get_temporal_queue_name(TaskQueue.DB),
             start_to_close_timeout=timedelta(seconds=10),
         )
         genai_channel_id = workflow.execute_activity(
             backfill_genai_text_slack_channel_id_activity,
+            task_queue=get_temporal_queue_name(TaskQueue.DB),
             start_to_close_timeout=timedelta(seconds=10),
         )
         genai_results = await asyncio.gather(
@@ -185,7 +331,29 @@ class SlackMessageQODWorkflow(AbstractScheduleWorkflow):
         )
         logger.info("genai results %s", genai_results)
 
-        return results, genai_results
+        # only move the watermark once everything above succeeded
+        await workflow.execute_activity(
+            save_slack_change_marker_activity,
+            SaveSlackChangeMarkerParams(
+                watermark_name=self.get_watermark_name(),
+                marker=change_check.marker,
+            ),
+            task_queue=get_temporal_queue_name(TaskQueue.DB),
+            start_to_close_timeout=timedelta(seconds=5),
+        )
+
+        row_counts = {
+            backfill_teams_from_messages_activity.__name__: new_team_count,
+            backfill_slack_messages_slack_channel_id_activity.__name__: results[0],
+            backfill_slack_messages_slack_user_id_activity.__name__: results[1],
+            backfill_slack_messages_slack_team_id_activity.__name__: results[2],
+            delete_slack_message_duplicates_activity.__name__: results[3],
+            backfill_genai_text_slack_user_id_activity.__name__: genai_results[0],
+            backfill_genai_text_slack_channel_id_activity.__name__: genai_results[1],
+        }
+        modified = {name: count for name, count in row_counts.items() if count}
+        logger.info("backfills that modified rows %s", modified)
+        return SlackMessageQODWorkflowResult(skipped=False, modified=modified)
 
 
 class SlackUserInfoWorkflowParams:
@@ -210,19 +378,29 @@ class SlackUserInfoWorkflow(AbstractScheduleWorkflow):
         self, params: SlackUserInfoWorkflowParams = SlackUserInfoWorkflowParams()
     ):
         logger.debug("params %s", params)
-        # TODO - storing creates here is less than ideal as it will store them in temporal
-        # these should be stored elsewhere and retrieved as needed
-        creates = await workflow.execute_activity(
+        # profiles are staged in the database under the run id
+        # so only the run id and counts go through temporal
+        backfill_result = await workflow.execute_activity(
             backfill_slack_user_info_activity,
+            workflow.info().run_id,
+            task_queue=get_temporal_queue_name(TaskQueue.SLACK),
             start_to_close_timeout=timedelta(seconds=30),
         )
-        await workflow.execute_activity(
-            upsert_slack_user_creates_activity,
-            creates,
+        upserted_count = await workflow.execute_activity(
+            upsert_slack_users_from_staging_activity,
+            backfill_result.run_id,
+            task_queue=get_temporal_queue_name(TaskQueue.DB),
             start_to_close_timeout=timedelta(seconds=30),
         )
+        logger.info(
+            "staged %s slack users, %s failed, %s upserted",
+            backfill_result.staged_count,
+            backfill_result.failed_count,
+            upserted_count,
+        )
         await workflow.execute_activity(
             backfill_slack_messages_slack_user_id_activity,
+            task_queue=get_temporal_queue_name(TaskQueue.DB),
             start_to_close_timeout=timedelta(seconds=10),
         )
 
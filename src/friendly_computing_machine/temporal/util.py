@@ -1,4 +1,5 @@
 import asyncio
+from enum import StrEnum
 from typing import Any, Optional, Sequence, Union
 
 from temporalio.client import Client
@@ -6,6 +7,24 @@ from temporalio.contrib.opentelemetry import TracingInterceptor
 from temporalio.contrib.pydantic import pydantic_data_converter
 
 
+class TaskQueue(StrEnum):
+    """
+    Task queues served by the temporal worker.
+
+    Workloads are split so that slow batch jobs cannot take the activity slots
+    needed by interactive workflows.
+    """
+
+    # workflows and cheap in-process activities
+    MAIN = "main"
+    # latency sensitive genai calls
+    AI = "ai"
+    # slack web api heavy activities
+    SLACK = "slack"
+    # database maintenance jobs
+    DB = "db"
+
+
 class __GlobalConfig:
     temporal_host: Optional[str] = None
     queue_prefix: Optional[str] = None
@@ -18,7 +37,7 @@ def init_temporal(host: str, app_env: str):
     __GlobalConfig.queue_prefix = f"fcm-{app_env}-"
 
 
-def get_temporal_queue_name(name: str) -> str:
+def get_temporal_queue_name(name: str | TaskQueue) -> str:
     if __GlobalConfig.queue_prefix is None:
         raise RuntimeError("temporal queue prefix not set")
     return f"{__GlobalConfig.queue_prefix}{name}"
@@ -1,7 +1,11 @@
 import asyncio
 import logging
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from typing import Callable, Optional, Sequence
 
+from temporalio.client import Client
 from temporalio.worker import Worker
 from temporalio.worker.workflow_sandbox import (
     SandboxedWorkflowRunner,
@@ -11,10 +15,14 @@ from temporalio.worker.workflow_sandbox import (
 from friendly_computing_machine.temporal.ai.activity import (
     detect_call_to_action,
     generate_gemini_response,
+    generate_structured_response,
     generate_summary,
     get_vibe,
 )
-from friendly_computing_machine.temporal.base import AbstractScheduleWorkflow
+from friendly_computing_machine.temporal.base import (
+    AbstractScheduleWorkflow,
+    ScheduleReconcileResult,
+)
 from friendly_computing_machine.temporal.db.job_activity import (
     backfill_genai_text_slack_channel_id_activity,
     backfill_genai_text_slack_user_id_activity,
@@ -22,9 +30,15 @@ from friendly_computing_machine.temporal.db.job_activity import (
     backfill_slack_messages_slack_team_id_activity,
     backfill_slack_messages_slack_user_id_activity,
     backfill_teams_from_messages_activity,
+    check_slack_changes_activity,
     delete_slack_message_duplicates_activity,
-    upsert_slack_user_creates_activity,
+    save_slack_change_marker_activity,
+    upsert_slack_users_from_staging_activity,
+)
+from friendly_computing_machine.temporal.manman.activity import (
+    process_manman_status_activity,
 )
+from friendly_computing_machine.temporal.manman.workflow import ManManStatusWorkflow
 from friendly_computing_machine.temporal.sample import (
     SayHello,
     build_hello_prompt,
@@ -32,16 +46,22 @@ from friendly_computing_machine.temporal.sample import (
 )
 from friendly_computing_machine.temporal.slack.activity import (
     backfill_slack_user_info_activity,
+    finish_slack_stream_activity,
     fix_slack_tagging_activity,
+    fold_slack_channel_summary_activity,
     generate_context_prompt,
     get_slack_channel_context,
+    get_slack_channel_summary_activity,
+    stream_gemini_response_to_slack,
 )
 from friendly_computing_machine.temporal.slack.workflow import (
+    SlackChannelSummaryWorkflow,
     SlackContextGeminiWorkflow,
     SlackMessageQODWorkflow,
     SlackUserInfoWorkflow,
 )
 from friendly_computing_machine.temporal.util import (
+    TaskQueue,
     get_temporal_client_async,
     get_temporal_queue_name,
 )
@@ -50,60 +70,182 @@ logger = logging.getLogger(__name__)
 
 
 WORKFLOWS = [
+    ManManStatusWorkflow,
     SayHello,
+    SlackChannelSummaryWorkflow,
     SlackContextGeminiWorkflow,
     SlackMessageQODWorkflow,
     SlackUserInfoWorkflow,
 ]
-ACTIVITIES = [
-    generate_context_prompt,
-    get_vibe,
-    get_slack_channel_context,
-    say_hello,
-    generate_gemini_response,
-    build_hello_prompt,
-    generate_summary,
-    detect_call_to_action,
-    backfill_slack_messages_slack_user_id_activity,
-    backfill_slack_messages_slack_channel_id_activity,
-    backfill_slack_messages_slack_team_id_activity,
-    backfill_slack_user_info_activity,
-    backfill_teams_from_messages_activity,
-    delete_slack_message_duplicates_activity,
-    upsert_slack_user_creates_activity,
-    backfill_genai_text_slack_user_id_activity,
-    backfill_genai_text_slack_channel_id_activity,
-    fix_slack_tagging_activity,
+
+
+@dataclass
+class WorkerQueueConfig:
+    """
+    Worker settings for a single task queue.
+
+    Every queue gets its own Worker and activity executor, so the concurrency
+    and rate limits below only apply to the activities registered on that queue.
+    """
+
+    queue: TaskQueue
+    activities: list[Callable]
+    max_concurrent_activities: int
+    executor_max_workers: int
+    workflows: list[type] = field(default_factory=list)
+    # per worker limit
+    max_activities_per_second: Optional[float] = None
+    # enforced by the temporal server across all workers of the queue
+    max_task_queue_activities_per_second: Optional[float] = None
+
+
+WORKER_QUEUE_CONFIGS = [
+    WorkerQueueConfig(
+        queue=TaskQueue.MAIN,
+        workflows=WORKFLOWS,
+        activities=[
+            build_hello_prompt,
+            finish_slack_stream_activity,
+            fix_slack_tagging_activity,
+            generate_context_prompt,
+            get_slack_channel_context,
+            get_slack_channel_summary_activity,
+            process_manman_status_activity,
+            say_hello,
+        ],
+        max_concurrent_activities=50,
+        executor_max_workers=50,
+    ),
+    WorkerQueueConfig(
+        queue=TaskQueue.AI,
+        activities=[
+            detect_call_to_action,
+            fold_slack_channel_summary_activity,
+            generate_gemini_response,
+            generate_structured_response,
+            generate_summary,
+            get_vibe,
+            stream_gemini_response_to_slack,
+        ],
+        # all async, executor is only here to satisfy the worker
+        max_concurrent_activities=40,
+        executor_max_workers=4,
+    ),
+    WorkerQueueConfig(
+        queue=TaskQueue.SLACK,
+        activities=[
+            backfill_slack_user_info_activity,
+        ],
+        # slack rate limits are per workspace, so keep this one small
+        max_concurrent_activities=2,
+        executor_max_workers=2,
+        max_task_queue_activities_per_second=1,
+    ),
+    WorkerQueueConfig(
+        queue=TaskQueue.DB,
+        activities=[
+            backfill_genai_text_slack_channel_id_activity,
+            backfill_genai_text_slack_user_id_activity,
+            backfill_slack_messages_slack_channel_id_activity,
+            backfill_slack_messages_slack_team_id_activity,
+            backfill_slack_messages_slack_user_id_activity,
+            backfill_teams_from_messages_activity,
+            check_slack_changes_activity,
+            delete_slack_message_duplicates_activity,
+            save_slack_change_marker_activity,
+            upsert_slack_users_from_staging_activity,
+        ],
+        # these are heavy UPDATEs, no point in running a lot of them at once
+        max_concurrent_activities=4,
+        executor_max_workers=4,
+    ),
 ]
 
 
-async def run_worker(app_env: str):
+def get_worker_queue_configs(
+    queues: Optional[Sequence[TaskQueue]] = None,
+) -> list[WorkerQueueConfig]:
+    """
+    Get the worker configs for the requested queues, or all queues if none are given.
+    """
+    if not queues:
+        return list(WORKER_QUEUE_CONFIGS)
+    configs = [config for config in WORKER_QUEUE_CONFIGS if config.queue in queues]
+    if len(configs) == 0:
+        raise ValueError(f"no worker configs found for queues {queues}")
+    return configs
+
+
+async def reconcile_temporal_schedules(
+    client: Client, app_env: str
+) -> dict[str, ScheduleReconcileResult]:
+    """
+    Bring every schedule workflow's schedule in line with its desired one.
+    Schedules that already match are left untouched.
+
+    :return: result per schedule id
+    """
+    schedule_workflows = [
+        wf() for wf in WORKFLOWS if issubclass(wf, AbstractScheduleWorkflow)
+    ]
+    results = await asyncio.gather(
+        *(wf.async_upsert_schedule(client, app_env) for wf in schedule_workflows)
+    )
+    results_by_id = {
+        wf.get_schedule_id(app_env): result
+        for wf, result in zip(schedule_workflows, results)
+    }
+    logger.info("schedules reconciled: %s", results_by_id)
+    return results_by_id
+
+
+async def run_worker(
+    app_env: str,
+    queues: Optional[Sequence[TaskQueue]] = None,
+    reconcile: bool = True,
+):
     # Create client connected to server at the given address
     client = await get_temporal_client_async()
+    queue_configs = get_worker_queue_configs(queues)
+
+    # schedules start workflows, so only bother if this worker is running them
+    # deployments that reconcile with `fcm workflow reconcile-schedules` turn this off
+    if reconcile and any(len(config.workflows) > 0 for config in queue_configs):
+        await reconcile_temporal_schedules(client, app_env)
+
+    runner = SandboxedWorkflowRunner(
+        # restrictions=SandboxRestrictions.default.with_passthrough_modules("slack_sdk"),
+        # TODO - actually ifgure out what is not deterministic
+        # it is slack calls, but from where?
+        restrictions=SandboxRestrictions.default.with_passthrough_all_modules(),
+    )
 
-    # create schedules for schedule workflows
-    futures = []
-    for wf in WORKFLOWS:
-        if not issubclass(wf, AbstractScheduleWorkflow):
-            continue
-        futures.append(wf().async_upsert_schedule(client, app_env))
-    await asyncio.gather(*futures)
-    logger.info("all schedules created")
-
-    # Run the worker
-    with ThreadPoolExecutor(max_workers=100) as activity_executor:
-        runner = SandboxedWorkflowRunner(
-            # restrictions=SandboxRestrictions.default.with_passthrough_modules("slack_sdk"),
-            # TODO - actually ifgure out what is not deterministic
-            # it is slack calls, but from where?
-            restrictions=SandboxRestrictions.default.with_passthrough_all_modules(),
-        )
-        worker = Worker(
-            client,
-            task_queue=get_temporal_queue_name("main"),
-            workflows=WORKFLOWS,
-            activities=ACTIVITIES,
-            activity_executor=activity_executor,
-            workflow_runner=runner,
-        )
-        await worker.run()
+    # Run one worker per queue, each with its own executor
+    with ExitStack() as stack:
+        workers = []
+        for config in queue_configs:
+            activity_executor = stack.enter_context(
+                ThreadPoolExecutor(
+                    max_workers=config.executor_max_workers,
+                    thread_name_prefix=f"activity-{config.queue}",
+                )
+            )
+            workers.append(
+                Worker(
+                    client,
+                    task_queue=get_temporal_queue_name(config.queue),
+                    workflows=config.workflows,
+                    activities=config.activities,
+                    activity_executor=activity_executor,
+                    workflow_runner=runner,
+                    max_concurrent_activities=config.max_concurrent_activities,
+                    max_activities_per_second=config.max_activities_per_second,
+                    max_task_queue_activities_per_second=config.max_task_queue_activities_per_second,
+                )
+            )
+            logger.info(
+                "worker created for queue %s with %s activities",
+                config.queue,
+                len(config.activities),
+            )
+        await asyncio.gather(*(worker.run() for worker in workers))
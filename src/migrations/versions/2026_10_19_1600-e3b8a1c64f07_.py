@@ -0,0 +1,111 @@
+"""manman status slack message per channel
+
+Revision ID: e3b8a1c64f07
+Revises: 5c3e9a7b2d18
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e3b8a1c64f07"
+down_revision: Union[str, None] = "5c3e9a7b2d18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "manmanstatusupdateslackmessage",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("manman_status_update_id", sa.Integer(), nullable=False),
+        sa.Column("slack_channel_id", sa.Integer(), nullable=False),
+        sa.Column("slack_message_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["manman_status_update_id"],
+            ["fcm.manmanstatusupdate.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["slack_channel_id"],
+            ["fcm.slackchannel.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["slack_message_id"],
+            ["fcm.slackmessage.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("manman_status_update_id", "slack_channel_id"),
+        schema="fcm",
+    )
+    op.create_index(
+        op.f("ix_fcm_manmanstatusupdateslackmessage_slack_message_id"),
+        "manmanstatusupdateslackmessage",
+        ["slack_message_id"],
+        unique=False,
+        schema="fcm",
+    )
+    # carry over the single message each status update had
+    op.execute(
+        """
+        insert into fcm.manmanstatusupdateslackmessage
+            (manman_status_update_id, slack_channel_id, slack_message_id)
+        select msu.id, sm.slack_channel_id, sm.id
+        from fcm.manmanstatusupdate msu
+        join fcm.slackmessage sm on sm.id = msu.slack_message_id
+        where sm.slack_channel_id is not null
+        """
+    )
+    op.drop_index(
+        op.f("ix_fcm_manmanstatusupdate_slack_message_id"),
+        table_name="manmanstatusupdate",
+        schema="fcm",
+    )
+    # drops its foreign key along with it
+    op.drop_column("manmanstatusupdate", "slack_message_id", schema="fcm")
+
+
+def downgrade() -> None:
+    op.add_column(
+        "manmanstatusupdate",
+        sa.Column("slack_message_id", sa.Integer(), nullable=True),
+        schema="fcm",
+    )
+    op.create_index(
+        op.f("ix_fcm_manmanstatusupdate_slack_message_id"),
+        "manmanstatusupdate",
+        ["slack_message_id"],
+        unique=False,
+        schema="fcm",
+    )
+    op.create_foreign_key(
+        None,
+        "manmanstatusupdate",
+        "slackmessage",
+        ["slack_message_id"],
+        ["id"],
+        source_schema="fcm",
+        referent_schema="fcm",
+    )
+    # only one message fits, keep the first one posted
+    op.execute(
+        """
+        update fcm.manmanstatusupdate msu
+        set slack_message_id = m.slack_message_id
+        from (
+            select manman_status_update_id, min(slack_message_id) as slack_message_id
+            from fcm.manmanstatusupdateslackmessage
+            group by manman_status_update_id
+        ) m
+        where m.manman_status_update_id = msu.id
+        """
+    )
+    op.drop_index(
+        op.f("ix_fcm_manmanstatusupdateslackmessage_slack_message_id"),
+        table_name="manmanstatusupdateslackmessage",
+        schema="fcm",
+    )
+    op.drop_table("manmanstatusupdateslackmessage", schema="fcm")
@@ -0,0 +1,90 @@
+"""manman status update unique per service
+
+Revision ID: 9f2c6d1e8a43
+Revises: e3b8a1c64f07
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9f2c6d1e8a43"
+down_revision: Union[str, None] = "e3b8a1c64f07"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # the model always had this constraint but no migration created it,
+    # so the on conflict upsert had nothing to conflict on and rows could duplicate.
+    # keep the newest row per service and move the other rows' slack messages onto it
+    op.execute(
+        """
+        create temporary table manman_status_update_dedupe on commit drop as
+        select id, keep_id
+        from (
+            select
+                id,
+                first_value(id) over (
+                    partition by service_type, service_id
+                    order by as_of desc, id desc
+                ) as keep_id
+            from fcm.manmanstatusupdate
+        ) ranked
+        where id != keep_id
+        """
+    )
+    op.execute(
+        """
+        update fcm.manmanstatusupdateslackmessage m
+        set manman_status_update_id = d.keep_id
+        from manman_status_update_dedupe d
+        where m.manman_status_update_id = d.id
+        and not exists (
+            select 1
+            from fcm.manmanstatusupdateslackmessage kept
+            where kept.manman_status_update_id = d.keep_id
+            and kept.slack_channel_id = m.slack_channel_id
+        )
+        and m.id = (
+            select min(other.id)
+            from fcm.manmanstatusupdateslackmessage other
+            join manman_status_update_dedupe od
+                on od.id = other.manman_status_update_id
+            where od.keep_id = d.keep_id
+            and other.slack_channel_id = m.slack_channel_id
+        )
+        """
+    )
+    op.execute(
+        """
+        delete from fcm.manmanstatusupdateslackmessage m
+        using manman_status_update_dedupe d
+        where m.manman_status_update_id = d.id
+        """
+    )
+    op.execute(
+        """
+        delete from fcm.manmanstatusupdate msu
+        using manman_status_update_dedupe d
+        where msu.id = d.id
+        """
+    )
+    op.create_unique_constraint(
+        "manmanstatusupdate_service_id_service_type_key",
+        "manmanstatusupdate",
+        ["service_id", "service_type"],
+        schema="fcm",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "manmanstatusupdate_service_id_service_type_key",
+        "manmanstatusupdate",
+        type_="unique",
+        schema="fcm",
+    )
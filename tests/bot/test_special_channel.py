@@ -0,0 +1,63 @@
+from types import SimpleNamespace
+
+from friendly_computing_machine.bot import special_channel
+from friendly_computing_machine.bot.special_channel import SpecialChannelRouting
+
+
+def _route(special_channel_id: int, type_name: str):
+    return (
+        SimpleNamespace(id=special_channel_id),
+        SimpleNamespace(slack_id=f"C{special_channel_id}"),
+        SimpleNamespace(type_name=type_name),
+    )
+
+
+def test_routing_loads_once_and_reloads_after_interval(monkeypatch):
+    rows = [_route(1, "manman_dev"), _route(2, "other"), _route(3, "manman_dev")]
+    calls = []
+
+    def fake_get_enabled_slack_special_channels():
+        calls.append(1)
+        return list(rows)
+
+    monkeypatch.setattr(
+        special_channel,
+        "get_enabled_slack_special_channels",
+        fake_get_enabled_slack_special_channels,
+    )
+    routing = SpecialChannelRouting(refresh_interval_seconds=3600)
+
+    assert [c.slack_id for _, c, _ in routing.get_channels("manman_dev")] == [
+        "C1",
+        "C3",
+    ]
+    assert routing.get_channels("missing") == []
+    assert len(calls) == 1
+
+    # a routing change is only picked up on refresh, and swaps the whole index
+    rows.pop()
+    assert len(routing.get_channels("manman_dev")) == 2
+    routing.refresh()
+    assert len(routing.get_channels("manman_dev")) == 1
+    assert len(calls) == 2
+
+
+def test_failed_refresh_keeps_last_index(monkeypatch):
+    monkeypatch.setattr(
+        special_channel,
+        "get_enabled_slack_special_channels",
+        lambda: [_route(1, "manman_dev")],
+    )
+    routing = SpecialChannelRouting(refresh_interval_seconds=0.01)
+    routing.get_channels("manman_dev")
+
+    def broken():
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr(special_channel, "get_enabled_slack_special_channels", broken)
+    routing.start()
+    try:
+        routing._stop.wait(0.05)
+        assert len(routing.get_channels("manman_dev")) == 1
+    finally:
+        routing.stop()
@@ -1,9 +1,17 @@
+import os
+import uuid
+from pathlib import Path
+from unittest import mock
 from unittest.mock import Mock
 
 import alembic.config
 import pytest
-from sqlalchemy import Engine
-from sqlmodel import Session
+from sqlalchemy import Engine, make_url, text
+from sqlmodel import Session, create_engine
+
+from friendly_computing_machine.db.util import run_migration
+
+REPO_ROOT = Path(__file__).parents[1]
 
 
 @pytest.fixture
@@ -24,3 +32,34 @@ def mock_alembic_config() -> Mock:
     config = Mock(spec=alembic.config.Config)
     config.attributes = {}  # Common setup for alembic tests
     return config
+
+
+@pytest.fixture
+def postgres_database(monkeypatch) -> Engine:
+    """
+    A freshly migrated database on the postgres server at FCM_TEST_POSTGRES_URL,
+    dropped afterwards. Skips when the variable is not set.
+    """
+    server_url = os.environ.get("FCM_TEST_POSTGRES_URL")
+    if not server_url:
+        pytest.skip("FCM_TEST_POSTGRES_URL is not set")
+
+    database_name = f"fcm_test_{uuid.uuid4().hex[:8]}"
+    server_engine = create_engine(server_url, isolation_level="AUTOCOMMIT")
+    with server_engine.connect() as connection:
+        connection.execute(text(f"create database {database_name}"))
+
+    engine = create_engine(make_url(server_url).set(database=database_name))
+    try:
+        # alembic.ini points at the migrations relative to the repo root
+        monkeypatch.chdir(REPO_ROOT)
+        run_migration(engine, alembic.config.Config("alembic.ini"))
+        with mock.patch(
+            "friendly_computing_machine.db.util.get_engine", return_value=engine
+        ):
+            yield engine
+    finally:
+        engine.dispose()
+        with server_engine.connect() as connection:
+            connection.execute(text(f"drop database if exists {database_name}"))
+        server_engine.dispose()
@@ -0,0 +1,364 @@
+"""
+In memory stand-ins for rabbitmq, temporal and slack, to drive
+ManManSubscribeService without any of them and measure it.
+"""
+
+import asyncio
+import contextlib
+import datetime
+import random
+import statistics
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Optional
+from unittest import mock
+
+from external.manman_status_api.models.external_status_info import ExternalStatusInfo
+from external.manman_status_api.models.status_type import StatusType
+from friendly_computing_machine.bot.subscribe.service import ManManSubscribeService
+from friendly_computing_machine.rabbitmq.connection import RabbitMQConnectionManager
+
+SERVICE_MODULE = "friendly_computing_machine.bot.subscribe.service"
+
+
+@dataclass
+class FakeMessage:
+    delivery_tag: int
+    body: str
+
+
+class FakeBasic:
+    def __init__(self, channel: "FakeChannel"):
+        self._channel = channel
+
+    def qos(self, prefetch_count: int):
+        self._channel.prefetch_count = prefetch_count
+
+    def consume(self, callback, queue: str, no_ack: bool = False):
+        self._channel.consumer = callback
+
+    def ack(self, delivery_tag: int, multiple: bool = False):
+        with self._channel.settled_condition:
+            tags = (
+                [tag for tag in self._channel.unsettled if tag <= delivery_tag]
+                if multiple
+                else [delivery_tag]
+            )
+            self._channel.settle(tags)
+
+    def reject(self, delivery_tag: int, requeue: bool = False):
+        with self._channel.settled_condition:
+            self._channel.rejected += 1
+            self._channel.settle([delivery_tag])
+
+
+class FakeChannel:
+    """
+    Channel that delivers a fixed list of message bodies to its consumer,
+    holding back deliveries past the prefetch count like the broker does.
+    """
+
+    def __init__(self, bodies: list[str]):
+        self.bodies = bodies
+        self.queue = mock.Mock()
+        self.basic = FakeBasic(self)
+        self.is_open = True
+        self.prefetch_count = 0
+        self.consumer: Optional[Callable[[FakeMessage], None]] = None
+        self.unsettled: set[int] = set()
+        self.delivered_at: dict[int, float] = {}
+        self.settled_at: dict[int, float] = {}
+        self.rejected = 0
+        self.settled_condition = threading.Condition()
+        self._stop = threading.Event()
+
+    def settle(self, tags: list[int]):
+        now = time.perf_counter()
+        for tag in tags:
+            self.unsettled.discard(tag)
+            self.settled_at.setdefault(tag, now)
+        self.settled_condition.notify_all()
+
+    def start_consuming(self):
+        for delivery_tag, body in enumerate(self.bodies, start=1):
+            with self.settled_condition:
+                self.settled_condition.wait_for(
+                    lambda: (
+                        not self.prefetch_count
+                        or len(self.unsettled) < self.prefetch_count
+                    )
+                )
+                self.unsettled.add(delivery_tag)
+                self.delivered_at[delivery_tag] = time.perf_counter()
+            self.consumer(FakeMessage(delivery_tag, body))
+        self._stop.wait()
+
+    def wait_settled(self, timeout: float) -> bool:
+        with self.settled_condition:
+            return self.settled_condition.wait_for(
+                lambda: len(self.settled_at) == len(self.bodies), timeout
+            )
+
+    def stop_consuming(self):
+        self._stop.set()
+
+    def close(self):
+        self.is_open = False
+
+
+class FakeConnection:
+    def __init__(self, channel: FakeChannel):
+        self._channel = channel
+        self.is_closed = False
+
+    def channel(self) -> FakeChannel:
+        return self._channel
+
+    def close(self):
+        self.is_closed = True
+
+
+class FakeSlackWebClient:
+    """
+    Stands in for SlackWebClientFCM, each call sleeps for latency_seconds.
+    """
+
+    def __init__(self, latency_seconds: float = 0.0):
+        self.latency_seconds = latency_seconds
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _call(self, channel: str, **kwargs) -> dict:
+        time.sleep(self.latency_seconds)
+        with self._lock:
+            self.calls += 1
+        ts = kwargs.get("ts") or f"{time.time():.6f}"
+        return {
+            "ok": True,
+            "channel": channel,
+            "ts": ts,
+            "message": {"ts": ts, "team": "TBENCHMARK", "user": "UBENCHMARK"},
+        }
+
+    def chat_postMessage(self, channel: str, **kwargs) -> dict:
+        return self._call(channel, **kwargs)
+
+    def chat_update(self, channel: str, **kwargs) -> dict:
+        return self._call(channel, **kwargs)
+
+
+class FakeTemporalClient:
+    """
+    Records signal-with-starts. on_signal, when given, is awaited as the
+    service's workflow before the signal returns.
+    """
+
+    def __init__(
+        self,
+        latency_seconds: float = 0.0,
+        on_signal: Optional[
+            Callable[[str, ExternalStatusInfo], Awaitable[None]]
+        ] = None,
+    ):
+        self.latency_seconds = latency_seconds
+        self.on_signal = on_signal
+        self.signals = 0
+
+    async def start_workflow(self, workflow, params, id, task_queue, **kwargs):
+        self.signals += 1
+        if self.latency_seconds:
+            await asyncio.sleep(self.latency_seconds)
+        if self.on_signal is not None:
+            for status_info in kwargs["start_signal_args"]:
+                await self.on_signal(id, status_info)
+
+
+def generate_status_stream(
+    services: int = 10,
+    updates_per_service: int = 5,
+    duplicate_rate: float = 0.0,
+    out_of_order_rate: float = 0.0,
+    stale_rate: float = 0.0,
+    first_service_id: int = 1,
+    seed: int = 0,
+) -> list[ExternalStatusInfo]:
+    """
+    Lifecycles for a number of workers, interleaved so every service bursts at once.
+
+    Each worker goes CREATED, RUNNING updates_per_service - 2 times, then COMPLETE.
+    Events can be duplicated, swapped with the next event of the same worker, or
+    made older than the subscriber accepts.
+    """
+    rng = random.Random(seed)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    statuses = (
+        [StatusType.CREATED]
+        + [StatusType.RUNNING] * max(0, updates_per_service - 2)
+        + [StatusType.COMPLETE]
+    )
+    lifecycles = []
+    status_info_id = 0
+    for worker_id in range(first_service_id, first_service_id + services):
+        lifecycle = []
+        for step, status_type in enumerate(statuses):
+            status_info_id += 1
+            as_of = now + datetime.timedelta(milliseconds=step)
+            if rng.random() < stale_rate:
+                as_of -= datetime.timedelta(minutes=10)
+            lifecycle.append(
+                ExternalStatusInfo(
+                    as_of=as_of,
+                    class_name="Worker",
+                    worker_id=worker_id,
+                    status_info_id=status_info_id,
+                    status_type=status_type,
+                )
+            )
+        for i in range(len(lifecycle) - 1):
+            if rng.random() < out_of_order_rate:
+                lifecycle[i], lifecycle[i + 1] = lifecycle[i + 1], lifecycle[i]
+        lifecycles.append(lifecycle)
+
+    stream = []
+    for step in range(len(statuses)):
+        for lifecycle in lifecycles:
+            stream.append(lifecycle[step])
+            if rng.random() < duplicate_rate:
+                stream.append(lifecycle[step])
+    return stream
+
+
+def _percentile(values: list[float], percentile: int) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100)[percentile - 1]
+
+
+@dataclass
+class BenchmarkReport:
+    events: int
+    seconds: float
+    signals: int
+    rejected: int
+    slack_calls: int
+    latencies: list[float] = field(repr=False, default_factory=list)
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.seconds if self.seconds else 0.0
+
+    @property
+    def p50_latency_seconds(self) -> float:
+        return _percentile(self.latencies, 50)
+
+    @property
+    def p99_latency_seconds(self) -> float:
+        return _percentile(self.latencies, 99)
+
+    @property
+    def slack_calls_per_event(self) -> float:
+        return self.slack_calls / self.events if self.events else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.events} events in {self.seconds:.3f}s "
+            f"({self.events_per_second:.0f}/s), "
+            f"p50={self.p50_latency_seconds * 1000:.2f}ms "
+            f"p99={self.p99_latency_seconds * 1000:.2f}ms, "
+            f"{self.signals} signals, {self.rejected} rejected, "
+            f"{self.slack_calls_per_event:.2f} slack calls/event"
+        )
+
+
+def run_subscriber_benchmark(
+    stream: list[ExternalStatusInfo],
+    temporal_client: Optional[FakeTemporalClient] = None,
+    slack_client: Optional[FakeSlackWebClient] = None,
+    timeout_seconds: float = 60.0,
+    **service_kwargs,
+) -> BenchmarkReport:
+    """
+    Push stream through a ManManSubscribeService and time each delivery
+    from the broker handing it over to it being acked or rejected.
+    """
+    temporal_client = temporal_client or FakeTemporalClient()
+    channel = FakeChannel(
+        [status_info.model_dump_json(by_alias=True) for status_info in stream]
+    )
+    service = ManManSubscribeService(
+        "benchmark",
+        RabbitMQConnectionManager(lambda: FakeConnection(channel)),
+        slack_api=slack_client,
+        manman_status_api=mock.Mock(),
+        **service_kwargs,
+    )
+
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(
+            mock.patch(
+                f"{SERVICE_MODULE}.get_temporal_client_async",
+                mock.AsyncMock(return_value=temporal_client),
+            )
+        )
+        stack.enter_context(
+            mock.patch(
+                f"{SERVICE_MODULE}.get_temporal_queue_name",
+                return_value="fcm-benchmark-main",
+            )
+        )
+        if slack_client is not None:
+            stack.enter_context(
+                mock.patch(
+                    "friendly_computing_machine.bot.util.get_slack_web_client",
+                    return_value=slack_client,
+                )
+            )
+
+        consumer = threading.Thread(target=service.start, daemon=True)
+        start = time.perf_counter()
+        consumer.start()
+        settled = channel.wait_settled(timeout_seconds)
+        seconds = time.perf_counter() - start
+        service.stop()
+        consumer.join(timeout_seconds)
+
+    if not settled:
+        raise TimeoutError(
+            f"{len(channel.settled_at)} of {len(stream)} deliveries settled"
+        )
+    return BenchmarkReport(
+        events=len(stream),
+        seconds=seconds,
+        signals=temporal_client.signals,
+        rejected=channel.rejected,
+        slack_calls=slack_client.calls if slack_client else 0,
+        latencies=[
+            channel.settled_at[tag] - channel.delivered_at[tag]
+            for tag in channel.delivered_at
+        ],
+    )
+
+
+def inline_activity_runner() -> Callable[[str, ExternalStatusInfo], Awaitable[None]]:
+    """
+    on_signal for FakeTemporalClient that runs the status activity right away,
+    one event at a time per workflow. Events that are not ready are not parked.
+    """
+    # imported here so the subscriber only benchmarks do not need the worker code
+    from friendly_computing_machine.temporal.manman.activity import (
+        ProcessManManStatusParams,
+        process_manman_status_activity,
+    )
+
+    locks: dict[str, asyncio.Lock] = {}
+
+    async def on_signal(workflow_id: str, status_info: ExternalStatusInfo):
+        async with locks.setdefault(workflow_id, asyncio.Lock()):
+            await asyncio.get_running_loop().run_in_executor(
+                None,
+                process_manman_status_activity,
+                ProcessManManStatusParams(status_info=status_info),
+            )
+
+    return on_signal
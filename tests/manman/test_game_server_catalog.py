@@ -0,0 +1,93 @@
+import threading
+import time
+
+from external.old_manman_api.models.game_server_config import GameServerConfig
+from friendly_computing_machine.manman.catalog import GameServerCatalog
+
+
+def _config(game_server_config_id: int, name: str) -> GameServerConfig:
+    return GameServerConfig(
+        args=[],
+        env_var=[],
+        executable="server",
+        game_server_config_id=game_server_config_id,
+        game_server_id=1,
+        name=name,
+    )
+
+
+class _Fetcher:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = 0
+        self.release = threading.Event()
+        self.release.set()
+        self.fetched = threading.Event()
+
+    def __call__(self) -> list[GameServerConfig]:
+        self.release.wait()
+        self.calls += 1
+        response = self.responses[min(self.calls, len(self.responses)) - 1]
+        self.fetched.set()
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def test_lookups_are_served_from_the_first_fetch():
+    fetch = _Fetcher([_config(1, "minecraft"), _config(2, "factorio")])
+    catalog = GameServerCatalog(ttl_seconds=60, fetch=fetch)
+
+    assert [config.name for config in catalog.get_configs()] == [
+        "minecraft",
+        "factorio",
+    ]
+    assert catalog.get_config(2).name == "factorio"
+    assert fetch.calls == 1
+
+
+def test_missing_config_is_fetched_before_giving_up():
+    fetch = _Fetcher(
+        [_config(1, "minecraft")],
+        [_config(1, "minecraft"), _config(2, "factorio")],
+        RuntimeError("manman is down"),
+    )
+    catalog = GameServerCatalog(ttl_seconds=60, fetch=fetch)
+    catalog.refresh()
+
+    # added in manman after the catalog was filled
+    assert catalog.get_config(2).name == "factorio"
+    assert fetch.calls == 2
+    # still missing, and the failed refresh keeps what was there
+    assert catalog.get_config(3) is None
+    assert fetch.calls == 3
+    assert catalog.get_config(2).name == "factorio"
+
+
+def test_expired_configs_are_served_while_refreshing():
+    fetch = _Fetcher([_config(1, "old")], [_config(1, "new")])
+    catalog = GameServerCatalog(ttl_seconds=0, fetch=fetch)
+    catalog.refresh()
+    fetch.release.clear()
+    fetch.fetched.clear()
+
+    # the refresh is blocked, the read must not be
+    assert catalog.get_config(1).name == "old"
+
+    fetch.release.set()
+    assert fetch.fetched.wait(1)
+    deadline = time.monotonic() + 1
+    while catalog.get_config(1).name != "new" and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert catalog.get_config(1).name == "new"
+
+
+def test_failed_refresh_keeps_stale_configs():
+    fetch = _Fetcher([_config(1, "minecraft")], RuntimeError("manman is down"))
+    catalog = GameServerCatalog(ttl_seconds=0, fetch=fetch)
+    catalog.refresh()
+    fetch.fetched.clear()
+
+    assert catalog.get_config(1).name == "minecraft"
+    assert fetch.fetched.wait(1)
+    assert catalog.get_config(1).name == "minecraft"
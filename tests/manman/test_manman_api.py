@@ -0,0 +1,98 @@
+import http.server
+import json
+import threading
+import time
+
+import pytest
+import urllib3
+
+from external.old_manman_api.exceptions import ApiException
+from friendly_computing_machine.manman.api import OldManManAPI
+
+CONFIG = {
+    "args": [],
+    "env_var": [],
+    "executable": "server",
+    "game_server_config_id": 1,
+    "game_server_id": 1,
+    "name": "minecraft",
+}
+
+
+class _ManManHandler(http.server.BaseHTTPRequestHandler):
+    # status codes to answer with, in order, then 200
+    statuses: list[int] = []
+    delay_seconds = 0.0
+    requests: list[tuple[str, str]] = []
+
+    def _respond(self):
+        type(self).requests.append((self.command, self.path))
+        time.sleep(self.delay_seconds)
+        status = self.statuses.pop(0) if self.statuses else 200
+        body = json.dumps([CONFIG] if status == 200 else {"detail": "down"}).encode()
+        try:
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except ConnectionError:
+            # the client timed out and hung up
+            pass
+
+    do_GET = _respond
+    do_POST = _respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def manman_api():
+    _ManManHandler.statuses = []
+    _ManManHandler.delay_seconds = 0.0
+    _ManManHandler.requests = []
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _ManManHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    saved = OldManManAPI._config, OldManManAPI._client, OldManManAPI._api
+    OldManManAPI._config = OldManManAPI._client = OldManManAPI._api = None
+    OldManManAPI.init(
+        f"http://127.0.0.1:{server.server_port}", read_timeout_seconds=0.5
+    )
+    yield OldManManAPI
+    OldManManAPI._config, OldManManAPI._client, OldManManAPI._api = saved
+    server.shutdown()
+    server.server_close()
+
+
+def test_api_instance_is_shared(manman_api):
+    assert manman_api.get_api() is manman_api.get_api()
+
+
+def test_idempotent_request_is_retried(manman_api):
+    _ManManHandler.statuses = [503, 502]
+
+    configs = manman_api.get_api().get_game_servers_host_gameserver_get()
+
+    assert [config.name for config in configs] == ["minecraft"]
+    assert len(_ManManHandler.requests) == 3
+
+
+def test_post_is_not_retried(manman_api):
+    _ManManHandler.statuses = [503]
+
+    with pytest.raises(ApiException):
+        manman_api.get_api().start_game_server_host_gameserver_id_start_post(1)
+
+    assert _ManManHandler.requests == [("POST", "/host/gameserver/1/start")]
+
+
+def test_default_read_timeout_applies(manman_api):
+    _ManManHandler.delay_seconds = 1.0
+    start = time.monotonic()
+
+    # a post is not retried, so this is exactly one read timeout
+    with pytest.raises(urllib3.exceptions.HTTPError):
+        manman_api.get_api().start_game_server_host_gameserver_id_start_post(1)
+
+    assert time.monotonic() - start < 1.0
@@ -0,0 +1,87 @@
+import datetime
+
+from friendly_computing_machine.manman.status_board import (
+    ManManServiceStatus,
+    ManManStatusBoard,
+    status_board_response,
+)
+
+NOW = datetime.datetime(2026, 10, 19, 12, tzinfo=datetime.timezone.utc)
+
+
+def _status(service_id: int, status: str, seconds: int = 0) -> ManManServiceStatus:
+    return ManManServiceStatus(
+        "worker", service_id, status, NOW + datetime.timedelta(seconds=seconds)
+    )
+
+
+def test_older_status_never_replaces_newer():
+    board = ManManStatusBoard()
+
+    assert board.update(_status(1, "RUNNING", seconds=2))
+    assert not board.update(_status(1, "CREATED", seconds=1))
+    assert not board.update(_status(1, "RUNNING", seconds=2))
+
+    assert board.get("worker", 1).current_status == "RUNNING"
+    assert board.snapshot().version == 1
+
+
+def test_snapshot_is_unaffected_by_later_updates():
+    board = ManManStatusBoard()
+    board.update_many([_status(1, "RUNNING"), _status(2, "RUNNING")])
+    snapshot = board.snapshot()
+
+    board.update(_status(1, "COMPLETE", seconds=1))
+
+    assert snapshot.statuses[("worker", 1)].current_status == "RUNNING"
+    assert board.snapshot().statuses[("worker", 1)].current_status == "COMPLETE"
+
+
+def test_changes_since_returns_newest_per_service_until_trimmed():
+    board = ManManStatusBoard(max_changes=3)
+    board.update(_status(1, "CREATED"))
+    version = board.snapshot().version
+
+    board.update(_status(1, "RUNNING", seconds=1))
+    board.update(_status(2, "CREATED", seconds=1))
+    board.update(_status(1, "COMPLETE", seconds=2))
+
+    current, changed = board.changes_since(version)
+    assert current == 4
+    assert [(s.service_id, s.current_status) for s in changed] == [
+        (1, "COMPLETE"),
+        (2, "CREATED"),
+    ]
+    assert board.changes_since(current) == (4, [])
+    # a version this board never reached, a new snapshot is needed
+    assert board.changes_since(current + 1) is None
+
+    board.update(_status(3, "CREATED"))
+    # the change right after version was trimmed, a new snapshot is needed
+    assert board.changes_since(version) is None
+
+
+def test_snapshot_copy_is_reused_until_the_board_changes():
+    board = ManManStatusBoard()
+    board.update(_status(1, "RUNNING"))
+
+    snapshot = board.snapshot()
+    assert board.snapshot() is snapshot
+
+    board.update(_status(1, "COMPLETE", seconds=1))
+    assert board.snapshot() is not snapshot
+    assert snapshot.statuses[("worker", 1)].current_status == "RUNNING"
+
+
+def test_status_board_response_lists_changes_or_everything():
+    board = ManManStatusBoard(max_changes=1)
+    board.update_many([_status(1, "RUNNING"), _status(2, "RUNNING")])
+
+    changes = status_board_response(board, since=1)
+    everything = status_board_response(board, since=0)
+
+    assert changes["version"] == 2
+    assert [status["service_id"] for status in changes["statuses"]] == [2]
+    # the change after version 0 is no longer kept, so it is the whole board
+    assert "since" not in everything
+    assert len(everything["statuses"]) == 2
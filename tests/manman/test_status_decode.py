@@ -0,0 +1,77 @@
+import datetime
+import json
+import timeit
+from unittest import mock
+
+from external.manman_status_api.models.external_status_info import ExternalStatusInfo
+from friendly_computing_machine.bot.subscribe.decode import (
+    StatusDecodeOutcome,
+    decode_status_message,
+)
+
+NOW = datetime.datetime(2026, 10, 19, 12, tzinfo=datetime.timezone.utc)
+MODEL = "friendly_computing_machine.bot.subscribe.decode.ExternalStatusInfo"
+
+
+def _body(as_of: str = "2026-10-19T11:59:00Z", **overrides) -> str:
+    return json.dumps(
+        {
+            "as_of": as_of,
+            "class_name": "Worker",
+            "status_info_id": 1,
+            "status_type": "RUNNING",
+            "worker_id": 3,
+            **overrides,
+        }
+    )
+
+
+def test_fresh_message_is_validated():
+    decoded = decode_status_message(_body(), now=NOW)
+
+    assert decoded.outcome == StatusDecodeOutcome.DECODED
+    assert decoded.status_info.worker_id == 3
+
+
+def test_stale_and_unknown_messages_skip_validation():
+    with mock.patch(MODEL) as model:
+        stale = decode_status_message(_body("2026-10-19T11:00:00+00:00"), now=NOW)
+        unknown = decode_status_message(_body(worker_id=None), now=NOW)
+
+    model.from_dict.assert_not_called()
+    assert stale.outcome == StatusDecodeOutcome.STALE
+    assert stale.as_of == datetime.datetime(
+        2026, 10, 19, 11, tzinfo=datetime.timezone.utc
+    )
+    assert unknown.outcome == StatusDecodeOutcome.UNKNOWN_SERVICE
+
+
+def test_unpeekable_as_of_falls_back_to_validation():
+    decoded = decode_status_message(_body("1760000000"), now=NOW)
+
+    assert decoded.outcome == StatusDecodeOutcome.STALE
+
+
+def test_decode_cost_per_message():
+    """
+    Micro-benchmark, run with -s to see the cost per message of each path.
+    """
+    iterations = 2000
+    stale_body = _body("2026-10-19T11:00:00Z")
+    fresh_body = _body()
+
+    def full_validation():
+        ExternalStatusInfo.from_dict(json.loads(stale_body))
+
+    timings = {
+        "stale": timeit.timeit(
+            lambda: decode_status_message(stale_body, now=NOW), number=iterations
+        ),
+        "fresh": timeit.timeit(
+            lambda: decode_status_message(fresh_body, now=NOW), number=iterations
+        ),
+        "validate everything": timeit.timeit(full_validation, number=iterations),
+    }
+    print()
+    for name, seconds in timings.items():
+        print(f"decode {name}: {seconds / iterations * 1e6:.2f}us/message")
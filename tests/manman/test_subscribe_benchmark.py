@@ -0,0 +1,96 @@
+"""
+Throughput and latency of the ManMan subscriber against in memory stand-ins.
+Run with -s to see the reports, eg `pytest tests/manman/test_subscribe_benchmark.py -s`.
+"""
+
+import datetime
+
+from sqlalchemy import Engine, text
+from subscribe_harness import (
+    FakeSlackWebClient,
+    FakeTemporalClient,
+    generate_status_stream,
+    inline_activity_runner,
+    run_subscriber_benchmark,
+)
+
+
+def test_every_delivery_is_settled_once_forwarded():
+    stream = generate_status_stream(
+        services=50, duplicate_rate=0.2, out_of_order_rate=0.2, stale_rate=0.1
+    )
+    cutoff = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(
+        minutes=5
+    )
+    fresh = [status_info for status_info in stream if status_info.as_of > cutoff]
+
+    report = run_subscriber_benchmark(
+        stream, concurrency=8, coalesce_window_seconds=0, prefetch_count=100
+    )
+    print(f"\nno coalescing: {report}")
+
+    assert report.events == len(stream)
+    assert report.rejected == 0
+    assert report.signals <= len(fresh)
+    assert report.events_per_second > 0
+
+
+def test_coalescing_forwards_fewer_signals():
+    stream = generate_status_stream(services=20, updates_per_service=10)
+
+    report = run_subscriber_benchmark(
+        stream,
+        temporal_client=FakeTemporalClient(latency_seconds=0.001),
+        concurrency=8,
+        coalesce_window_seconds=0.05,
+        prefetch_count=1000,
+    )
+    print(f"\ncoalesced: {report}")
+
+    # CREATED always goes through, the rest of each lifecycle collapses
+    assert 20 * 2 <= report.signals < len(stream)
+
+
+def test_end_to_end_against_postgres(postgres_database: Engine):
+    channel_count = 3
+    with postgres_database.begin() as connection:
+        connection.execute(
+            text(
+                """
+                insert into fcm.slackspecialchanneltype (type_name, friendly_type_name)
+                values ('manman_dev', 'ManMan Dev')
+                """
+            )
+        )
+        for i in range(channel_count):
+            connection.execute(
+                text(
+                    """
+                    with channel as (
+                        insert into fcm.slackchannel (slack_id, name, channel_type, is_music_poll)
+                        values (:slack_id, :slack_id, 'public', false)
+                        returning id
+                    )
+                    insert into fcm.slackspecialchannel
+                        (slack_channel_id, slack_special_channel_type_id, enabled)
+                    select channel.id, t.id, true
+                    from channel, fcm.slackspecialchanneltype t
+                    where t.type_name = 'manman_dev'
+                    """
+                ),
+                {"slack_id": f"CBENCHMARK{i}"},
+            )
+
+    stream = generate_status_stream(services=10, updates_per_service=4)
+    slack_client = FakeSlackWebClient(latency_seconds=0.002)
+    report = run_subscriber_benchmark(
+        stream,
+        temporal_client=FakeTemporalClient(on_signal=inline_activity_runner()),
+        slack_client=slack_client,
+        concurrency=8,
+        coalesce_window_seconds=0,
+    )
+    print(f"\nend to end: {report}")
+
+    # every event posts or edits one message per channel
+    assert report.slack_calls == len(stream) * channel_count
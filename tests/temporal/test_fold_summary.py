@@ -0,0 +1,89 @@
+import asyncio
+from types import SimpleNamespace
+from unittest import mock
+
+from friendly_computing_machine.temporal.ai.activity import (
+    FoldSummaryParams,
+    fold_summary,
+)
+from friendly_computing_machine.temporal.slack.activity import (
+    FoldSlackChannelSummaryParams,
+    fold_slack_channel_summary_activity,
+)
+
+SLACK_ACTIVITY = "friendly_computing_machine.temporal.slack.activity"
+
+
+def test_fold_summary_includes_previous_summary_and_latest_request():
+    gen_text = mock.AsyncMock(return_value="- topic")
+    with mock.patch(
+        "friendly_computing_machine.temporal.ai.activity.gen_text", gen_text
+    ):
+        summary = asyncio.run(
+            fold_summary(
+                FoldSummaryParams(
+                    previous_summary="- old topic",
+                    prompt="what about lunch",
+                    response="tacos",
+                )
+            )
+        )
+
+    assert summary == "- topic"
+    prompt = gen_text.call_args.args[0]
+    assert "- old topic" in prompt
+    assert "what about lunch" in prompt
+    assert "tacos" in prompt
+
+
+def test_overlapping_folds_in_a_channel_both_end_up_in_the_summary():
+    stored = {}
+
+    def get_summary(slack_channel_slack_id):
+        return stored.get(slack_channel_slack_id)
+
+    def save_summary(channel_summary, expected):
+        if stored.get(channel_summary.slack_channel_slack_id) is not expected:
+            return False
+        stored[channel_summary.slack_channel_slack_id] = SimpleNamespace(
+            genai_text_id=channel_summary.genai_text_id,
+            summary=channel_summary.summary,
+            updated_at=channel_summary.updated_at,
+        )
+        return True
+
+    both_read = asyncio.Barrier(2)
+
+    async def fold(params):
+        # the first round of both folds reads the same, empty, summary
+        if not stored:
+            await both_read.wait()
+        return f"{params.previous_summary} + {params.prompt}"
+
+    def request(genai_text_id, prompt):
+        return fold_slack_channel_summary_activity(
+            FoldSlackChannelSummaryParams(
+                slack_channel_slack_id="C1",
+                genai_text_id=genai_text_id,
+                previous_summary="history",
+                prompt=prompt,
+                response="ok",
+            )
+        )
+
+    async def overlap():
+        # the newer request saves first, the older one is folded in after it
+        return await asyncio.gather(request(2, "second"), request(1, "first"))
+
+    with (
+        mock.patch(f"{SLACK_ACTIVITY}.get_genai_channel_summary", get_summary),
+        mock.patch(f"{SLACK_ACTIVITY}.save_genai_channel_summary", save_summary),
+        mock.patch(f"{SLACK_ACTIVITY}.fold_summary", fold),
+    ):
+        saved = asyncio.run(overlap())
+
+    assert saved == [True, True]
+    summary = stored["C1"].summary
+    assert "first" in summary
+    assert "second" in summary
+    assert stored["C1"].genai_text_id == 2
@@ -0,0 +1,186 @@
+import dataclasses
+import datetime
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from temporalio.testing import ActivityEnvironment
+
+from external.manman_status_api.models.external_status_info import ExternalStatusInfo
+from external.manman_status_api.models.status_type import StatusType
+from friendly_computing_machine.temporal.manman.activity import (
+    MANMAN_STATUS_MAX_ATTEMPTS,
+    ProcessManManStatusParams,
+    ProcessManManStatusResult,
+    _fan_out_manman_status_notification,
+    process_manman_status_activity,
+)
+
+MODULE = "friendly_computing_machine.temporal.manman.activity"
+NOW = datetime.datetime.now(datetime.timezone.utc)
+
+
+def _running() -> ExternalStatusInfo:
+    return ExternalStatusInfo(
+        as_of=datetime.datetime.now(datetime.timezone.utc),
+        class_name="Worker",
+        worker_id=3,
+        status_info_id=1,
+        status_type=StatusType.RUNNING,
+    )
+
+
+def _created() -> ExternalStatusInfo:
+    return ExternalStatusInfo(
+        as_of=NOW - datetime.timedelta(minutes=1),
+        class_name="Worker",
+        worker_id=3,
+        status_info_id=1,
+        status_type=StatusType.CREATED,
+    )
+
+
+def _run(params: ProcessManManStatusParams, temporal_attempt: int = 1):
+    env = ActivityEnvironment()
+    env.info = dataclasses.replace(env.info, attempt=temporal_attempt)
+    return env.run(process_manman_status_activity, params)
+
+
+def test_update_without_slack_message_is_recorded_and_not_ready():
+    status_update = SimpleNamespace(id=1, service_type="worker", service_id=3)
+    with (
+        mock.patch(
+            f"{MODULE}.upsert_manman_status_update_returning_slack_message_ts",
+            return_value=(status_update, {}),
+        ) as upsert,
+        mock.patch(f"{MODULE}.slack_send_message") as send,
+    ):
+        result = _run(ProcessManManStatusParams(status_info=_running()))
+        dropped = _run(
+            ProcessManManStatusParams(
+                status_info=_running(), attempt=MANMAN_STATUS_MAX_ATTEMPTS - 1
+            )
+        )
+
+    assert result == ProcessManManStatusResult.NOT_READY
+    assert dropped == ProcessManManStatusResult.DROPPED
+    assert upsert.call_count == 2
+    send.assert_not_called()
+
+
+def test_parked_gauge_is_not_decremented_by_retries():
+    status_update = SimpleNamespace(id=1, service_type="worker", service_id=3)
+    with (
+        mock.patch(
+            f"{MODULE}.upsert_manman_status_update_returning_slack_message_ts",
+            side_effect=[(status_update, {}), (status_update, {1: NOW})],
+        ),
+        mock.patch(f"{MODULE}._get_manman_channels", return_value=[]),
+        mock.patch(f"{MODULE}.upsert_manman_status_slack_messages"),
+        mock.patch(f"{MODULE}.parked_counter") as parked_counter,
+    ):
+        # parked, then its rerun fails after unparking and is retried by temporal
+        _run(ProcessManManStatusParams(status_info=_running()))
+        with mock.patch(
+            f"{MODULE}.upsert_manman_status_update_returning_slack_message_ts",
+            side_effect=RuntimeError("db down"),
+        ):
+            with pytest.raises(RuntimeError):
+                _run(ProcessManManStatusParams(status_info=_running(), attempt=1))
+        _run(
+            ProcessManManStatusParams(status_info=_running(), attempt=1),
+            temporal_attempt=2,
+        )
+
+    assert sum(c.args[0] for c in parked_counter.add.mock_calls) == 0
+
+
+def test_created_after_a_later_status_still_posts_the_message():
+    status_update = SimpleNamespace(id=1, service_type="worker", service_id=3)
+    channels = [(None, SimpleNamespace(id=1, slack_id="C1"), None)]
+    with (
+        mock.patch(
+            f"{MODULE}.upsert_manman_status_update_returning_slack_message_ts",
+            side_effect=[(status_update, {}), (None, {}), (status_update, {1: NOW})],
+        ),
+        mock.patch(
+            f"{MODULE}.get_manman_status_update_from_create",
+            return_value=status_update,
+        ),
+        mock.patch(f"{MODULE}.get_manman_status_slack_message_ts", return_value={}),
+        mock.patch(f"{MODULE}._get_manman_channels", return_value=channels),
+        mock.patch(f"{MODULE}.create_manman_status_blocks"),
+        mock.patch(
+            f"{MODULE}.slack_send_message", return_value=SimpleNamespace(id=11)
+        ) as send,
+        mock.patch(f"{MODULE}.upsert_manman_status_slack_messages") as link,
+    ):
+        # RUNNING is recorded first and parked, then the older CREATED arrives
+        running = _run(ProcessManManStatusParams(status_info=_running()))
+        created = _run(ProcessManManStatusParams(status_info=_created()))
+        rerun = _run(ProcessManManStatusParams(status_info=_running(), attempt=1))
+
+    assert running == ProcessManManStatusResult.NOT_READY
+    assert created == ProcessManManStatusResult.PROCESSED
+    assert rerun == ProcessManManStatusResult.PROCESSED
+    link.assert_any_call(1, {1: 11})
+    update_ts = [c.kwargs["update_ts"] for c in send.mock_calls]
+    # the CREATED posts the message, the parked RUNNING edits it
+    assert update_ts[0] is None
+    assert update_ts[1] is not None
+
+
+def test_late_created_does_not_touch_channels_that_have_the_message():
+    status_update = SimpleNamespace(id=1, service_type="worker", service_id=3)
+    with (
+        mock.patch(
+            f"{MODULE}.upsert_manman_status_update_returning_slack_message_ts",
+            return_value=(None, {}),
+        ),
+        mock.patch(
+            f"{MODULE}.get_manman_status_update_from_create",
+            return_value=status_update,
+        ),
+        mock.patch(
+            f"{MODULE}.get_manman_status_slack_message_ts", return_value={1: NOW}
+        ),
+        mock.patch(
+            f"{MODULE}._get_manman_channels",
+            return_value=[(None, SimpleNamespace(id=1, slack_id="C1"), None)],
+        ),
+        mock.patch(f"{MODULE}.slack_send_message") as send,
+    ):
+        result = _run(ProcessManManStatusParams(status_info=_created()))
+
+    assert result == ProcessManManStatusResult.PROCESSED
+    send.assert_not_called()
+
+
+def test_fan_out_updates_known_channels_posts_new_ones_and_reports_failures():
+    def send(channel, blocks, update_ts):
+        if channel == "C3":
+            raise RuntimeError("channel_not_found")
+        return SimpleNamespace(id={"C1": 11, "C2": 12}[channel])
+
+    channels = [
+        (None, SimpleNamespace(id=1, slack_id="C1"), None),
+        (None, SimpleNamespace(id=2, slack_id="C2"), None),
+        (None, SimpleNamespace(id=3, slack_id="C3"), None),
+    ]
+    existing = {1: datetime.datetime.now()}
+
+    with (
+        mock.patch(f"{MODULE}.create_manman_status_blocks"),
+        mock.patch(f"{MODULE}.slack_send_message", side_effect=send) as send_mock,
+    ):
+        posted, failed = _fan_out_manman_status_notification(
+            _running(), channels, existing
+        )
+
+    assert posted == {2: 12}
+    assert failed == ["C3"]
+    update_ts = {
+        c.kwargs["channel"]: c.kwargs["update_ts"] for c in send_mock.mock_calls
+    }
+    assert update_ts["C1"] is not None
+    assert update_ts["C2"] is None
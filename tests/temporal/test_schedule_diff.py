@@ -0,0 +1,74 @@
+import dataclasses
+from datetime import timedelta
+
+import pytest
+from temporalio.client import (
+    ScheduleActionStartWorkflow,
+    ScheduleIntervalSpec,
+    ScheduleSpec,
+    ScheduleUpdateInput,
+)
+from temporalio.converter import PayloadConverter
+
+from friendly_computing_machine.temporal.base import get_schedule_diff
+from friendly_computing_machine.temporal.slack.workflow import SlackMessageQODWorkflow
+
+
+@pytest.fixture(autouse=True)
+def queue_name(monkeypatch):
+    monkeypatch.setattr(
+        "friendly_computing_machine.temporal.base.get_temporal_queue_name",
+        lambda name: f"fcm-test-{name}",
+    )
+
+
+def _described(schedule):
+    # roughly what describe returns: encoded args and the defaults filled in
+    action = schedule.action
+    return dataclasses.replace(
+        schedule,
+        action=dataclasses.replace(
+            action,
+            args=PayloadConverter.default.to_payloads(action.args),
+        ),
+        spec=dataclasses.replace(
+            schedule.spec,
+            intervals=[
+                ScheduleIntervalSpec(every=i.every, offset=timedelta(0))
+                for i in schedule.spec.intervals
+            ],
+            jitter=timedelta(0),
+        ),
+    )
+
+
+def test_schedule_diff_empty_when_unchanged():
+    desired = SlackMessageQODWorkflow().get_schedule("test")
+    assert get_schedule_diff(desired, _described(desired)) == []
+
+
+def test_schedule_diff_detects_spec_and_action_changes():
+    wf = SlackMessageQODWorkflow()
+    current = _described(wf.get_schedule("test"))
+    desired = wf.get_schedule("test")
+    desired.spec = ScheduleSpec(
+        intervals=[ScheduleIntervalSpec(every=timedelta(minutes=5))]
+    )
+    desired.action = ScheduleActionStartWorkflow(
+        wf.run, id=wf.get_id("test"), task_queue="somewhere-else"
+    )
+
+    assert get_schedule_diff(desired, current) == ["spec", "action"]
+
+
+def test_schedule_update_skipped_when_unchanged_and_keeps_state():
+    wf = SlackMessageQODWorkflow()
+    current = _described(wf.get_schedule("test"))
+    description = type("Description", (), {"id": "x", "schedule": current})()
+    assert wf.get_schedule_update(ScheduleUpdateInput(description), "test") is None
+
+    current.state.paused = True
+    update = wf.get_schedule_update(ScheduleUpdateInput(description), "other")
+    assert update is not None
+    assert update.schedule.action.id == wf.get_id("other")
+    assert update.schedule.state.paused
@@ -0,0 +1,54 @@
+from unittest import mock
+
+from friendly_computing_machine.models.watermark import Watermark
+from friendly_computing_machine.temporal.db.job_activity import (
+    SlackChangeMarker,
+    check_slack_changes_activity,
+)
+
+MARKER_DICT = {
+    "slack_message_id": 10,
+    "genai_text_id": 5,
+    "slack_user_id": 3,
+    "slack_channel_id": 2,
+    "slack_team_id": 1,
+}
+
+
+def _check(watermark: Watermark | None):
+    with (
+        mock.patch(
+            "friendly_computing_machine.temporal.db.job_activity.get_slack_change_marker",
+            return_value=MARKER_DICT,
+        ),
+        mock.patch(
+            "friendly_computing_machine.temporal.db.job_activity.get_watermark",
+            return_value=watermark,
+        ),
+    ):
+        return check_slack_changes_activity("test")
+
+
+def test_marker_watermark_round_trip():
+    marker = SlackChangeMarker(**MARKER_DICT)
+    assert SlackChangeMarker.from_watermark_value(marker.to_watermark_value()) == marker
+
+
+def test_no_watermark_has_changed():
+    result = _check(None)
+    assert result.has_changed
+    assert result.marker == SlackChangeMarker(**MARKER_DICT)
+
+
+def test_same_watermark_has_not_changed():
+    value = SlackChangeMarker(**MARKER_DICT).to_watermark_value()
+    result = _check(Watermark(name="test", value=value, as_of=None))
+    assert not result.has_changed
+
+
+def test_new_message_has_changed():
+    value = SlackChangeMarker(**{**MARKER_DICT, "slack_message_id": 9})
+    result = _check(
+        Watermark(name="test", value=value.to_watermark_value(), as_of=None)
+    )
+    assert result.has_changed
@@ -0,0 +1,79 @@
+from unittest import mock
+
+from friendly_computing_machine.temporal.slack.activity import (
+    backfill_slack_user_info_activity,
+)
+
+ACTIVITY_MODULE = "friendly_computing_machine.temporal.slack.activity"
+
+
+def _profile_response(display_name: str):
+    response = mock.MagicMock()
+    response.status_code = 200
+    response.get.return_value = {"display_name": display_name}
+    return response
+
+
+def _run_backfill(user_team_pairs, pages, known_slack_ids):
+    slack_client = mock.MagicMock()
+    slack_client.team_id = "T1"
+    slack_client.users_list.return_value = pages
+    slack_client.users_profile_get.side_effect = lambda user: _profile_response(
+        f"profile-{user}"
+    )
+    with (
+        mock.patch(
+            f"{ACTIVITY_MODULE}.get_slack_web_client", return_value=slack_client
+        ),
+        mock.patch(
+            f"{ACTIVITY_MODULE}.get_user_teams_from_messages",
+            return_value=user_team_pairs,
+        ),
+        mock.patch(
+            f"{ACTIVITY_MODULE}.get_slack_user_slack_ids",
+            return_value=known_slack_ids,
+        ),
+        mock.patch(
+            f"{ACTIVITY_MODULE}.replace_slack_user_staging",
+            side_effect=lambda run_id, slack_users: len(slack_users),
+        ) as replace_staging,
+    ):
+        result = backfill_slack_user_info_activity("run-1")
+    staged = {user.slack_id: user for user in replace_staging.call_args.args[1]}
+    return result, staged, slack_client
+
+
+def test_backfill_uses_users_list_pages():
+    pages = [
+        {"members": [{"id": "U1", "is_bot": True, "profile": {"real_name": "one"}}]},
+        {
+            "members": [
+                {"id": "U2", "profile": {"display_name": "two"}},
+                # never posted, not staged
+                {"id": "U9", "profile": {"display_name": "nine"}},
+            ]
+        },
+    ]
+    result, staged, slack_client = _run_backfill(
+        {("U1", "T1"), ("U2", "T1")}, pages, set()
+    )
+
+    assert result.staged_count == 2
+    assert result.failed_count == 0
+    assert staged["U1"].name == "one"
+    assert staged["U1"].is_bot
+    assert staged["U2"].name == "two"
+    slack_client.users_profile_get.assert_not_called()
+
+
+def test_backfill_only_fetches_unknown_users_individually():
+    pages = [{"members": [{"id": "U1", "profile": {"display_name": "one"}}]}]
+    result, staged, slack_client = _run_backfill(
+        {("U1", "T1"), ("UKNOWN", "T2"), ("UNEW", "T2")}, pages, {"UKNOWN"}
+    )
+
+    assert set(staged) == {"U1", "UNEW"}
+    assert staged["UNEW"].name == "profile-UNEW"
+    assert staged["UNEW"].slack_team_slack_id == "T2"
+    slack_client.users_profile_get.assert_called_once_with(user="UNEW")
+    assert result.failed_count == 0
@@ -0,0 +1,67 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+from friendly_computing_machine.temporal.slack.activity import (
+    StreamSlackResponseParams,
+    stream_gemini_response_to_slack,
+)
+
+ACTIVITY_MODULE = "friendly_computing_machine.temporal.slack.activity"
+
+
+def _stream(chunks, monotonic_values, fail_after=None):
+    async def fake_stream(prompt):
+        for i, chunk in enumerate(chunks):
+            if fail_after is not None and i == fail_after:
+                raise RuntimeError("stream broke")
+            yield chunk
+
+    web_client = mock.MagicMock()
+    web_client.chat_postMessage.return_value = {"ts": "123.456"}
+    with (
+        mock.patch(f"{ACTIVITY_MODULE}.get_slack_web_client", return_value=web_client),
+        mock.patch(f"{ACTIVITY_MODULE}.gen_text_stream", fake_stream),
+        mock.patch(f"{ACTIVITY_MODULE}.slack_send_message") as send_message,
+        mock.patch(f"{ACTIVITY_MODULE}.activity.heartbeat"),
+        mock.patch(f"{ACTIVITY_MODULE}.time") as fake_time,
+    ):
+        fake_time.monotonic.side_effect = monotonic_values
+        try:
+            result = asyncio.run(
+                stream_gemini_response_to_slack(
+                    StreamSlackResponseParams("C1", "prompt")
+                )
+            )
+        except RuntimeError:
+            result = None
+    return result, web_client, send_message
+
+
+def test_stream_updates_are_throttled():
+    # start at 0, then one reading per chunk, plus one after each update
+    result, web_client, send_message = _stream(["a", "b", "c"], [0, 0.5, 1.5, 1.5, 2.0])
+
+    assert result.response == "abc"
+    assert result.slack_message_ts == "123.456"
+    web_client.chat_postMessage.assert_called_once()
+    # only the chunk that crossed the interval was pushed, and never recorded
+    send_message.assert_called_once_with(
+        "C1", message="ab", update_ts="123.456", record_message=False
+    )
+
+
+def test_stream_failure_removes_placeholder():
+    result, web_client, _ = _stream(["a", "b"], [0, 0.1], fail_after=1)
+
+    assert result is None
+    web_client.chat_delete.assert_called_once_with(channel="C1", ts="123.456")
+
+
+@pytest.mark.parametrize("chunks", [[], ["only"]])
+def test_stream_without_updates(chunks):
+    result, _, send_message = _stream(chunks, [0] + [0.1] * len(chunks))
+
+    assert result.response == "".join(chunks)
+    send_message.assert_not_called()
@@ -0,0 +1,48 @@
+import asyncio
+import json
+from unittest import mock
+
+from friendly_computing_machine.temporal.ai.activity import (
+    STRUCTURED_RESPONSE_SCHEMA,
+    StructuredResponse,
+    StructuredResponseParams,
+    generate_structured_response,
+)
+
+
+def test_generate_structured_response_single_call():
+    model = mock.MagicMock()
+    model.generate_content_async = mock.AsyncMock(
+        return_value=mock.MagicMock(
+            text=json.dumps(
+                {
+                    "vibe": "hungry",
+                    "response": "lunch at noon, everyone come",
+                    "is_call_to_action": True,
+                }
+            )
+        )
+    )
+    with mock.patch(
+        "friendly_computing_machine.gemini.pool.genai.GenerativeModel",
+        return_value=model,
+    ) as generative_model:
+        result = asyncio.run(
+            generate_structured_response(
+                StructuredResponseParams(
+                    prompt_text="lunch?",
+                    previous_context="- food",
+                    inversion_probability=0,
+                )
+            )
+        )
+
+    assert result == StructuredResponse(
+        response="lunch at noon, everyone come",
+        vibe="hungry",
+        is_call_to_action=True,
+    )
+    model.generate_content_async.assert_awaited_once()
+    generation_config = generative_model.call_args.kwargs["generation_config"]
+    assert generation_config["response_mime_type"] == "application/json"
+    assert generation_config["response_schema"] == STRUCTURED_RESPONSE_SCHEMA
@@ -0,0 +1,35 @@
+from friendly_computing_machine.temporal.util import TaskQueue
+from friendly_computing_machine.temporal.worker import (
+    WORKER_QUEUE_CONFIGS,
+    WORKFLOWS,
+    get_worker_queue_configs,
+)
+
+
+def test_every_queue_has_a_config():
+    assert {config.queue for config in WORKER_QUEUE_CONFIGS} == set(TaskQueue)
+
+
+def test_activities_registered_once():
+    activities = [
+        activity for config in WORKER_QUEUE_CONFIGS for activity in config.activities
+    ]
+    assert len(activities) == len(set(activities))
+
+
+def test_workflows_only_on_main():
+    for config in WORKER_QUEUE_CONFIGS:
+        if config.queue == TaskQueue.MAIN:
+            assert config.workflows == WORKFLOWS
+        else:
+            assert config.workflows == []
+
+
+def test_get_worker_queue_configs_subset():
+    configs = get_worker_queue_configs([TaskQueue.AI, TaskQueue.DB])
+    assert [config.queue for config in configs] == [TaskQueue.AI, TaskQueue.DB]
+
+
+def test_get_worker_queue_configs_default_all():
+    assert len(get_worker_queue_configs()) == len(WORKER_QUEUE_CONFIGS)
+    assert len(get_worker_queue_configs([])) == len(WORKER_QUEUE_CONFIGS)
@@ -0,0 +1,69 @@
+"""
+Import cost of each fcm subcommand, measured with python -X importtime in a
+fresh interpreter. Each command should only import its own subsystem.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+# command -> (import time budget in seconds, modules it must not import)
+STARTUP_BUDGETS = {
+    "migration": (
+        3.0,
+        ["temporalio", "slack_bolt", "google.generativeai", "amqpstorm", "grpc"],
+    ),
+    "tools": (1.0, ["sqlalchemy", "temporalio", "slack_bolt"]),
+    "bot": (5.0, ["amqpstorm"]),
+    "subscribe": (5.0, ["google.generativeai"]),
+    "workflow": (6.0, ["amqpstorm"]),
+}
+
+LOAD_COMMAND = """
+import click, typer
+from friendly_computing_machine.cli.main import app
+group = typer.main.get_command(app)
+assert group.get_command(click.Context(group), {command!r}) is not None
+"""
+
+
+def _import_times(command: str) -> dict[str, tuple[int, int]]:
+    """
+    :return: module -> (cumulative microseconds, nesting depth)
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            LOAD_COMMAND.format(command=command),
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        times[name.strip()] = (int(cumulative), depth)
+    return times
+
+
+@pytest.mark.parametrize("command", STARTUP_BUDGETS)
+def test_subcommand_startup_budget(command: str):
+    budget_seconds, forbidden = STARTUP_BUDGETS[command]
+    times = _import_times(command)
+
+    imported = [module for module in forbidden if module in times]
+    assert not imported, f"fcm {command} imports {imported}"
+
+    total_seconds = sum(cum for cum, depth in times.values() if depth == 0) / 1e6
+    assert total_seconds < budget_seconds, (
+        f"fcm {command} spends {total_seconds:.2f}s importing, "
+        f"budget is {budget_seconds}s"
+    )
@@ -0,0 +1,94 @@
+import asyncio
+import datetime
+from unittest import mock
+
+from friendly_computing_machine.gemini.cache import (
+    GeminiResponseCache,
+    make_cache_key,
+)
+from friendly_computing_machine.temporal.ai.activity import gen_text
+
+MODEL = "models/test"
+
+
+def _cache(max_entries: int = 2, ttl_seconds: int = 60) -> GeminiResponseCache:
+    return GeminiResponseCache(
+        max_entries=max_entries, ttl=datetime.timedelta(seconds=ttl_seconds)
+    )
+
+
+def test_cache_key_covers_model_config_and_prompt():
+    key = make_cache_key(MODEL, None, "hello")
+    assert key == make_cache_key(MODEL, {}, "hello")
+    assert key != make_cache_key("models/other", None, "hello")
+    assert key != make_cache_key(MODEL, {"response_mime_type": "json"}, "hello")
+    assert key != make_cache_key(MODEL, None, "hello!")
+
+
+def test_cache_lru_eviction():
+    cache = _cache(max_entries=2)
+    asyncio.run(cache.set("a", MODEL, "A"))
+    asyncio.run(cache.set("b", MODEL, "B"))
+    # touch a so b is the least recently used
+    assert asyncio.run(cache.get("a", MODEL)) == "A"
+    asyncio.run(cache.set("c", MODEL, "C"))
+
+    assert asyncio.run(cache.get("b", MODEL)) is None
+    assert asyncio.run(cache.get("a", MODEL)) == "A"
+    assert asyncio.run(cache.get("c", MODEL)) == "C"
+    assert cache.stats == {"memory_hit": 3, "miss": 1}
+    assert cache.hit_rate() == 0.75
+
+
+def test_cache_ttl_expiry():
+    cache = _cache(ttl_seconds=10)
+    with mock.patch(
+        "friendly_computing_machine.gemini.cache.time.monotonic", return_value=100
+    ):
+        asyncio.run(cache.set("a", MODEL, "A"))
+    with mock.patch(
+        "friendly_computing_machine.gemini.cache.time.monotonic", return_value=111
+    ):
+        assert asyncio.run(cache.get("a", MODEL)) is None
+
+
+def test_gen_text_only_calls_gemini_once_for_the_same_prompt():
+    model = mock.MagicMock(model_name=MODEL)
+    model.generate_content_async = mock.AsyncMock(
+        return_value=mock.MagicMock(text="hi")
+    )
+    with (
+        mock.patch(
+            "friendly_computing_machine.gemini.pool.genai.GenerativeModel",
+            return_value=model,
+        ),
+        mock.patch(
+            "friendly_computing_machine.temporal.ai.activity.get_gemini_response_cache",
+            return_value=_cache(),
+        ),
+    ):
+        assert asyncio.run(gen_text("hello")) == "hi"
+        assert asyncio.run(gen_text("hello")) == "hi"
+
+    model.generate_content_async.assert_awaited_once()
+
+
+def test_gen_text_skips_caching_rejected_responses():
+    model = mock.MagicMock(model_name=MODEL)
+    model.generate_content_async = mock.AsyncMock(
+        return_value=mock.MagicMock(text="not json")
+    )
+    with (
+        mock.patch(
+            "friendly_computing_machine.gemini.pool.genai.GenerativeModel",
+            return_value=model,
+        ),
+        mock.patch(
+            "friendly_computing_machine.temporal.ai.activity.get_gemini_response_cache",
+            return_value=_cache(),
+        ),
+    ):
+        for _ in range(2):
+            asyncio.run(gen_text("hello", is_cacheable=lambda text: False))
+
+    assert model.generate_content_async.await_count == 2
@@ -0,0 +1,105 @@
+import asyncio
+from unittest import mock
+
+import pytest
+from google.api_core import exceptions as google_exceptions
+
+from friendly_computing_machine.gemini.pool import AIMDLimiter, GeminiModelPool
+
+
+def test_limiter_caps_concurrency():
+    limiter = AIMDLimiter("test", max_limit=2)
+    peak = 0
+
+    async def request():
+        nonlocal peak
+        async with limiter.slot():
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    async def burst():
+        await asyncio.gather(*(request() for _ in range(10)))
+
+    asyncio.run(burst())
+    assert peak == 2
+    assert limiter.in_flight == 0
+
+
+def test_cancelled_waiter_passes_its_wakeup_on():
+    limiter = AIMDLimiter("test", max_limit=1)
+
+    async def scenario():
+        await limiter.acquire()
+        first = asyncio.create_task(limiter.acquire())
+        second = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+
+        # wakes first, which is cancelled before it gets to run
+        limiter.release("success")
+        first.cancel()
+
+        await asyncio.wait_for(second, timeout=1)
+        assert first.cancelled()
+        assert limiter.in_flight == 1
+
+    asyncio.run(scenario())
+
+
+def test_limiter_halves_on_throttle_once_per_cooldown():
+    limiter = AIMDLimiter("test", max_limit=8)
+
+    async def throttled():
+        with pytest.raises(google_exceptions.ResourceExhausted):
+            async with limiter.slot():
+                raise google_exceptions.ResourceExhausted("quota")
+
+    asyncio.run(throttled())
+    assert limiter.limit == 4
+    # a second failure from the same burst doesn't shrink it again
+    asyncio.run(throttled())
+    assert limiter.limit == 4
+
+
+def test_limiter_recovers_additively():
+    limiter = AIMDLimiter("test", max_limit=8)
+    limiter.limit = 4
+
+    async def succeed():
+        async with limiter.slot():
+            pass
+
+    for _ in range(4):
+        asyncio.run(succeed())
+    # about one slot per limit worth of successes
+    assert 4.9 < limiter.limit < 5.1
+
+
+def test_limiter_errors_do_not_change_limit():
+    limiter = AIMDLimiter("test", max_limit=4)
+
+    async def fail():
+        with pytest.raises(ValueError):
+            async with limiter.slot():
+                raise ValueError("bad prompt")
+
+    asyncio.run(fail())
+    assert limiter.limit == 4
+    assert limiter.in_flight == 0
+
+
+def test_pool_reuses_models_and_limiters():
+    pool = GeminiModelPool(default_max_concurrency=4, max_concurrency_by_model={"b": 1})
+    with mock.patch(
+        "friendly_computing_machine.gemini.pool.genai.GenerativeModel",
+        side_effect=lambda generation_config: mock.MagicMock(),
+    ) as generative_model:
+        default_model = pool.get_model()
+        assert pool.get_model({}) is default_model
+        assert pool.get_model({"response_mime_type": "application/json"}) is not (
+            default_model
+        )
+    assert generative_model.call_count == 2
+
+    assert pool.get_limiter("a") is pool.get_limiter("a")
+    assert pool.get_limiter("a").max_limit == 4
+    assert pool.get_limiter("b").max_limit == 1
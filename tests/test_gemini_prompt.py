@@ -0,0 +1,59 @@
+import asyncio
+import datetime
+from unittest import mock
+
+from friendly_computing_machine.gemini.prompt import (
+    PromptBuilder,
+    estimate_tokens,
+    truncate_to_tokens,
+)
+from friendly_computing_machine.models.genai import GenAIText
+from friendly_computing_machine.temporal.ai.activity import generate_summary
+
+
+def test_estimate_tokens_rounds_up():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcd") == 1
+    assert estimate_tokens("abcde") == 2
+
+
+def test_truncate_to_tokens():
+    assert truncate_to_tokens("short", 10) == "short"
+    truncated = truncate_to_tokens("x" * 1000, 10)
+    assert estimate_tokens(truncated) <= 10
+    assert truncated.endswith("...(truncated)")
+
+
+def test_builder_keeps_newest_entries_within_budget():
+    entries = [f"{i}" * 40 for i in range(5)]  # 10 tokens each, oldest first
+    prompt = PromptBuilder(token_budget=35).build(entries, header="h" * 4, footer="f")
+
+    assert prompt.entries_included == 3
+    assert prompt.entries_dropped == 2
+    assert prompt.text == "hhhh" + "".join(entries[2:]) + "f"
+    assert prompt.estimated_tokens <= 35
+
+
+def test_generate_summary_prompt_is_bounded():
+    messages = [
+        GenAIText(
+            id=i,
+            slack_channel_slack_id="C1",
+            slack_user_slack_id="U1",
+            prompt=f"prompt {i}",
+            response="r" * 100_000,
+            created_at=datetime.datetime(2025, 1, 1) + datetime.timedelta(minutes=i),
+        )
+        for i in range(50)
+    ]
+    gen_text = mock.AsyncMock(return_value="- topics")
+    with mock.patch(
+        "friendly_computing_machine.temporal.ai.activity.gen_text", gen_text
+    ):
+        assert asyncio.run(generate_summary(messages, token_budget=2000)) == "- topics"
+
+    prompt = gen_text.call_args.args[0]
+    assert estimate_tokens(prompt) <= 2000
+    # the newest message always makes it in, the oldest are dropped first
+    assert "message_49" in prompt
+    assert "message_0:" not in prompt
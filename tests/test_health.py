@@ -0,0 +1,29 @@
+import json
+import socketserver
+import threading
+import urllib.request
+
+import pytest
+
+from friendly_computing_machine.health import (
+    HealthCheckHandler,
+    register_health_route,
+)
+
+
+@pytest.fixture
+def health_url():
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), HealthCheckHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_registered_route_serves_json_and_the_rest_stays_ok(health_url):
+    register_health_route("/test/echo", lambda query: {"query": query})
+
+    with urllib.request.urlopen(f"{health_url}/test/echo?since=3") as response:
+        assert json.load(response) == {"query": {"since": ["3"]}}
+    with urllib.request.urlopen(f"{health_url}/") as response:
+        assert response.read() == b"ok"
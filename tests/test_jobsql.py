@@ -0,0 +1,79 @@
+"""Tests for the raw SQL jobs in db/jobsql.py, against postgres."""
+
+import datetime
+
+from sqlalchemy import Engine
+from sqlmodel import Session, select, update
+
+from friendly_computing_machine.db.dal import replace_slack_user_staging
+from friendly_computing_machine.db.jobsql import merge_slack_user_staging
+from friendly_computing_machine.models.slack import (
+    SlackTeam,
+    SlackUser,
+    SlackUserCreate,
+    SlackUserStaging,
+)
+
+
+def _user(slack_id: str, name: str) -> SlackUserCreate:
+    return SlackUserCreate(slack_id=slack_id, name=name, slack_team_slack_id="T1")
+
+
+def test_merge_slack_user_staging(postgres_database: Engine):
+    with Session(postgres_database) as session:
+        team = SlackTeam(slack_id="T1", name="team")
+        session.add(team)
+        session.add(SlackUser(slack_id="U1", name="old", slack_team_slack_id="T1"))
+        session.add(SlackUser(slack_id="U3", name="same", slack_team_slack_id="T1"))
+        session.commit()
+        team_id = team.id
+        # U3 is already up to date
+        session.exec(
+            update(SlackUser)
+            .where(SlackUser.slack_id == "U3")
+            .values(slack_team_id=team_id)
+        )
+        # left behind by a run that never merged
+        session.add(
+            SlackUserStaging(
+                run_id="abandoned",
+                slack_id="U9",
+                name="abandoned",
+                slack_team_slack_id="T1",
+                created_at=datetime.datetime.now() - datetime.timedelta(days=2),
+            )
+        )
+        session.commit()
+
+    replace_slack_user_staging(
+        "run",
+        [
+            # a user staged twice in one run takes the last one
+            _user("U1", "stale"),
+            _user("U1", "new"),
+            _user("U2", "fresh"),
+            _user("U3", "same"),
+        ],
+    )
+    # a run that is still going
+    replace_slack_user_staging("other", [_user("U4", "other")])
+
+    # U1 is updated, U2 inserted, U3 is unchanged and not written
+    assert merge_slack_user_staging("run") == 2
+
+    with Session(postgres_database) as session:
+        users = {
+            user.slack_id: (user.name, user.slack_team_id)
+            for user in session.exec(select(SlackUser)).all()
+        }
+        staged = {
+            (staging.run_id, staging.slack_id)
+            for staging in session.exec(select(SlackUserStaging)).all()
+        }
+    assert users == {
+        "U1": ("new", team_id),
+        "U2": ("fresh", team_id),
+        "U3": ("same", team_id),
+    }
+    # only this run's rows and rows older than a day are cleared
+    assert staged == {("other", "U4")}
@@ -2,33 +2,150 @@
 Basic tests for the ManMan Subscribe Service
 """
 
+import asyncio
+import datetime
 from unittest import mock
 from unittest.mock import Mock
 
+from external.manman_status_api.models.external_status_info import ExternalStatusInfo
+from external.manman_status_api.models.status_type import StatusType
 from friendly_computing_machine.bot.subscribe.service import ManManSubscribeService
 
 
+def _make_service() -> ManManSubscribeService:
+    service = ManManSubscribeService(
+        app_env="test",
+        rabbitmq_connection_manager=Mock(),
+        slack_api=Mock(),
+        manman_status_api=Mock(),
+    )
+    service._setup_channel(Mock())
+    return service
+
+
 def test_service_initialization():
     """Test that the service can be initialized with required parameters."""
     # Mock the RabbitMQ connection, Slack API, and ManMan Status API
-    mock_rabbitmq_connection = Mock()
+    mock_rabbitmq_connection_manager = Mock()
     mock_slack_api = Mock()
     mock_manman_status_api = Mock()
     app_env = "test"
 
+    service = ManManSubscribeService(
+        app_env=app_env,
+        rabbitmq_connection_manager=mock_rabbitmq_connection_manager,
+        slack_api=mock_slack_api,
+        manman_status_api=mock_manman_status_api,
+    )
+
+    assert service._rabbitmq_connection_manager == mock_rabbitmq_connection_manager
+    assert service._slack_api == mock_slack_api
+    assert service._manman_status_api == mock_manman_status_api
+    assert service._app_env == app_env
+    assert not service._is_running
+
+
+def test_status_update_signals_service_workflow():
+    service = _make_service()
+    service._temporal_client = mock.AsyncMock()
+    status_info = ExternalStatusInfo(
+        as_of=datetime.datetime.now(datetime.timezone.utc),
+        class_name="GameServerInstance",
+        game_server_instance_id=7,
+        status_info_id=1,
+        status_type=StatusType.RUNNING,
+    )
+
     with mock.patch(
-        "friendly_computing_machine.bot.subscribe.service.get_slack_special_channel_type_from_name",
-        return_value=None,
+        "friendly_computing_machine.bot.subscribe.service.get_temporal_queue_name",
+        return_value="fcm-test-main",
     ):
-        service = ManManSubscribeService(
-            app_env=app_env,
-            rabbitmq_connection=mock_rabbitmq_connection,
-            slack_api=mock_slack_api,
-            manman_status_api=mock_manman_status_api,
-        )
-
-        assert service._rabbitmq_connection == mock_rabbitmq_connection
-        assert service._slack_api == mock_slack_api
-        assert service._manman_status_api == mock_manman_status_api
-        assert service._app_env == app_env
-        assert not service._is_running
+        asyncio.run(service._signal_status_update(status_info))
+
+    call = service._temporal_client.start_workflow.call_args
+    params = call.args[1]
+    assert (params.service_type, params.service_id) == ("server", 7)
+    assert call.kwargs["id"] == "fcm-test-manman-status-server-7"
+    assert call.kwargs["start_signal"] == "status_update"
+    assert call.kwargs["start_signal_args"] == [status_info]
+
+
+def _forward_events(service, status_types) -> list:
+    forwarded = []
+
+    async def signal(status_info):
+        forwarded.append((status_info.status_info_id, status_info.status_type))
+
+    service._signal_status_update = signal
+    now = datetime.datetime.now(datetime.timezone.utc)
+
+    async def run():
+        service._loop = asyncio.get_running_loop()
+        service._partitions = [asyncio.Queue(), asyncio.Queue()]
+        tasks = [
+            asyncio.create_task(service._run_partition(p)) for p in service._partitions
+        ]
+        for tag, status_type in enumerate(status_types, start=1):
+            service._ack_tracker.received(tag)
+            service._coalesce(
+                service._ack_tracker,
+                tag,
+                ExternalStatusInfo(
+                    as_of=now + datetime.timedelta(seconds=tag),
+                    class_name="Worker",
+                    worker_id=1,
+                    status_info_id=tag,
+                    status_type=status_type,
+                ),
+            )
+        while service._ack_tracker.in_flight:
+            await asyncio.sleep(0.001)
+        for task in tasks:
+            task.cancel()
+
+    asyncio.run(run())
+    return forwarded
+
+
+def test_partitions_forward_in_order_and_ack():
+    service = _make_service()
+    service._coalesce_window_seconds = 0
+
+    forwarded = _forward_events(service, [StatusType.RUNNING] * 3)
+
+    assert [tag for tag, _ in forwarded] == [1, 2, 3]
+    # all three settle as a single multiple ack
+    service._channel.basic.ack.assert_called_once_with(delivery_tag=3, multiple=True)
+
+
+def test_burst_is_coalesced_to_newest_after_created():
+    service = _make_service()
+    service._coalesce_window_seconds = 0.01
+
+    forwarded = _forward_events(
+        service,
+        [
+            StatusType.CREATED,
+            StatusType.INITIALIZING,
+            StatusType.RUNNING,
+            StatusType.COMPLETE,
+        ],
+    )
+
+    assert forwarded == [(1, StatusType.CREATED), (4, StatusType.COMPLETE)]
+    assert service._ack_tracker.in_flight == 0
+
+
+def test_setup_channel_redeclares_on_new_channel():
+    service = _make_service()
+    old_tracker = service._ack_tracker
+    channel = Mock()
+
+    service._setup_channel(channel)
+
+    assert service._ack_tracker is not old_tracker
+    channel.queue.declare.assert_called_once_with(
+        queue="fcm-test.manman.generic.status", durable=True
+    )
+    assert channel.queue.bind.call_count == 2
+    channel.basic.consume.assert_called_once()
@@ -0,0 +1,47 @@
+from unittest.mock import Mock, call
+
+from friendly_computing_machine.rabbitmq.ack import DeliveryAckTracker
+
+
+def _tracker(batch_size: int = 1):
+    channel = Mock()
+    tracker = DeliveryAckTracker(channel, batch_size=batch_size)
+    for tag in (1, 2, 3):
+        tracker.received(tag)
+    return channel, tracker
+
+
+def test_acks_wait_for_earlier_deliveries():
+    channel, tracker = _tracker()
+
+    tracker.ack(3)
+    tracker.ack(2)
+    channel.basic.ack.assert_not_called()
+
+    tracker.ack(1)
+    channel.basic.ack.assert_called_once_with(delivery_tag=3, multiple=True)
+    assert tracker.in_flight == 0
+
+
+def test_reject_goes_out_immediately_and_unblocks_acks():
+    channel, tracker = _tracker()
+
+    tracker.ack(2)
+    tracker.reject(1)
+
+    assert channel.method_calls == [
+        call.basic.reject(delivery_tag=1, requeue=False),
+        call.basic.ack(delivery_tag=2, multiple=False),
+    ]
+
+
+def test_acks_are_batched_until_idle():
+    channel, tracker = _tracker(batch_size=2)
+
+    tracker.ack(1)
+    channel.basic.ack.assert_not_called()
+    tracker.ack(2)
+    channel.basic.ack.assert_called_once_with(delivery_tag=2, multiple=True)
+
+    tracker.ack(3)
+    assert channel.basic.ack.call_args == call(delivery_tag=3, multiple=False)
@@ -0,0 +1,61 @@
+from unittest.mock import Mock
+
+import amqpstorm
+
+from friendly_computing_machine.rabbitmq.connection import RabbitMQConnectionManager
+
+
+def _connection(channel) -> Mock:
+    connection = Mock(is_closed=False)
+    connection.channel.return_value = channel
+    return connection
+
+
+def test_consume_reconnects_and_runs_setup_again():
+    manager = None
+    broken_channel = Mock()
+    broken_channel.start_consuming.side_effect = amqpstorm.AMQPConnectionError(
+        "connection reset"
+    )
+    healthy_channel = Mock()
+    healthy_channel.start_consuming.side_effect = lambda: manager.stop()
+    connections = iter(
+        [
+            _connection(broken_channel),
+            amqpstorm.AMQPConnectionError("connection refused"),
+            _connection(healthy_channel),
+        ]
+    )
+
+    def connection_factory():
+        connection = next(connections)
+        if isinstance(connection, Exception):
+            raise connection
+        return connection
+
+    manager = RabbitMQConnectionManager(
+        connection_factory, initial_backoff_seconds=0.001
+    )
+    setup = Mock()
+    manager.consume(setup)
+
+    assert [c.args[0] for c in setup.call_args_list] == [
+        broken_channel,
+        healthy_channel,
+    ]
+
+
+def test_channel_pool_reuses_open_channels():
+    first, second = Mock(is_open=True), Mock(is_open=True)
+    connection = Mock(is_closed=False)
+    connection.channel.side_effect = [first, second]
+    manager = RabbitMQConnectionManager(lambda: connection)
+
+    with manager.channel() as channel:
+        assert channel is first
+    with manager.channel() as channel:
+        assert channel is first
+
+    first.is_open = False
+    with manager.channel() as channel:
+        assert channel is second